@@ -0,0 +1,174 @@
+"""
+에셋 번들러: 슬라이드/인포그래픽을 외부 요청 없는 단일 HTML 파일로 만들기 위한 도구
+- vendor/ 에 보관한 reveal.js CSS/JS를 최소화하여 인라인
+- Noto Sans KR 폰트를 그날 페이지에 실제로 쓰인 글자만 남기도록 서브셋 후 data URI로 인라인
+- vendor/ 가 비어 있으면 None을 반환하여 기존 CDN 링크 방식으로 폴백
+
+vendor/ 준비 (최초 1회, 네트워크 필요):
+    python cli.py vendor-assets
+"""
+import base64
+import io
+import logging
+import re
+from functools import lru_cache
+
+from config import VENDOR_DIR
+
+logger = logging.getLogger(__name__)
+
+REVEAL_VERSION = "5.1.0"
+REVEAL_CDN = f"https://cdn.jsdelivr.net/npm/reveal.js@{REVEAL_VERSION}/dist"
+
+# vendor/ 내 상대 경로 → 원본 URL
+VENDOR_FILES = {
+    "reveal/reveal.css": f"{REVEAL_CDN}/reveal.css",
+    "reveal/night.css": f"{REVEAL_CDN}/theme/night.css",
+    "reveal/reveal.js": f"{REVEAL_CDN}/reveal.js",
+    "fonts/NotoSansKR-VF.ttf": "https://github.com/google/fonts/raw/main/ofl/notosanskr/NotoSansKR%5Bwght%5D.ttf",
+}
+
+FONT_FAMILY = "Noto Sans KR"
+FONT_FILE = "fonts/NotoSansKR-VF.ttf"
+
+try:
+    from fontTools import subset as _ft_subset
+    from fontTools.ttLib import TTFont
+    HAS_FONTTOOLS = True
+except ImportError:
+    HAS_FONTTOOLS = False
+
+
+# ─────────────────────────────────────────────
+# vendor/ 관리
+# ─────────────────────────────────────────────
+def vendor_assets(force: bool = False) -> list:
+    """VENDOR_FILES를 내려받아 vendor/ 에 저장합니다. 저장한 경로 목록을 반환."""
+    import urllib.request
+
+    saved = []
+    for rel_path, url in VENDOR_FILES.items():
+        path = VENDOR_DIR / rel_path
+        if path.exists() and not force:
+            continue
+        path.parent.mkdir(parents=True, exist_ok=True)
+        logger.info(f"⬇️ 다운로드: {url}")
+        with urllib.request.urlopen(url, timeout=60) as resp:
+            path.write_bytes(resp.read())
+        saved.append(path)
+    return saved
+
+
+def has_vendor_assets() -> bool:
+    return all((VENDOR_DIR / rel_path).exists() for rel_path in VENDOR_FILES)
+
+
+def _read_vendor(rel_path: str) -> str:
+    return (VENDOR_DIR / rel_path).read_text(encoding="utf-8")
+
+
+# ─────────────────────────────────────────────
+# 최소화
+# ─────────────────────────────────────────────
+_CSS_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_CSS_IMPORT = re.compile(r"@import\s+url\([^)]*\)\s*;?|@import\s+['\"][^'\"]*['\"]\s*;?")
+_CSS_SPACE = re.compile(r"\s+")
+_CSS_PUNCT = re.compile(r"\s*([{};,>])\s*")  # ":"는 선택자(.a :hover) 의미가 바뀔 수 있어 제외
+
+
+def minify_css(css: str, strip_imports: bool = False) -> str:
+    """주석/공백을 제거합니다. strip_imports=True면 외부 @import(구글 폰트 등)도 제거."""
+    css = _CSS_COMMENT.sub("", css)
+    if strip_imports:
+        css = _CSS_IMPORT.sub("", css)
+    css = _CSS_SPACE.sub(" ", css)
+    css = _CSS_PUNCT.sub(r"\1", css)
+    return css.replace(";}", "}").strip()
+
+
+@lru_cache(maxsize=None)
+def _vendor_css(rel_path: str) -> str:
+    return minify_css(_read_vendor(rel_path), strip_imports=True)
+
+
+@lru_cache(maxsize=None)
+def _vendor_js(rel_path: str) -> str:
+    # reveal.js dist 빌드는 이미 최소화되어 있으므로 그대로 사용 (</script> 조기 종료만 방지)
+    return _read_vendor(rel_path).replace("</script", "<\\/script")
+
+
+# ─────────────────────────────────────────────
+# 폰트 서브셋
+# ─────────────────────────────────────────────
+def _glyph_text(text: str) -> str:
+    """서브셋에 포함할 문자: 페이지 텍스트 + 기본 ASCII."""
+    ascii_chars = "".join(chr(c) for c in range(0x20, 0x7F))
+    return "".join(sorted(set(text) | set(ascii_chars)))
+
+
+def subset_font(text: str) -> tuple:
+    """페이지에 쓰인 글자만 남긴 폰트를 (bytes, format) 으로 반환합니다."""
+    options = _ft_subset.Options()
+    options.layout_features = ["*"]
+    options.name_IDs = ["*"]
+    options.notdef_outline = True
+    try:
+        import brotli  # noqa: F401  woff2 압축에 필요
+        options.flavor = "woff2"
+        font_format = "woff2"
+    except ImportError:
+        options.flavor = "woff"
+        font_format = "woff"
+
+    font = TTFont(str(VENDOR_DIR / FONT_FILE))
+    subsetter = _ft_subset.Subsetter(options=options)
+    subsetter.populate(text=_glyph_text(text))
+    subsetter.subset(font)
+
+    buffer = io.BytesIO()
+    font.save(buffer)
+    return buffer.getvalue(), font_format
+
+
+def font_face_css(text: str) -> str:
+    """서브셋 폰트를 data URI로 담은 @font-face CSS."""
+    data, font_format = subset_font(text)
+    encoded = base64.b64encode(data).decode("ascii")
+    return (
+        f"@font-face{{font-family:'{FONT_FAMILY}';font-style:normal;font-weight:100 900;"
+        f"font-display:swap;src:url(data:font/{font_format};base64,{encoded}) format('{font_format}')}}"
+    )
+
+
+# ─────────────────────────────────────────────
+# 번들 생성
+# ─────────────────────────────────────────────
+_TAG = re.compile(r"<[^>]+>")
+_STYLE_SCRIPT = re.compile(r"<(style|script)\b.*?</\1>", re.S | re.I)
+
+
+def visible_text(html: str) -> str:
+    """HTML에서 화면에 표시될 수 있는 텍스트만 추출합니다 (서브셋 대상 글자 수집용)."""
+    import html as html_lib
+
+    text = _STYLE_SCRIPT.sub(" ", html)
+    return html_lib.unescape(_TAG.sub(" ", text))
+
+
+def build_bundle(page_html: str, reveal: bool = False):
+    """페이지 HTML(외부 에셋 버전)을 기반으로 인라인 에셋 묶음을 만듭니다.
+
+    vendor/ 또는 fontTools가 없으면 None (CDN 링크 폴백).
+    """
+    if not HAS_FONTTOOLS:
+        logger.warning("⚠️ fonttools 패키지가 없어 에셋 번들링을 건너뜁니다.")
+        return None
+    if not has_vendor_assets():
+        logger.warning(f"⚠️ vendor 에셋이 없어 번들링을 건너뜁니다 ({VENDOR_DIR}). `python cli.py vendor-assets` 실행 필요")
+        return None
+
+    bundle = {"font_css": font_face_css(visible_text(page_html))}
+    if reveal:
+        bundle["css"] = _vendor_css("reveal/reveal.css") + _vendor_css("reveal/night.css")
+        bundle["js"] = _vendor_js("reveal/reveal.js")
+    return bundle
@@ -0,0 +1,150 @@
+"""
+과거 출력 일괄 재렌더링: output/*/slides_data.json, infographic_data.json → HTML
+- 디자인(템플릿) 변경 시 전체 아카이브에 적용
+- 날짜별 데이터 해시 + 템플릿 버전이 그대로면 건너뜀 (.render_manifest.json)
+- 변경된 날짜만 프로세스 풀에서 병렬 렌더링
+"""
+import hashlib
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from config import OUTPUT_DIR
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = ".render_manifest.json"
+
+# 렌더 대상 → (데이터 파일, HTML 파일)
+RENDER_TARGETS = {
+    "slides": ("slides_data.json", "slides.html"),
+    "infographic": ("infographic_data.json", "infographic.html"),
+}
+
+
+def _hash_bytes(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()[:16]
+
+
+def _load_manifest(day_dir: Path) -> dict:
+    path = day_dir / MANIFEST_NAME
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def plan_day(day_dir: Path, version: str, force: bool = False) -> dict:
+    """날짜 디렉토리에서 다시 렌더링해야 할 대상과 데이터 해시를 계산합니다."""
+    manifest = _load_manifest(day_dir)
+    pending = {}
+    for target, (data_name, html_name) in RENDER_TARGETS.items():
+        data_path = day_dir / data_name
+        if not data_path.exists():
+            continue
+        content_hash = _hash_bytes(data_path.read_bytes())
+        entry = manifest.get(target, {})
+        unchanged = (
+            entry.get("data_hash") == content_hash
+            and entry.get("template_version") == version
+            and (day_dir / html_name).exists()
+        )
+        if force or not unchanged:
+            pending[target] = content_hash
+    return pending
+
+
+def render_day(day_dir: str, pending: dict, version: str) -> dict:
+    """한 날짜의 대상 HTML을 렌더링하고 매니페스트를 갱신합니다 (워커 프로세스에서 실행)."""
+    from slide_generator import render_slides_html
+    from infographic_generator import render_infographic_html
+    from postprocess import postprocess_day
+
+    renderers = {"slides": render_slides_html, "infographic": render_infographic_html}
+    day_dir = Path(day_dir)
+    manifest = _load_manifest(day_dir)
+    rendered = []
+
+    for target, content_hash in pending.items():
+        data_name, html_name = RENDER_TARGETS[target]
+        try:
+            data = json.loads((day_dir / data_name).read_text(encoding="utf-8"))
+            html = renderers[target](data)
+        except Exception as e:
+            return {"day": day_dir.name, "rendered": rendered, "error": f"{target}: {e}"}
+        (day_dir / html_name).write_text(html, encoding="utf-8")
+        manifest[target] = {"data_hash": content_hash, "template_version": version}
+        rendered.append(target)
+
+    (day_dir / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    # 크기 기록(size_history.jsonl)은 여러 워커가 동시에 쓰지 않도록 render_archive에서 일괄 처리
+    postprocess_day(day_dir, history=False)
+    return {"day": day_dir.name, "rendered": rendered}
+
+
+def iter_day_dirs(output_root: Path = OUTPUT_DIR):
+    """데이터 파일이 있는 날짜 디렉토리를 날짜순으로 반환합니다."""
+    if not output_root.exists():
+        return []
+    return sorted(
+        d for d in output_root.iterdir()
+        if d.is_dir() and any((d / data_name).exists() for data_name, _ in RENDER_TARGETS.values())
+    )
+
+
+def render_archive(output_root: Path = OUTPUT_DIR, workers: int = None, force: bool = False) -> dict:
+    """모든 날짜를 확인하여 변경된 날짜만 병렬로 다시 렌더링합니다."""
+    from config import BUNDLE_ASSETS
+    from renderer import template_version
+
+    # 번들링 여부도 결과물을 바꾸므로 버전에 포함
+    version = template_version() + ("+bundle" if BUNDLE_ASSETS else "")
+    jobs = []
+    skipped = 0
+    for day_dir in iter_day_dirs(output_root):
+        pending = plan_day(day_dir, version, force=force)
+        if pending:
+            jobs.append((str(day_dir), pending, version))
+        else:
+            skipped += 1
+
+    logger.info(f"🗂️ 재렌더링 대상: {len(jobs)}일 / 건너뜀: {skipped}일 (템플릿 {version})")
+
+    results = []
+    workers = workers or os.cpu_count() or 1
+    if len(jobs) <= 1 or workers == 1:
+        # 작업이 적으면 프로세스 생성 비용이 더 큼
+        results = [render_day(*job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+            futures = [pool.submit(render_day, *job) for job in jobs]
+            results = [f.result() for f in futures]
+
+    from postprocess import record_history
+    for r in results:
+        if r["rendered"]:
+            record_history(output_root, output_root / r["day"])
+
+    errors = [r for r in results if "error" in r]
+    for r in errors:
+        logger.error(f"  ❌ {r['day']} 렌더링 실패: {r['error']}")
+
+    summary = {
+        "template_version": version,
+        "rendered_days": len(results) - len(errors),
+        "skipped_days": skipped,
+        "errors": errors,
+    }
+    logger.info(f"✅ 일괄 렌더링 완료: {summary['rendered_days']}일 렌더링, {skipped}일 건너뜀")
+    return summary
+
+
+if __name__ == "__main__":
+    from log_config import setup_logging
+
+    setup_logging()
+    render_archive()
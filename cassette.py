@@ -0,0 +1,212 @@
+"""
+카세트(기록/재생) 모드: 외부 호출 응답을 기록하고 로컬에서 재생
+- record: scrapetube 페이지, 자막, Gemini 응답, 텔레그램 응답을 gzip 카세트에 기록
+- replay: 네트워크 없이 기록된 응답을 원래 소요 시간대로 재생
+- 프로파일링/회귀 테스트를 결정적으로 재현하기 위한 용도
+
+환경변수:
+    CASSETTE_MODE=record|replay   (미설정 시 비활성)
+    CASSETTE_PATH=output/2025-01-01/cassette.jsonl.gz
+    CASSETTE_REPLAY_SPEED=1.0     (0이면 지연 없이 즉시 재생)
+"""
+import gzip
+import hashlib
+import json
+import logging
+import re
+import threading
+import time
+from collections import defaultdict, deque
+from pathlib import Path
+
+from config import CASSETTE_MODE, CASSETTE_PATH, CASSETTE_REPLAY_SPEED, get_today_output_dir
+
+logger = logging.getLogger(__name__)
+
+CASSETTE_FILENAME = "cassette.jsonl.gz"
+
+# 실행 시각이 찍히는 보고서 머리글 줄 (종합 보고서 생성일, 채널 요약 수집 시각)
+_VOLATILE_LINES = re.compile(r"^\*\*(생성일|수집 시각)\*\*:.*$", re.MULTILINE)
+
+
+class CassetteMiss(LookupError):
+    """재생 모드에서 기록되지 않은 호출이 발생한 경우"""
+
+
+class ReplayedError(Exception):
+    """기록 당시 발생했던 예외를 재생할 때 사용하는 예외"""
+
+    def __init__(self, error_type: str, message: str):
+        super().__init__(message)
+        self.error_type = error_type
+
+
+class _ReplayedResponse:
+    """model.generate_content() 응답 대체 객체 (.text만 제공)"""
+
+    def __init__(self, text: str):
+        self.text = text
+
+
+def make_key(*parts) -> str:
+    """호출 인자로부터 안정적인 카세트 키를 생성합니다."""
+    raw = json.dumps(parts, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]
+
+
+class Cassette:
+    """외부 호출 응답을 gzip JSON Lines 파일로 기록/재생합니다."""
+
+    def __init__(self, path: Path, mode: str, replay_speed: float = 1.0):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"지원하지 않는 카세트 모드: {mode}")
+        self.path = Path(path)
+        self.mode = mode
+        self.replay_speed = replay_speed
+        self._lock = threading.Lock()
+        self._entries = defaultdict(deque)
+
+        if mode == "replay":
+            self._load()
+        else:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            logger.info(f"📼 카세트 기록 모드: {self.path}")
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == "record"
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    def _load(self):
+        if not self.path.exists():
+            raise FileNotFoundError(f"카세트 파일이 없습니다: {self.path}")
+        count = 0
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                self._entries[(entry["kind"], entry["key"])].append(entry)
+                count += 1
+        logger.info(f"📼 카세트 재생 모드: {self.path} ({count}개 응답)")
+
+    def _append(self, entry: dict):
+        # 호출마다 gzip 멤버를 추가하므로 중간에 중단되어도 기록이 보존됨
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        with self._lock:
+            with gzip.open(self.path, "at", encoding="utf-8") as f:
+                f.write(line)
+
+    def call(self, kind: str, key: str, fn):
+        """fn()의 결과를 기록하거나, 재생 모드에서는 기록된 결과를 반환합니다.
+
+        fn은 JSON 직렬화 가능한 값을 반환해야 합니다.
+        """
+        if self.replaying:
+            return self._replay(kind, key)
+
+        start = time.perf_counter()
+        try:
+            result = fn()
+        except Exception as e:
+            self._append({
+                "kind": kind,
+                "key": key,
+                "elapsed": round(time.perf_counter() - start, 4),
+                "error": {"type": type(e).__name__, "message": str(e)},
+            })
+            raise
+        self._append({
+            "kind": kind,
+            "key": key,
+            "elapsed": round(time.perf_counter() - start, 4),
+            "result": result,
+        })
+        return result
+
+    def _replay(self, kind: str, key: str):
+        with self._lock:
+            queue = self._entries.get((kind, key))
+            if not queue:
+                raise CassetteMiss(f"카세트에 기록되지 않은 호출: {kind} ({key})")
+            # 같은 키가 여러 번 기록되었다면 기록 순서대로 재생, 마지막 응답은 재사용
+            entry = queue.popleft() if len(queue) > 1 else queue[0]
+
+        if self.replay_speed > 0:
+            time.sleep(entry.get("elapsed", 0) / self.replay_speed)
+
+        if "error" in entry:
+            raise ReplayedError(entry["error"]["type"], entry["error"]["message"])
+        return entry["result"]
+
+    def wrap_model(self, model):
+        """Gemini 모델 객체를 감싸 generate_content() 응답을 기록/재생합니다."""
+        return _CassetteModel(self, model)
+
+
+def prompt_key(prompt) -> str:
+    """프롬프트 → 카세트 키. 실행 시각 줄은 지우고 해시해 다른 시각에 재생해도 같은 키가 되도록 합니다."""
+    if isinstance(prompt, str):
+        prompt = _VOLATILE_LINES.sub("", prompt)
+    return make_key(prompt)
+
+
+class _CassetteModel:
+    """generate_content()만 카세트를 거치도록 하는 모델 프록시"""
+
+    def __init__(self, cassette: Cassette, model):
+        self._cassette = cassette
+        self._model = model
+
+    def generate_content(self, prompt, *args, **kwargs):
+        text = self._cassette.call(
+            "gemini.generate_content",
+            prompt_key(prompt),
+            lambda: self._model.generate_content(prompt, *args, **kwargs).text,
+        )
+        return _ReplayedResponse(text)
+
+    def __getattr__(self, name):
+        return getattr(self._model, name)
+
+
+# ─────────────────────────────────────────────
+# 전역 카세트 (환경변수 기반)
+# ─────────────────────────────────────────────
+_active = None
+_configured = False
+
+
+def get_cassette():
+    """설정된 카세트를 반환합니다. 비활성 상태면 None."""
+    global _active, _configured
+    if not _configured:
+        _configured = True
+        if CASSETTE_MODE:
+            path = Path(CASSETTE_PATH) if CASSETTE_PATH else get_today_output_dir() / CASSETTE_FILENAME
+            _active = Cassette(path, CASSETTE_MODE, CASSETTE_REPLAY_SPEED)
+    return _active
+
+
+def use_cassette(path, mode: str, replay_speed: float = 1.0):
+    """코드에서 직접 카세트를 활성화합니다 (mode=None이면 비활성화)."""
+    global _active, _configured
+    _configured = True
+    _active = Cassette(path, mode, replay_speed) if mode else None
+    return _active
+
+
+def is_replaying() -> bool:
+    cassette = get_cassette()
+    return cassette is not None and cassette.replaying
+
+
+def record_call(kind: str, key: str, fn):
+    """카세트가 활성화되어 있으면 기록/재생하고, 아니면 fn()을 그대로 호출합니다."""
+    cassette = get_cassette()
+    if cassette is None:
+        return fn()
+    return cassette.call(kind, key, fn)
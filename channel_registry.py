@@ -0,0 +1,138 @@
+"""
+채널 레지스트리: channels.csv 로드 + 샤딩 + 샤드 결과 병합
+- channels.csv: `handle,name[,channel_id]` 헤더, 한 줄에 채널 하나 (#으로 시작하는 줄은 주석)
+  channel_id(UC...)가 있으면 Atom 피드로 빠르게 탐색 (video_discovery 참고)
+- --shard i/n: 핸들 해시 기준으로 채널을 n개 그룹으로 나눠 i번째(1부터)만 처리
+  (채널 추가/삭제 시 다른 채널의 샤드 배정이 바뀌지 않음)
+- 샤드별 결과는 research_results.shard-i-of-n.json 으로 저장 후 merge_shards()로 병합
+"""
+import hashlib
+import json
+import logging
+from pathlib import Path
+
+from config import CHANNELS_FILE
+
+logger = logging.getLogger(__name__)
+
+SHARD_PATTERN = "research_results.shard-*-of-*.json"
+
+
+class RegistryError(ValueError):
+    """채널 레지스트리/샤드 지정 오류"""
+
+
+# ─────────────────────────────────────────────
+# 레지스트리 로드
+# ─────────────────────────────────────────────
+def _normalize_handle(handle: str) -> str:
+    handle = handle.strip()
+    return handle if handle.startswith("@") else f"@{handle}"
+
+
+def make_channel(handle: str, name: str = "", channel_id: str = "") -> dict:
+    handle = _normalize_handle(handle)
+    channel = {"handle": handle, "name": name.strip() or handle, "url": f"https://www.youtube.com/{handle}"}
+    if channel_id and channel_id.strip():
+        channel["channel_id"] = channel_id.strip()
+    return channel
+
+
+def load_channels(path: Path = None) -> list:
+    """channels.csv를 읽어 채널 dict 목록을 반환합니다 (파일 순서 유지, 중복 핸들 제외)."""
+    import csv
+
+    path = Path(path or CHANNELS_FILE)
+    if not path.exists():
+        raise RegistryError(f"채널 레지스트리 파일이 없습니다: {path}")
+
+    lines = [line for line in path.read_text(encoding="utf-8-sig").splitlines() if line.strip() and not line.lstrip().startswith("#")]
+    channels, seen = [], set()
+    for row in csv.DictReader(lines):
+        handle = (row.get("handle") or "").strip()
+        if not handle:
+            continue
+        channel = make_channel(handle, row.get("name") or "", row.get("channel_id") or "")
+        key = channel["handle"].lower()
+        if key in seen:
+            logger.warning(f"⚠️ 중복 채널 무시: {channel['handle']}")
+            continue
+        seen.add(key)
+        channels.append(channel)
+    return channels
+
+
+# ─────────────────────────────────────────────
+# 샤딩
+# ─────────────────────────────────────────────
+def parse_shard(spec: str) -> tuple:
+    """'2/8' → (2, 8). 인덱스는 1부터 시작."""
+    try:
+        index, count = (int(part) for part in spec.split("/"))
+    except ValueError:
+        raise RegistryError(f"샤드 형식은 i/n 이어야 합니다: {spec!r}")
+    if count < 1 or not 1 <= index <= count:
+        raise RegistryError(f"샤드 범위 오류: {spec!r} (1 <= i <= n)")
+    return index, count
+
+
+def shard_of(handle: str, count: int) -> int:
+    """핸들이 속하는 샤드 번호 (1..count). 프로세스/머신과 무관하게 항상 같은 값."""
+    digest = hashlib.sha1(_normalize_handle(handle).lower().encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % count + 1
+
+
+def shard_channels(channels: list, index: int, count: int) -> list:
+    return [ch for ch in channels if shard_of(ch["handle"], count) == index]
+
+
+def shard_filename(index: int, count: int) -> str:
+    return f"research_results.shard-{index}-of-{count}.json"
+
+
+# ─────────────────────────────────────────────
+# 병합
+# ─────────────────────────────────────────────
+def merge_shards(output_dir: Path, channels: list = None, cleanup: bool = False) -> dict:
+    """output_dir의 샤드 결과를 research_results.json 하나로 병합합니다.
+
+    채널 순서는 레지스트리 순서를 따르고, 빠진 샤드가 있으면 경고합니다.
+    """
+    output_dir = Path(output_dir)
+    paths = sorted(output_dir.glob(SHARD_PATTERN))
+    if not paths:
+        raise RegistryError(f"병합할 샤드 결과가 없습니다: {output_dir}")
+
+    shards = [json.loads(p.read_text(encoding="utf-8")) for p in paths]
+    counts = {s.get("shard", {}).get("count") for s in shards}
+    if len(counts) != 1:
+        raise RegistryError(f"샤드 개수가 서로 다른 결과가 섞여 있습니다: {sorted(counts, key=str)}")
+    count = counts.pop()
+    present = {s["shard"]["index"] for s in shards}
+    missing = sorted(set(range(1, count + 1)) - present)
+    if missing:
+        logger.warning(f"⚠️ 누락된 샤드: {missing} / {count}")
+
+    order = {ch["handle"].lower(): i for i, ch in enumerate(channels if channels is not None else load_channels())}
+    merged_channels = [ch for s in shards for ch in s.get("channels", [])]
+    merged_channels.sort(key=lambda ch: order.get(ch["handle"].lower(), len(order)))
+
+    merged = {
+        "date": max(s.get("date", "") for s in shards),
+        "channels": merged_channels,
+        "total_videos": sum(s.get("total_videos", 0) for s in shards),
+        "total_transcripts": sum(s.get("total_transcripts", 0) for s in shards),
+        "scanned": [handle for s in shards for handle in s.get("scanned", [])],
+    }
+    failed = [handle for s in shards for handle in s.get("failed_channels", [])]
+    if failed:
+        merged["failed_channels"] = failed
+    if missing:
+        merged["missing_shards"] = missing
+
+    (output_dir / "research_results.json").write_text(json.dumps(merged, ensure_ascii=False, indent=2), encoding="utf-8")
+    if cleanup:
+        for p in paths:
+            p.unlink()
+    logger.info(f"🧩 샤드 병합: {len(shards)}/{count}개 샤드, {len(merged_channels)}개 채널, {merged['total_videos']}개 영상")
+    return merged
@@ -0,0 +1,153 @@
+"""
+채널 핸들 → 채널 ID 해석 캐시
+- @handle 페이지를 한 번 받아 채널 ID(UC...)와 정식 URL(/channel/UC...)을 찾아 .cache/channel_ids.json에 저장
+- 이후 실행에서는 페이지 요청 없이 캐시를 사용 (피드 탐색에는 채널 ID가 필요하고,
+  scrapetube도 정식 URL로 바로 조회)
+- 캐시 항목은 약 CHANNEL_ID_REVALIDATE_DAYS일마다 다시 확인 (채널마다 시점을 분산)
+  확인에 실패하면 기존 값을 계속 사용하고, 피드가 404를 주면 즉시 무효화
+- channels.csv에 channel_id가 있으면 그 값을 우선 사용
+
+여러 프로세스(샤드/워커)가 같은 파일을 쓰므로 저장할 때마다 다시 읽어 병합한 뒤 교체합니다.
+"""
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from cassette import record_call
+from config import CHANNEL_ID_CACHE_PATH, CHANNEL_ID_REVALIDATE_DAYS
+
+logger = logging.getLogger(__name__)
+
+YOUTUBE_BASE = os.environ.get("YOUTUBE_RESOLVE_BASE", "https://www.youtube.com")
+
+_CHANNEL_ID = r"UC[\w-]{22}"
+_ID_PATTERNS = [
+    re.compile(rf'<link rel="canonical" href="[^"]*/channel/({_CHANNEL_ID})"'),
+    re.compile(rf'<meta itemprop="(?:identifier|channelId)" content="({_CHANNEL_ID})"'),
+    re.compile(rf'"externalId":"({_CHANNEL_ID})"'),
+    re.compile(rf'"browseId":"({_CHANNEL_ID})"'),
+]
+
+_lock = threading.Lock()
+
+
+class ResolveError(ValueError):
+    """핸들 페이지에서 채널 ID를 찾지 못함"""
+
+
+def _key(handle: str) -> str:
+    return handle.lower()
+
+
+def channel_url(channel_id: str) -> str:
+    return f"https://www.youtube.com/channel/{channel_id}"
+
+
+def _revalidate_after(handle: str) -> timedelta:
+    """채널마다 0.75~1.25배로 분산된 재확인 주기 (한 번에 모든 채널을 다시 확인하지 않도록)."""
+    frac = int.from_bytes(hashlib.sha1(_key(handle).encode("utf-8")).digest()[:2], "big") / 0xFFFF
+    return timedelta(days=CHANNEL_ID_REVALIDATE_DAYS * (0.75 + 0.5 * frac))
+
+
+# ─────────────────────────────────────────────
+# 캐시 파일
+# ─────────────────────────────────────────────
+def load_cache(path: Path = CHANNEL_ID_CACHE_PATH) -> dict:
+    path = Path(path)
+    try:
+        return json.loads(path.read_text(encoding="utf-8")) if path.exists() else {}
+    except (OSError, ValueError):
+        logger.warning(f"⚠️ 채널 ID 캐시를 읽을 수 없어 새로 시작합니다: {path}")
+        return {}
+
+
+def _update_cache(handle: str, entry, path: Path = CHANNEL_ID_CACHE_PATH):
+    """최신 파일을 다시 읽어 한 항목만 바꾼 뒤 원자적으로 교체합니다 (entry=None이면 삭제)."""
+    path = Path(path)
+    with _lock:
+        cache = load_cache(path)
+        if entry is None:
+            cache.pop(_key(handle), None)
+        else:
+            cache[_key(handle)] = entry
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_text(json.dumps(cache, ensure_ascii=False, indent=2, sort_keys=True), encoding="utf-8")
+        os.replace(tmp, path)
+
+
+# ─────────────────────────────────────────────
+# 해석
+# ─────────────────────────────────────────────
+def _fetch_handle_page(handle: str) -> str:
+    import urllib.request
+
+    request = urllib.request.Request(
+        f"{YOUTUBE_BASE.rstrip('/')}/{handle}",
+        headers={
+            "User-Agent": "Mozilla/5.0",
+            "Accept-Language": "en-US,en;q=0.9",
+            "Cookie": "CONSENT=YES+cb",  # 유럽 리전의 동의 페이지 우회 (scrapetube와 동일)
+        },
+    )
+    with urllib.request.urlopen(request, timeout=15) as resp:
+        return resp.read().decode("utf-8", errors="replace")
+
+
+def parse_channel_id(html: str) -> str:
+    for pattern in _ID_PATTERNS:
+        match = pattern.search(html)
+        if match:
+            return match.group(1)
+    raise ResolveError("채널 ID를 찾을 수 없습니다")
+
+
+def resolve_handle(handle: str, refresh: bool = False, path: Path = CHANNEL_ID_CACHE_PATH) -> dict:
+    """핸들의 {"channel_id", "url"}을 반환합니다 (캐시 우선, 재확인 주기가 지났거나 refresh면 다시 확인)."""
+    entry = load_cache(path).get(_key(handle))
+    now = datetime.now()
+    if entry and not refresh and now - datetime.fromisoformat(entry["checked_at"]) < _revalidate_after(handle):
+        return {"channel_id": entry["channel_id"], "url": entry["url"]}
+
+    try:
+        html = record_call("youtube.resolve_handle", handle, lambda: _fetch_handle_page(handle))
+        channel_id = parse_channel_id(html)
+    except Exception as e:
+        if entry:
+            logger.warning(f"  ⚠️ 채널 ID 재확인 실패, 기존 값 사용 ({handle}): {e}")
+            return {"channel_id": entry["channel_id"], "url": entry["url"]}
+        raise
+
+    stamp = now.isoformat(timespec="seconds")
+    if entry and entry["channel_id"] != channel_id:
+        logger.warning(f"  🔀 채널 ID 변경: {handle} {entry['channel_id']} → {channel_id}")
+    resolved_at = entry["resolved_at"] if entry and entry["channel_id"] == channel_id else stamp
+    _update_cache(handle, {
+        "handle": handle,
+        "channel_id": channel_id,
+        "url": channel_url(channel_id),
+        "resolved_at": resolved_at,
+        "checked_at": stamp,
+    }, path)
+    logger.info(f"  🪪 채널 ID 확인: {handle} → {channel_id}")
+    return {"channel_id": channel_id, "url": channel_url(channel_id)}
+
+
+def invalidate(handle: str, path: Path = CHANNEL_ID_CACHE_PATH):
+    """캐시된 채널 ID가 더 이상 유효하지 않을 때 (다음 조회에서 다시 해석)."""
+    if _key(handle) in load_cache(path):
+        _update_cache(handle, None, path)
+        logger.info(f"  🗑️ 채널 ID 캐시 무효화: {handle}")
+
+
+def resolve_channel(channel: dict) -> dict:
+    """채널 dict에 channel_id/url을 채워 반환합니다. 레지스트리 값이 있으면 그대로 사용."""
+    if channel.get("channel_id"):
+        return {**channel, "url": channel_url(channel["channel_id"]), "id_source": "registry"}
+    resolved = resolve_handle(channel["handle"])
+    return {**channel, **resolved, "id_source": "cache"}
@@ -0,0 +1,174 @@
+"""
+채널별 적응형 스캔 일정: 게시 이력 통계로 채널마다 스캔 여부/깊이/순서 결정
+- output/channel_stats.json: 채널별 최근 게시 시각, 마지막 새 영상, 스캔 기록
+- 게시 주기(λ, 하루당 게시 수)로 "마지막 스캔 이후 새 영상이 있을 확률"을 계산해
+  확률이 높은 채널부터 스캔하고, 낮은 채널은 건너뜀 (최대 MAX_SKIP_DAYS일까지만)
+- 건너뛴 채널은 다음 스캔 때 마지막 스캔 이후 전체 기간을 조회하므로 영상이 누락되지 않음
+- 새 채널(통계 없음)은 항상 스캔
+"""
+import json
+import logging
+import math
+from datetime import datetime
+from pathlib import Path
+
+from config import CHANNEL_STATS_PATH
+
+logger = logging.getLogger(__name__)
+
+MIN_PROBABILITY = 0.25     # 이 확률 미만이면 이번 실행에서 건너뜀
+MAX_SKIP_DAYS = 7          # 확률과 관계없이 이 기간이 지나면 스캔
+PRIOR_DAYS = 7.0           # 게시 이력이 적은 채널의 주기 추정 보정 (주 1회 게시로 가정)
+MAX_PUBLISH_HISTORY = 30   # 채널별로 보관하는 최근 게시 기록 수
+MIN_DEPTH = 2              # 스캔 시 최소로 가져올 영상 수
+
+
+# ─────────────────────────────────────────────
+# 통계 저장소
+# ─────────────────────────────────────────────
+def load_stats(path: Path = CHANNEL_STATS_PATH) -> dict:
+    path = Path(path)
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        logger.warning(f"⚠️ 채널 통계 파일을 읽을 수 없어 새로 시작합니다: {path}")
+        return {}
+
+
+def save_stats(stats: dict, path: Path = CHANNEL_STATS_PATH):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(stats, ensure_ascii=False, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def _parse(value: str):
+    return datetime.fromisoformat(value) if value else None
+
+
+def _days(delta) -> float:
+    return delta.total_seconds() / 86400
+
+
+def posting_rate(entry: dict, now: datetime) -> float:
+    """하루당 게시 수 추정. 관측 기간이 짧거나 게시가 적으면 PRIOR_DAYS 쪽으로 보정."""
+    published = [_parse(t) for t in entry.get("published", [])]
+    if len(published) >= MAX_PUBLISH_HISTORY:
+        # 오래된 기록이 잘려 나갔으므로 남아 있는 가장 오래된 게시부터의 기간으로 계산
+        since = published
+    else:
+        since = published + [_parse(entry.get("first_scanned_at"))]
+    since = [t for t in since if t]
+    span = _days(now - min(since)) if since else 0.0
+    return (len(published) + 1) / (span + PRIOR_DAYS)
+
+
+def typical_hour(entry: dict):
+    """게시 시각(시)의 원형 평균. 기록이 없으면 None."""
+    hours = [_parse(t).hour + _parse(t).minute / 60 for t in entry.get("published", [])]
+    if not hours:
+        return None
+    x = sum(math.cos(h / 24 * 2 * math.pi) for h in hours)
+    y = sum(math.sin(h / 24 * 2 * math.pi) for h in hours)
+    return (math.atan2(y, x) / (2 * math.pi) * 24) % 24
+
+
+# ─────────────────────────────────────────────
+# 스캔 계획
+# ─────────────────────────────────────────────
+def plan_scan(channels: list, stats: dict, hours: int, max_results: int, now: datetime = None) -> list:
+    """스캔할 채널 목록을 새 영상 가능성이 높은 순서로 반환합니다.
+
+    반환되는 채널 dict에는 "scan": {"hours", "max_results", "probability"}가 추가됩니다.
+    """
+    now = now or datetime.now()
+    planned, skipped = [], []
+    for channel in channels:
+        entry = stats.get(channel["handle"])
+        last_scan = _parse((entry or {}).get("last_scanned_at"))
+        if not entry or not last_scan:
+            planned.append((1.0, {**channel, "scan": {"hours": hours, "max_results": max_results, "probability": 1.0}}))
+            continue
+
+        rate = posting_rate(entry, now)
+        elapsed = max(0.0, _days(now - last_scan))
+        probability = 1 - math.exp(-rate * elapsed)
+
+        # 주로 게시하는 시각이 마지막 스캔 이후 지나갔으면 가능성 상향
+        hour = typical_hour(entry)
+        if hour is not None and elapsed < 1:
+            start = last_scan.hour + last_scan.minute / 60
+            end = start + elapsed * 24
+            if start <= hour <= end or start <= hour + 24 <= end:
+                probability = min(1.0, probability * 1.5)
+
+        if probability < MIN_PROBABILITY and elapsed < MAX_SKIP_DAYS:
+            skipped.append(channel["handle"])
+            continue
+
+        # 마지막 스캔 이후 전체 기간을 조회 (건너뛴 날의 영상 누락 방지)
+        window = max(hours, math.ceil(elapsed * 24))
+        depth = min(max_results, max(MIN_DEPTH, math.ceil(rate * window / 24 * 1.5) + 1))
+        planned.append((probability, {
+            **channel,
+            "scan": {"hours": window, "max_results": depth, "probability": round(probability, 3)},
+        }))
+
+    planned.sort(key=lambda item: -item[0])
+    logger.info(f"🗓️ 스캔 일정: {len(planned)}개 채널 스캔, {len(skipped)}개 건너뜀")
+    if skipped:
+        logger.info(f"  ⏭️ 건너뜀: {', '.join(skipped)}")
+    return [channel for _, channel in planned]
+
+
+def record_scan(stats: dict, results: dict, now: datetime = None) -> dict:
+    """리서치 결과로 통계를 갱신합니다. results["scanned"]의 모든 채널이 스캔 기록 대상.
+
+    스캔에 실패한 채널(results["failed_channels"])은 실패 횟수만 따로 기록하고
+    스캔 횟수/빈 스캔/게시 빈도에는 반영하지 않습니다 (마지막 스캔 시각도 그대로라 다음 실행에서 바로 다시 확인).
+    """
+    now = now or datetime.now()
+    stamp = now.isoformat(timespec="minutes")
+    found = {ch["handle"]: ch for ch in results.get("channels", [])}
+
+    for handle in results.get("failed_channels", []):
+        entry = stats.setdefault(handle, {"published": [], "video_ids": []})
+        entry["failed_scans"] = entry.get("failed_scans", 0) + 1
+        entry["last_failed_at"] = stamp
+
+    for handle in results.get("scanned", []):
+        entry = stats.setdefault(handle, {"published": [], "video_ids": []})
+        entry.setdefault("first_scanned_at", stamp)
+        entry["last_scanned_at"] = stamp
+        entry["scans"] = entry.get("scans", 0) + 1
+
+        new_videos = [
+            v for v in found.get(handle, {}).get("videos", [])
+            if v.get("video_id") and v["video_id"] not in entry["video_ids"]
+        ]
+        for video in new_videos:
+            entry["video_ids"].append(video["video_id"])
+            entry["published"].append(video.get("published_at") or stamp)
+        entry["video_ids"] = entry["video_ids"][-MAX_PUBLISH_HISTORY:]
+        entry["published"] = sorted(entry["published"])[-MAX_PUBLISH_HISTORY:]
+
+        if new_videos:
+            entry["last_new_video_at"] = max(v.get("published_at") or stamp for v in new_videos)
+            entry["empty_scans"] = 0
+        else:
+            entry["empty_scans"] = entry.get("empty_scans", 0) + 1
+
+        rate = posting_rate(entry, now)
+        hour = typical_hour(entry)
+        entry["cadence_days"] = round(1 / rate, 2)
+        entry["typical_hour"] = round(hour, 1) if hour is not None else None
+    return stats
+
+
+def update_channel_stats(results: dict, path: Path = CHANNEL_STATS_PATH) -> dict:
+    """리서치 결과를 통계 파일에 반영합니다."""
+    stats = record_scan(load_stats(path), results)
+    save_stats(stats, path)
+    logger.info(f"🗓️ 채널 통계 갱신: {len(results.get('scanned', []))}개 채널 ({path.name})")
+    return stats
@@ -0,0 +1,112 @@
+"""
+import 시간 예산 검사: 각 모듈을 새 프로세스에서 `python -X importtime`으로 import하여
+- 누적 import 시간이 예산(ms)을 넘지 않는지
+- import만으로 로깅 핸들러가 붙거나 출력 디렉토리가 생성되지 않는지
+확인합니다. 예산 초과 또는 부작용 발견 시 종료 코드 1.
+
+사용법:
+    python check_import_time.py
+    python check_import_time.py --repeat 5
+"""
+import argparse
+import json
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+BASE_DIR = Path(__file__).parent
+
+# 모듈별 누적 import 시간 예산 (밀리초)
+IMPORT_TIME_BUDGETS_MS = {
+    "config": 30,
+    "log_config": 30,
+    "cassette": 50,
+    "research_agent": 60,
+    "synthesis_agent": 60,
+    "slide_generator": 60,
+    "infographic_generator": 60,
+    "telegram_notifier": 60,
+    "main": 60,
+}
+
+_PROBE = """
+import json, logging, sys
+from pathlib import Path
+import config
+today_dir = Path(config.OUTPUT_DIR)
+before = set(p.name for p in today_dir.iterdir()) if today_dir.exists() else None
+import {module}
+after = set(p.name for p in today_dir.iterdir()) if today_dir.exists() else None
+heavy = [m for m in ("google.generativeai", "scrapetube", "youtube_transcript_api") if m in sys.modules]
+print(json.dumps({{
+    "handlers": len(logging.getLogger().handlers),
+    "new_dirs": sorted((after or set()) - (before or set())),
+    "heavy": heavy,
+}}))
+"""
+
+_IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|\s+(\s*)(\S+)")
+
+
+def measure_module(module: str) -> dict:
+    """새 인터프리터에서 모듈을 import하고 누적 시간(ms)과 부작용을 측정합니다."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _PROBE.format(module=module)],
+        cwd=BASE_DIR,
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+    )
+    if proc.returncode != 0:
+        return {"module": module, "error": proc.stderr.strip().splitlines()[-1:]}
+
+    cumulative_us = 0
+    for line in proc.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match and match.group(4) == module:
+            cumulative_us = int(match.group(2))
+
+    probe = json.loads(proc.stdout.strip().splitlines()[-1])
+    return {"module": module, "ms": cumulative_us / 1000, **probe}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="모듈 import 시간 예산 검사")
+    parser.add_argument("--repeat", type=int, default=3, help="모듈별 측정 횟수 (최솟값 사용)")
+    parser.add_argument("modules", nargs="*", help="검사할 모듈 (기본: 전체)")
+    args = parser.parse_args(argv)
+
+    modules = args.modules or list(IMPORT_TIME_BUDGETS_MS)
+    failed = False
+
+    print(f"{'module':<24}{'ms':>8}{'budget':>8}  status")
+    for module in modules:
+        runs = [measure_module(module) for _ in range(max(1, args.repeat))]
+        errors = [r for r in runs if "error" in r]
+        if errors:
+            print(f"{module:<24}{'-':>8}{'-':>8}  ❌ import 실패: {errors[0]['error']}")
+            failed = True
+            continue
+
+        best = min(runs, key=lambda r: r["ms"])
+        budget = IMPORT_TIME_BUDGETS_MS.get(module)
+        problems = []
+        if budget is not None and best["ms"] > budget:
+            problems.append("예산 초과")
+        if best["handlers"]:
+            problems.append(f"로깅 핸들러 {best['handlers']}개 추가")
+        if best["new_dirs"]:
+            problems.append(f"디렉토리 생성 {best['new_dirs']}")
+        if best["heavy"]:
+            problems.append(f"무거운 SDK 로드 {best['heavy']}")
+
+        status = "✅" if not problems else "❌ " + ", ".join(problems)
+        print(f"{module:<24}{best['ms']:>8.1f}{budget or '-':>8}  {status}")
+        failed = failed or bool(problems)
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,498 @@
+"""
+통합 명령행 인터페이스: 하나의 프로세스에서 파이프라인 단계를 실행/연결
+
+사용법:
+    python cli.py run                      # 리서치 → 종합 → HTML → 텔레그램 (한 프로세스)
+    python cli.py run --no-notify          # 알림 제외 (기존 main.py)
+    python cli.py research [--channel @handle] [--hours 48] [--max-videos 1]
+    python cli.py research --shard 2/4     # 채널을 4개로 나눈 중 2번째만 (CI 작업 분할)
+    python cli.py research --queue [PATH]  # 채널/영상 작업을 공유 작업 큐로 처리
+    python cli.py worker [--queue PATH] [--follow]
+    python cli.py merge-shards [--date YYYY-MM-DD]
+    python cli.py synthesize [--date YYYY-MM-DD]
+    python cli.py render [--date YYYY-MM-DD]
+    python cli.py render --all [--workers 8] [--force]
+    python cli.py postprocess [--date YYYY-MM-DD] [--all]  # HTML 최소화 + .gz/.br + 크기 리포트
+    python cli.py notify [--date YYYY-MM-DD] [--dry-run]
+    python cli.py outbox [--flush]         # 텔레그램 아웃박스 상태 / 미전송 메시지 재개
+    python cli.py site [--day YYYY-MM-DD] [--rescan]
+    python cli.py search [QUERY] [--days 30] [--by-day] [--rebuild]  # 자막 역색인 검색 (검색어 없으면 상위 토큰)
+    python cli.py bench [-v] [--stages render,report] [--repeat 5] [--cassette PATH]
+    python cli.py daemon [--interval 15] [--daily-at 07:00] [--websub]  # 상시 실행: 새 영상마다 바로 알림
+    python cli.py debug-channel [@handle] [--limit 5] [--hours 24] [--refresh]
+    python cli.py vendor-assets [--force]  # 번들링용 reveal.js/폰트를 vendor/에 저장
+"""
+import argparse
+import json
+import logging
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from config import (
+    DAEMON_INTERVAL_MINUTES, HOURS_LOOKBACK, MAX_VIDEOS_PER_CHANNEL, TELEGRAM_DELIVERY_DEADLINE, WORK_QUEUE_PATH, get_output_dir,
+)
+
+logger = logging.getLogger("cli")
+
+
+# ─────────────────────────────────────────────
+# 공통 헬퍼
+# ─────────────────────────────────────────────
+def _select_channels(handles: list) -> list:
+    """--channel 옵션으로 지정된 채널만 선택합니다 (미지정 시 전체)."""
+    if not handles:
+        return None
+    from channel_registry import load_channels, make_channel
+
+    by_handle = {ch["handle"].lower(): ch for ch in load_channels()}
+    selected = []
+    for handle in handles:
+        channel = make_channel(handle)
+        selected.append(by_handle.get(channel["handle"].lower(), channel))
+    return selected
+
+
+def _research_options(args) -> dict:
+    return {
+        "channels": _select_channels(args.channel),
+        "hours": args.hours,
+        "max_results": args.max_videos,
+        "workers": args.workers,
+        "queue": args.queue,
+        "rescan": args.rescan,
+    }
+
+
+def _load_json(path: Path):
+    if not path.exists():
+        return None
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+# ─────────────────────────────────────────────
+# 서브커맨드
+# ─────────────────────────────────────────────
+def cmd_run(args) -> int:
+    from main import run_pipeline
+
+    output_dir = get_output_dir(args.date)
+    results = run_pipeline(
+        output_dir=output_dir,
+        notify=not args.no_notify,
+        research_options=_research_options(args),
+    )
+    return 0 if results.get("success") else 1
+
+
+def cmd_research(args) -> int:
+    from channel_registry import parse_shard
+    from research_agent import run_research
+
+    shard = parse_shard(args.shard) if args.shard else None
+    results = run_research(output_dir=get_output_dir(args.date), shard=shard, **_research_options(args))
+
+    print("\n📊 RESULTS SUMMARY:")
+    print(f"Total Videos Found: {results['total_videos']}")
+    print(f"Total Transcripts: {results['total_transcripts']}")
+    for ch in results["channels"]:
+        if ch["videos_found"] > 0:
+            print(f"  📺 {ch['name']}: {ch['videos_found']} videos")
+            for v in ch["videos"]:
+                print(f"     - {v['title']}")
+    return 0
+
+
+def cmd_worker(args) -> int:
+    from research_queue import run_queue_worker
+
+    from datetime import datetime
+
+    run = None if args.any_run else (args.date or datetime.now().strftime("%Y-%m-%d"))
+    stats = run_queue_worker(run, queue_path=args.queue, stop_when_drained=not args.follow)
+    return 1 if stats["failed"] else 0
+
+
+def cmd_merge_shards(args) -> int:
+    from channel_registry import merge_shards
+
+    results = merge_shards(get_output_dir(args.date), cleanup=not args.keep)
+    from config import ADAPTIVE_SCHEDULE
+    if ADAPTIVE_SCHEDULE:
+        from channel_schedule import update_channel_stats
+        update_channel_stats(results)
+    return 1 if results.get("missing_shards") else 0
+
+
+def cmd_synthesize(args) -> int:
+    from synthesis_agent import run_synthesis
+
+    output_dir = get_output_dir(args.date)
+    research_results = _load_json(output_dir / "research_results.json")
+    if research_results is None:
+        logger.warning("⚠️ research_results.json이 없어 개별 영상 요약은 건너뜁니다.")
+    results = run_synthesis(research_results, output_dir=output_dir)
+    return 0 if results.get("success") else 1
+
+
+def cmd_render(args) -> int:
+    if args.all:
+        from batch_render import render_archive
+
+        summary = render_archive(workers=args.workers, force=args.force)
+        return 1 if summary["errors"] else 0
+
+    from slide_generator import generate_slides_html
+    from infographic_generator import generate_infographic_html
+
+    from postprocess import postprocess_day
+
+    output_dir = get_output_dir(args.date)
+    slides_path = generate_slides_html(output_dir=output_dir)
+    infographic_path = generate_infographic_html(output_dir=output_dir)
+    postprocess_day(output_dir)
+    return 0 if slides_path and infographic_path else 1
+
+
+def cmd_postprocess(args) -> int:
+    from postprocess import postprocess_archive, postprocess_day
+
+    if args.all:
+        postprocess_archive()
+    else:
+        postprocess_day(get_output_dir(args.date))
+    return 0
+
+
+def cmd_notify(args) -> int:
+    from telegram_notifier import build_daily_report
+    from main import notify_results
+
+    output_dir = get_output_dir(args.date)
+    if args.dry_run:
+        print(build_daily_report(output_dir=output_dir))
+        return 0
+    return 0 if notify_results(output_dir=output_dir) else 1
+
+
+def cmd_outbox(args) -> int:
+    from telegram_outbox import Outbox
+
+    with Outbox() as outbox:
+        if args.flush:
+            outbox.deliver(deadline=args.deadline)
+        stats = outbox.stats()
+    print(f"📬 아웃박스: 대기 {stats['pending']} / 전송 {stats['sent']} / 실패 {stats['failed']}")
+    return 1 if stats["pending"] else 0
+
+
+def cmd_site(args) -> int:
+    from site_builder import build_site
+
+    days = list(args.day or [])
+    if args.date:
+        days.append(args.date)
+    build_site(days=days, rescan=args.rescan)
+    return 0
+
+
+def cmd_search(args) -> int:
+    from config import OUTPUT_DIR
+    from transcript_index import INDEX_DIRNAME, build_day_index, load_range
+
+    if args.rebuild:
+        # 색인이 없는 과거 날짜를 research_results.json으로 다시 색인
+        for results_path in sorted(OUTPUT_DIR.glob("*/research_results.json")):
+            if args.rebuild == "all" or not (results_path.parent / INDEX_DIRNAME / "meta.json").exists():
+                build_day_index(json.loads(results_path.read_text(encoding="utf-8")), results_path.parent)
+
+    started = time.perf_counter()
+    index = load_range(last=args.days)
+    loaded_ms = (time.perf_counter() - started) * 1000
+    days = sorted({doc["date"] for doc in index.docs})
+    print(f"🗂️ 색인: {len(days)}일, 영상 {len(index.docs)}개, 토큰 {len(index.terms)}종 (불러오기 {loaded_ms:.0f}ms)")
+
+    started = time.perf_counter()
+    if not args.query:
+        for term, count, videos in index.top_terms(args.limit):
+            print(f"  {count:6d}회  {videos:4d}개 영상  {term}")
+        return 0
+
+    matches = index.search(args.query, limit=len(index.docs) if args.by_day else args.limit)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    if args.by_day:
+        per_day = {}
+        for doc, count in matches:
+            videos, total = per_day.get(doc["date"], (0, 0))
+            per_day[doc["date"]] = (videos + 1, total + count)
+        for day in days:
+            videos, total = per_day.get(day, (0, 0))
+            print(f"  {day}  {total:5d}회  {videos:3d}개 영상")
+    else:
+        for doc, count in matches:
+            print(f"  {doc['date']}  {count:4d}회  [{doc['channel']}] {doc['title']}  {doc['url']}")
+    total = sum(count for _, count in matches)
+    print(f"🔎 '{args.query}': 영상 {len(matches)}개, {total}회 ({elapsed_ms:.1f}ms)")
+    return 0 if matches else 1
+
+
+def cmd_debug_channel(args) -> int:
+    import scrapetube
+    from research_agent import _is_within_hours
+
+    from channel_registry import load_channels, make_channel
+    from channel_resolver import resolve_channel, resolve_handle
+
+    channels = {ch["handle"].lower(): ch for ch in load_channels()}
+    channel = make_channel(args.handle) if args.handle else next(iter(channels.values()))
+    channel = channels.get(channel["handle"].lower(), channel)
+    handle = channel["handle"]
+    try:
+        if args.refresh and not channel.get("channel_id"):
+            resolve_handle(handle, refresh=True)
+        channel = resolve_channel(channel)
+        channel_url = channel["url"]
+        print(f"🪪 Channel ID: {channel['channel_id']} ({channel['id_source']})")
+    except Exception as e:
+        channel_url = f"https://www.youtube.com/{handle}"
+        print(f"⚠️ Channel ID 해석 실패: {e}")
+    print(f"🔍 Scanning Channel: {channel_url}")
+
+    videos = scrapetube.get_channel(channel_url=channel_url, limit=args.limit, sort_by="newest")
+    for count, video in enumerate(videos, 1):
+        title_data = video.get("title", {})
+        title = title_data.get("runs", [{}])[0].get("text", "No Title") if isinstance(title_data, dict) else str(title_data)
+        time_text_data = video.get("publishedTimeText", {})
+        published_text = time_text_data.get("simpleText", "N/A") if isinstance(time_text_data, dict) else str(time_text_data)
+        is_recent = _is_within_hours(published_text, args.hours)
+
+        print(f"\n[{count}] {title}")
+        print(f"    ID: {video.get('videoId', '')}")
+        print(f"    Time Text: '{published_text}'")
+        print(f"    Within {args.hours}h?: {'YES ✅' if is_recent else 'NO ❌'}")
+    return 0
+
+
+def _hhmm(value: str) -> str:
+    from datetime import datetime
+
+    try:
+        datetime.strptime(value, "%H:%M")
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"HH:MM 형식이어야 합니다: {value!r}")
+    return value
+
+
+def cmd_daemon(args) -> int:
+    from daemon import run_daemon
+
+    return run_daemon(interval_minutes=args.interval, daily_at=args.daily_at, once=args.once, backfill=args.backfill,
+                      websub=args.websub)
+
+
+def cmd_vendor_assets(args) -> int:
+    from asset_bundler import vendor_assets
+
+    saved = vendor_assets(force=args.force)
+    print(f"✅ vendor 에셋 {len(saved)}개 저장")
+    return 0
+
+
+# ─────────────────────────────────────────────
+# 벤치마크
+# ─────────────────────────────────────────────
+BENCH_STAGES = ("import", "research", "synthesize", "render", "report")
+
+
+def _bench_stage(stage: str, source_dir: Path, work_dir: Path):
+    """단일 단계를 한 번 실행합니다. 입력은 source_dir, 출력은 work_dir."""
+    if stage == "import":
+        from check_import_time import measure_module
+        for module in ("synthesis_agent", "slide_generator", "telegram_notifier"):
+            measure_module(module)
+    elif stage == "research":
+        from research_agent import run_research
+        run_research(output_dir=work_dir)
+    elif stage == "synthesize":
+        from synthesis_agent import run_synthesis
+        run_synthesis(_load_json(work_dir / "research_results.json")
+                      or _load_json(source_dir / "research_results.json"), output_dir=work_dir)
+    elif stage == "render":
+        from slide_generator import generate_slides_html
+        from infographic_generator import generate_infographic_html
+        generate_slides_html(_load_json(source_dir / "slides_data.json"), output_dir=work_dir)
+        generate_infographic_html(_load_json(source_dir / "infographic_data.json"), output_dir=work_dir)
+    elif stage == "report":
+        from telegram_notifier import build_daily_report
+        build_daily_report(_load_json(source_dir / "research_results.json"))
+
+
+def cmd_bench(args) -> int:
+    stages = [s.strip() for s in args.stages.split(",") if s.strip()]
+    unknown = [s for s in stages if s not in BENCH_STAGES]
+    if unknown:
+        print(f"❌ 알 수 없는 단계: {unknown} (가능: {', '.join(BENCH_STAGES)})")
+        return 2
+
+    if args.cassette:
+        # 네트워크 없이 기록된 응답을 지연 없이 재생하여 순수 처리 시간만 측정
+        from cassette import use_cassette
+        use_cassette(args.cassette, "replay", replay_speed=0)
+    elif {"research", "synthesize"} & set(stages):
+        print("❌ research/synthesize 벤치마크는 --cassette 재생 파일이 필요합니다.")
+        return 2
+
+    source_dir = get_output_dir(args.date)
+    if not args.verbose:
+        logging.getLogger().setLevel(logging.WARNING)
+
+    print(f"{'stage':<12}{'min ms':>10}{'median ms':>12}{'runs':>6}")
+    with tempfile.TemporaryDirectory() as tmp:
+        work_dir = Path(tmp)
+        (work_dir / "channel_summaries").mkdir()
+        for stage in stages:
+            timings = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                _bench_stage(stage, source_dir, work_dir)
+                timings.append((time.perf_counter() - start) * 1000)
+            print(f"{stage:<12}{min(timings):>10.1f}{statistics.median(timings):>12.1f}{len(timings):>6}")
+    return 0
+
+
+# ─────────────────────────────────────────────
+# 인자 파서
+# ─────────────────────────────────────────────
+def _iso_date(value: str) -> str:
+    """--date 값 검사 (출력 폴더 이름과 트렌드 날짜로 쓰이므로 YYYY-MM-DD만 허용)"""
+    from datetime import date
+
+    try:
+        if date.fromisoformat(value).isoformat() == value:
+            return value
+    except ValueError:
+        pass
+    raise argparse.ArgumentTypeError(f"YYYY-MM-DD 형식의 날짜가 아닙니다: {value}")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="YouTube-NotebookLM 자동화 파이프라인")
+    parser.add_argument("--date", type=_iso_date, help="대상 출력 날짜 (YYYY-MM-DD, 기본: 오늘)")
+    parser.add_argument("-v", "--verbose", action="store_true", help="벤치마크 중에도 로그 출력")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    # 날짜 대상 서브커맨드에서도 --date를 받음 (서브커맨드 뒤에 없으면 상위 --date 값 유지)
+    dated = argparse.ArgumentParser(add_help=False)
+    dated.add_argument("--date", type=_iso_date, default=argparse.SUPPRESS, help="대상 출력 날짜 (YYYY-MM-DD, 기본: 오늘)")
+    # -v도 같은 방식으로 bench 뒤에서 받음
+    verbose = argparse.ArgumentParser(add_help=False)
+    verbose.add_argument("-v", "--verbose", action="store_true", default=argparse.SUPPRESS,
+                         help="벤치마크 중에도 로그 출력")
+
+    def add_research_args(p):
+        p.add_argument("--channel", action="append", help="특정 채널 핸들만 처리 (반복 가능)")
+        p.add_argument("--hours", type=int, default=HOURS_LOOKBACK, help="최근 N시간 이내 영상")
+        p.add_argument("--max-videos", type=int, default=MAX_VIDEOS_PER_CHANNEL, help="채널당 최대 영상 수")
+        p.add_argument("--workers", type=int, default=1, help="채널을 N개 샤드로 나눠 프로세스별로 수집")
+        p.add_argument("--queue", nargs="?", const=WORK_QUEUE_PATH, type=Path,
+                       help=f"채널/영상 작업을 공유 작업 큐로 처리 (기본 경로: {WORK_QUEUE_PATH.name})")
+        p.add_argument("--rescan", action="store_true", help="--queue: 같은 날짜의 지난 작업을 지우고 다시 스캔")
+
+    p = sub.add_parser("run", parents=[dated], help="전체 파이프라인 (리서치 → 종합 → HTML → 알림)")
+    add_research_args(p)
+    p.add_argument("--no-notify", action="store_true", help="텔레그램 알림 생략")
+    p.set_defaults(func=cmd_run)
+
+    p = sub.add_parser("research", parents=[dated], help="리서치 단계만 실행")
+    add_research_args(p)
+    p.add_argument("--shard", help="i/n: 채널을 n개로 나눈 중 i번째만 수집 (CI 작업 분할용, merge-shards로 병합)")
+    p.set_defaults(func=cmd_research)
+
+    p = sub.add_parser("worker", parents=[dated], help="작업 큐의 채널/영상 작업 처리 (같은 호스트의 다른 프로세스에서 실행)")
+    p.add_argument("--queue", type=Path, default=WORK_QUEUE_PATH, help="작업 큐 SQLite 파일")
+    p.add_argument("--any-run", action="store_true", help="날짜와 관계없이 모든 작업 처리")
+    p.add_argument("--follow", action="store_true", help="큐가 비어도 종료하지 않고 새 작업 대기")
+    p.set_defaults(func=cmd_worker)
+
+    p = sub.add_parser("merge-shards", parents=[dated], help="샤드별 리서치 결과를 research_results.json으로 병합")
+    p.add_argument("--keep", action="store_true", help="병합 후 샤드 파일 유지")
+    p.set_defaults(func=cmd_merge_shards)
+
+    p = sub.add_parser("synthesize", parents=[dated], help="저장된 리서치 결과로 종합 단계 실행")
+    p.set_defaults(func=cmd_synthesize)
+
+    p = sub.add_parser("render", parents=[dated], help="저장된 데이터로 슬라이드/인포그래픽 HTML 생성")
+    p.add_argument("--all", action="store_true", help="output/ 전체 날짜를 병렬로 재렌더링 (변경분만)")
+    p.add_argument("--workers", type=int, help="--all 사용 시 프로세스 수 (기본: CPU 수)")
+    p.add_argument("--force", action="store_true", help="--all 사용 시 해시가 같아도 다시 렌더링")
+    p.set_defaults(func=cmd_render)
+
+    p = sub.add_parser("postprocess", parents=[dated], help="HTML 최소화, .gz/.br 사전 압축, 크기 리포트 기록")
+    p.add_argument("--all", action="store_true", help="output/ 전체 날짜 처리")
+    p.set_defaults(func=cmd_postprocess)
+
+    p = sub.add_parser("notify", parents=[dated], help="저장된 결과로 텔레그램 알림 전송")
+    p.add_argument("--dry-run", action="store_true", help="전송하지 않고 메시지만 출력")
+    p.set_defaults(func=cmd_notify)
+
+    p = sub.add_parser("outbox", help="텔레그램 아웃박스 상태 확인 및 미전송 메시지 재개")
+    p.add_argument("--flush", action="store_true", help="대기 중인 메시지 전송")
+    p.add_argument("--deadline", type=float, default=TELEGRAM_DELIVERY_DEADLINE, help="재시도할 최대 시간(초)")
+    p.set_defaults(func=cmd_outbox)
+
+    p = sub.add_parser("site", parents=[dated], help="output/ 날짜별 결과로 docs/ 정적 사이트 증분 빌드")
+    p.add_argument("--day", action="append", help="다시 확인할 날짜 (반복 가능, 기본: 새 날짜만)")
+    p.add_argument("--rescan", action="store_true", help="모든 날짜의 원본 해시를 다시 확인")
+    p.set_defaults(func=cmd_site)
+
+    p = sub.add_parser("search", help="날짜별 자막 역색인을 합쳐 검색어 빈도/영상 조회")
+    p.add_argument("query", nargs="?", help="검색어 (생략 시 상위 토큰 출력)")
+    p.add_argument("--days", type=int, help="최근 N일 색인만 (기본: 전체)")
+    p.add_argument("--limit", type=int, default=20)
+    p.add_argument("--by-day", action="store_true", help="날짜별 횟수/영상 수 출력")
+    p.add_argument("--rebuild", nargs="?", const="missing", choices=["missing", "all"],
+                   help="research_results.json으로 색인 재생성 (기본: 색인이 없는 날짜만)")
+    p.set_defaults(func=cmd_search)
+
+    p = sub.add_parser("bench", parents=[dated, verbose], help="단계별 실행 시간 측정")
+    p.add_argument("--stages", default="render,report", help=f"쉼표 구분 ({', '.join(BENCH_STAGES)})")
+    p.add_argument("--repeat", type=int, default=5)
+    p.add_argument("--cassette", help="research/synthesize 측정 시 재생할 카세트 파일")
+    p.set_defaults(func=cmd_bench)
+
+    p = sub.add_parser("debug-channel", help="채널의 최신 영상과 게시 시간 파싱 결과 출력")
+    p.add_argument("handle", nargs="?", help="채널 핸들 (기본: 첫 번째 채널)")
+    p.add_argument("--limit", type=int, default=5)
+    p.add_argument("--hours", type=int, default=HOURS_LOOKBACK)
+    p.add_argument("--refresh", action="store_true", help="캐시를 무시하고 채널 ID를 다시 확인")
+    p.set_defaults(func=cmd_debug_channel)
+
+    p = sub.add_parser("daemon", help="상시 실행: 주기적으로 채널 확인, 새 영상마다 바로 요약/알림")
+    p.add_argument("--interval", type=float, default=DAEMON_INTERVAL_MINUTES, help="확인 주기 (분)")
+    p.add_argument("--daily-at", metavar="HH:MM", type=_hhmm, help="매일 이 시각 이후 일일 파이프라인도 실행")
+    p.add_argument("--once", action="store_true", help="한 번만 확인하고 종료 (cron용)")
+    p.add_argument("--backfill", action="store_true", help="첫 실행 시 이미 올라온 최근 영상도 알림")
+    p.add_argument("--websub", action="store_true", help="WebSub 푸시 수신 서버를 함께 실행 (WEBSUB_CALLBACK_URL 필요)")
+    p.set_defaults(func=cmd_daemon)
+
+    p = sub.add_parser("vendor-assets", help="번들링용 reveal.js/Noto Sans KR을 vendor/에 내려받기")
+    p.add_argument("--force", action="store_true", help="이미 있어도 다시 받기")
+    p.set_defaults(func=cmd_vendor_assets)
+
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+
+    from log_config import setup_logging
+    log_file = get_output_dir(args.date) / "pipeline.log" if args.command == "run" else None
+    setup_logging(log_file)
+
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
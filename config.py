@@ -11,21 +11,14 @@ from datetime import datetime
 BASE_DIR = Path(__file__).parent
 OUTPUT_DIR = BASE_DIR / "output"
 TEMPLATES_DIR = BASE_DIR / "templates"
+CACHE_DIR = BASE_DIR / ".cache"  # 템플릿 바이트코드 등 재생성 가능한 캐시
+VENDOR_DIR = BASE_DIR / "vendor"  # 번들링용 reveal.js/폰트 로컬 사본 (cli.py vendor-assets)
 
 # ============================================================
 # YouTube 채널 목록
 # ============================================================
-YOUTUBE_CHANNELS = [
-    {"handle": "@ai.yeongseon", "name": "AI 연선", "url": "https://www.youtube.com/@ai.yeongseon"},
-    {"handle": "@digital_ggultip", "name": "디지털꿀팁", "url": "https://www.youtube.com/@digital_ggultip"},
-    {"handle": "@speech-cog", "name": "말하는인지", "url": "https://www.youtube.com/@speech-cog"},
-    {"handle": "@greenkokki", "name": "그린코끼", "url": "https://www.youtube.com/@greenkokki"},
-    {"handle": "@Smarthacker-Hub", "name": "스마트해커 허브", "url": "https://www.youtube.com/@Smarthacker-Hub"},
-    {"handle": "@designingi", "name": "디자인잉", "url": "https://www.youtube.com/@designingi"},
-    {"handle": "@elanvitalai", "name": "엘란비탈AI", "url": "https://www.youtube.com/@elanvitalai"},
-    {"handle": "@omd_eunhwan", "name": "오은환", "url": "https://www.youtube.com/@omd_eunhwan"},
-    {"handle": "@careerhackeralex", "name": "커리어해커 알렉스", "url": "https://www.youtube.com/@careerhackeralex"},
-]
+# 채널 목록은 channels.csv (handle,name)에서 관리합니다 → channel_registry.load_channels()
+CHANNELS_FILE = Path(os.environ.get("CHANNELS_FILE", BASE_DIR / "channels.csv"))
 
 # ============================================================
 # Gemini API 설정
@@ -47,13 +40,107 @@ HOURS_LOOKBACK = 24  # 최근 N시간 이내 영상만 수집
 MAX_VIDEOS_PER_CHANNEL = 5  # 채널당 최대 수집 영상 수
 TRANSCRIPT_LANGUAGES = ["ko", "ko-KR", "en", "en-US", "en-GB"]  # 자막 우선순위 확장
 
+# ============================================================
+# 카세트(기록/재생) 설정
+# ============================================================
+CASSETTE_MODE = os.environ.get("CASSETTE_MODE", "")  # "record" | "replay" | ""
+CASSETTE_PATH = os.environ.get("CASSETTE_PATH", "")  # 미설정 시 오늘 출력 디렉토리
+CASSETTE_REPLAY_SPEED = float(os.environ.get("CASSETTE_REPLAY_SPEED", "1.0"))  # 0이면 지연 없음
+
+# ============================================================
+# 출력물 번들링 설정
+# ============================================================
+# 1이면 reveal.js/폰트를 HTML에 인라인 (외부 요청 없는 단일 파일)
+BUNDLE_ASSETS = os.environ.get("BUNDLE_ASSETS", "") == "1"
+
+# ============================================================
+# 텔레그램 아웃박스 설정
+# ============================================================
+# 전송 대기 메시지를 보관하는 SQLite 파일 (다음 실행에서 미전송분 재개)
+TELEGRAM_OUTBOX_PATH = Path(os.environ.get("TELEGRAM_OUTBOX_PATH", CACHE_DIR / "telegram_outbox.sqlite"))
+TELEGRAM_DELIVERY_DEADLINE = float(os.environ.get("TELEGRAM_DELIVERY_DEADLINE", "300"))  # 한 번 실행에서 재시도할 최대 시간(초)
+
+# ============================================================
+# 적응형 스캔 일정 설정
+# ============================================================
+# 1이면 채널별 게시 이력으로 스캔 여부/깊이/순서 결정 (channel_schedule.py)
+ADAPTIVE_SCHEDULE = os.environ.get("ADAPTIVE_SCHEDULE", "") == "1"
+CHANNEL_STATS_PATH = OUTPUT_DIR / "channel_stats.json"
+
+# ============================================================
+# 영상별 요약 저장소 설정
+# ============================================================
+# video_id + 자막 해시별 요약/핵심 사실 (summary_store.py). output/과 함께 커밋되어 재종합 시 재사용
+VIDEO_SUMMARIES_PATH = OUTPUT_DIR / "video_summaries.json"
+# 0이면 인포그래픽을 LLM 없이 로컬 집계/주제 묶기 결과만으로 생성 (daily_stats.py, topic_clusters.py)
+INFOGRAPHIC_LLM = os.environ.get("INFOGRAPHIC_LLM", "1") != "0"
+# 1이면 긴 자막을 구간별로 나눠 병렬 요약한 뒤 하나로 합침 (0이면 예전처럼 앞부분만 요약)
+CHUNKED_SUMMARY = os.environ.get("CHUNKED_SUMMARY", "1") != "0"
+# 구간 요약을 동시에 요청하는 최대 개수 (구간 수 상한 12와 같으면 긴 영상도 한 번에 요청, 무료 요금제 분당 한도가 낮으면 줄이기)
+SUMMARY_CHUNK_WORKERS = int(os.environ.get("SUMMARY_CHUNK_WORKERS", "12"))
+
+# ============================================================
+# 자막 파일 설정
+# ============================================================
+# 1이면 자막을 output/YYYY-MM-DD/transcripts/<video_id>.txt로 흘려 쓰고 결과 JSON에는 경로만 기록 (transcript_files.py)
+STREAM_TRANSCRIPTS = os.environ.get("STREAM_TRANSCRIPTS", "1") != "0"
+
+# ============================================================
+# 키워드 추세 저장소 설정
+# ============================================================
+# 날짜 × 채널 × 토큰 언급 횟수 열 배열 (trend_store.py). output/과 함께 커밋되어 날짜 간 비교에 사용
+TREND_STORE_DIR = OUTPUT_DIR / "trends"
+# 0이면 인포그래픽/텔레그램의 "이번 주 떠오르는 주제" 섹션 생략 (추세 기록은 계속)
+RISING_TOPICS = os.environ.get("RISING_TOPICS", "1") != "0"
+
+# ============================================================
+# 작업 큐 설정
+# ============================================================
+# 같은 호스트의 여러 워커 프로세스가 공유하는 채널/영상 작업 큐 (cli.py research --queue, cli.py worker)
+WORK_QUEUE_PATH = Path(os.environ.get("WORK_QUEUE_PATH", CACHE_DIR / "work_queue.sqlite"))
+
+# ============================================================
+# 영상 탐색 설정
+# ============================================================
+# 순서대로 시도하는 탐색 백엔드 (video_discovery.py). feed는 채널 ID를 아는 채널만 사용
+DISCOVERY_BACKENDS = [
+    name.strip() for name in os.environ.get("DISCOVERY_BACKENDS", "feed,scrapetube").split(",") if name.strip()
+]
+# 핸들 → 채널 ID 캐시 (channel_resolver.py)와 재확인 주기(일)
+CHANNEL_ID_CACHE_PATH = Path(os.environ.get("CHANNEL_ID_CACHE_PATH", CACHE_DIR / "channel_ids.json"))
+CHANNEL_ID_REVALIDATE_DAYS = float(os.environ.get("CHANNEL_ID_REVALIDATE_DAYS", "30"))
+
+# ============================================================
+# 상시 실행 모드 설정
+# ============================================================
+# cli.py daemon: 채널 확인 주기(분)와 처리한 영상 저장소 (일일 파이프라인이 자막/요약 재사용)
+DAEMON_INTERVAL_MINUTES = float(os.environ.get("DAEMON_INTERVAL_MINUTES", "15"))
+LIVE_STORE_PATH = Path(os.environ.get("LIVE_STORE_PATH", CACHE_DIR / "live_videos.json"))
+
+# ============================================================
+# WebSub(푸시) 설정
+# ============================================================
+# cli.py daemon --websub: 허브 주소, 외부에서 접근 가능한 콜백 URL, 서명 비밀값, 수신 포트/경로
+WEBSUB_HUB = os.environ.get("WEBSUB_HUB", "https://pubsubhubbub.appspot.com/subscribe")
+WEBSUB_CALLBACK_URL = os.environ.get("WEBSUB_CALLBACK_URL", "")
+WEBSUB_SECRET = os.environ.get("WEBSUB_SECRET", "")
+WEBSUB_PORT = int(os.environ.get("WEBSUB_PORT", "8080"))
+WEBSUB_PATH = os.environ.get("WEBSUB_PATH", "/websub")
+WEBSUB_STATE_PATH = Path(os.environ.get("WEBSUB_STATE_PATH", CACHE_DIR / "websub.sqlite"))
+WEBSUB_FALLBACK_POLL_HOURS = float(os.environ.get("WEBSUB_FALLBACK_POLL_HOURS", "6"))  # 구독 중인 채널도 이 주기로 확인
+
 # ============================================================
 # 출력 설정
 # ============================================================
 def get_today_output_dir():
     """오늘 날짜 기반 출력 디렉토리 반환"""
-    today = datetime.now().strftime("%Y-%m-%d")
-    output_dir = OUTPUT_DIR / today
+    return get_output_dir()
+
+
+def get_output_dir(date: str = None):
+    """지정 날짜(YYYY-MM-DD, 기본 오늘)의 출력 디렉토리 반환"""
+    date = date or datetime.now().strftime("%Y-%m-%d")
+    output_dir = OUTPUT_DIR / date
     output_dir.mkdir(parents=True, exist_ok=True)
     (output_dir / "channel_summaries").mkdir(exist_ok=True)
     return output_dir
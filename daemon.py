@@ -0,0 +1,258 @@
+"""
+상시 실행 모드: 채널을 주기적으로 확인해 새 영상마다 바로 자막 → 요약 → 텔레그램 알림
+- 자막은 그날 출력 폴더의 transcripts/에 파일(.txt + 시각 사이드카 .seg)로 쓰고,
+  처리한 영상은 live_store(.cache/live_videos.json)에 자막 파일 경로/요약과 함께 저장되며,
+  일일 파이프라인(run)은 이를 재사용하므로 같은 영상을 다시 받거나 다시 요약하지 않음
+- 갓 올라온 영상은 자막이 늦게 생기는 경우가 많아 최대 TRANSCRIPT_WAIT_MINUTES까지 다음 확인 때 다시 시도한 뒤,
+  그래도 없으면 요약 없이 알림
+- 처음 시작할 때는 이미 올라와 있던 영상을 알림 없이 기록만 함 (--backfill이면 모두 처리)
+- --daily-at HH:MM 이면 매일 그 시각 이후 한 번 일일 파이프라인(알림 포함)을 실행
+- --websub이면 WebSub 푸시 수신 서버(websub.py)를 함께 띄워 알림이 오는 즉시 처리
+
+채널 ID를 아는 채널은 피드 조건부 GET(video_discovery)으로 확인하므로 새 영상이 없으면 304 응답만 받습니다.
+
+사용법:
+    python cli.py daemon [--interval 15] [--daily-at 07:00] [--once] [--backfill] [--websub]
+"""
+import logging
+import signal
+import threading
+import time
+from datetime import datetime
+
+from config import (
+    DAEMON_INTERVAL_MINUTES,
+    HOURS_LOOKBACK,
+    MAX_VIDEOS_PER_CHANNEL,
+    STREAM_TRANSCRIPTS,
+    WEBSUB_FALLBACK_POLL_HOURS,
+    get_today_output_dir,
+)
+
+logger = logging.getLogger(__name__)
+
+TRANSCRIPT_WAIT_MINUTES = 120  # 자막이 생길 때까지 알림을 미루는 최대 시간
+
+
+def _now_iso(now: datetime) -> str:
+    return now.isoformat(timespec="seconds")
+
+
+# ─────────────────────────────────────────────
+# 영상 단위 처리
+# ─────────────────────────────────────────────
+def process_video(store, entry: dict, model, now: datetime = None) -> str:
+    """자막 → 요약 → 알림. 자막이 아직 없고 대기 시간이 남았으면 waiting으로 두고 다음 확인 때 재시도."""
+    from research_agent import fill_transcript
+    from summary_store import SummaryStore
+    from telegram_notifier import build_video_alert, send_telegram_message
+
+    now = now or datetime.now()
+    video = dict(entry["video"])
+    fill_transcript(video, output_dir=get_today_output_dir() if STREAM_TRANSCRIPTS else None)
+    entry["attempts"] = entry.get("attempts", 0) + 1
+
+    waited = (now - datetime.fromisoformat(entry["first_seen_at"])).total_seconds() / 60
+    if not video["transcript_success"] and waited < TRANSCRIPT_WAIT_MINUTES:
+        entry["status"] = "waiting"
+        logger.info(f"  ⏳ 자막 대기: {video['title'][:40]} ({int(waited)}분 경과)")
+        store.put(video["video_id"], entry)
+        return entry["status"]
+
+    summary = ""
+    if video["transcript_success"]:
+        # 일일 종합이 다시 요약하지 않도록 영상별 요약 저장소에 함께 기록
+        summaries = SummaryStore()
+        summary = summaries.summarize(video, model)["summary"]
+        summaries.save()
+    if video.get("transcript_path"):
+        entry["transcript_path"] = video["transcript_path"]
+    else:
+        entry["transcript"] = video.get("transcript", "")
+    entry.update({
+        "transcript_success": video["transcript_success"],
+        "transcript_minutes": video.get("transcript_minutes", 0.0),
+        "summary": summary,
+    })
+    # 전송하지 못한 조각은 아웃박스에 남아 다음 전송 때 재개되므로 결과와 관계없이 alerted로 기록
+    sent = send_telegram_message(build_video_alert(entry["channel"], video, summary), batch=f"live:{video['video_id']}")
+    entry.update({"status": "alerted", "alerted_at": _now_iso(now), "delivered": sent})
+    store.put(video["video_id"], entry)
+    latency = ""
+    if video.get("published_at"):
+        latency = f" (게시 → 알림 약 {int((now - datetime.fromisoformat(video['published_at'])).total_seconds() // 60)}분)"
+    logger.info(f"  🔔 알림: {video['title'][:40]}{latency}")
+    return entry["status"]
+
+
+# ─────────────────────────────────────────────
+# 한 번의 확인
+# ─────────────────────────────────────────────
+def poll_once(store, model, backfill: bool = False, hours: int = HOURS_LOOKBACK,
+              max_results: int = MAX_VIDEOS_PER_CHANNEL, skip_handles: set = None) -> dict:
+    """모든 채널을 한 번 확인하고 새 영상/자막 대기 영상을 처리합니다.
+
+    skip_handles(소문자 핸들)의 채널은 확인하지 않습니다 (WebSub 구독으로 푸시를 받는 채널).
+    """
+    from channel_registry import load_channels
+    from research_agent import fetch_recent_videos, polite_delay
+
+    now = datetime.now()
+    prime = "primed_at" not in store.data and not backfill
+    stats = {"new": 0, "alerted": 0, "waiting": 0, "primed": 0}
+    found_now = set()
+
+    for channel in load_channels():
+        if skip_handles and channel["handle"].lower() in skip_handles:
+            continue
+        polite_delay()
+        videos = fetch_recent_videos(channel["handle"], max_results=max_results, hours=hours,
+                                     channel_id=channel.get("channel_id"))
+        for video in videos:
+            if video["video_id"] in store:
+                continue
+            found_now.add(video["video_id"])
+            entry = {
+                "channel": {"handle": channel["handle"], "name": channel["name"]},
+                "video": video,
+                "first_seen_at": _now_iso(now),
+                "status": "new",
+            }
+            stats["new"] += 1
+            if prime:
+                entry["status"] = "primed"
+                store.put(video["video_id"], entry)
+                stats["primed"] += 1
+                continue
+            stats[process_video(store, entry, model, now)] += 1
+            store.save()
+
+    # 이전 확인에서 자막이 없던 영상 재시도
+    for video_id, entry in list(store.videos.items()):
+        if entry["status"] == "waiting" and video_id not in found_now:
+            stats[process_video(store, entry, model, now)] += 1
+            store.save()
+
+    store.data.setdefault("primed_at", _now_iso(now))
+    store.save()
+    if prime and stats["primed"]:
+        logger.info(f"📌 첫 실행: 기존 영상 {stats['primed']}개는 알림 없이 기록만 했습니다 (--backfill로 처리 가능)")
+    logger.info(f"🔁 확인 완료: 새 영상 {stats['new']}개, 알림 {stats['alerted']}개, 자막 대기 {stats['waiting']}개")
+    return stats
+
+
+def process_pushed(store, state, model, hours: int = HOURS_LOOKBACK) -> int:
+    """WebSub로 받은 알림을 영상 단위 처리로 넘깁니다. 처리한 알림 수를 반환."""
+    from channel_registry import load_channels
+    from video_discovery import video_from_entry
+
+    channels = {ch["handle"].lower(): ch for ch in load_channels()}
+    now = datetime.now()
+    processed = 0
+    for note in state.pending_notifications():
+        handle = state.handle_for(note["channel_id"])
+        channel = channels.get((handle or "").lower())
+        if note["video_id"] in store or channel is None or not note["published"]:
+            state.mark_processed(note["video_id"])
+            continue
+
+        video, age_hours = video_from_entry(note)
+        if age_hours > hours:
+            # 오래된 영상의 제목/설명 수정도 알림으로 오므로 조회 기간 밖이면 무시
+            state.mark_processed(note["video_id"])
+            continue
+        entry = {
+            "channel": {"handle": channel["handle"], "name": channel["name"]},
+            "video": video,
+            "first_seen_at": _now_iso(now),
+            "status": "new",
+            "source": "websub",
+        }
+        process_video(store, entry, model, now)
+        store.save()
+        state.mark_processed(note["video_id"])
+        processed += 1
+    return processed
+
+
+def maybe_run_daily(store, daily_at: str, now: datetime = None) -> bool:
+    """daily_at(HH:MM)이 지났고 오늘 아직 실행하지 않았으면 일일 파이프라인을 실행합니다."""
+    from config import get_output_dir
+    from main import run_pipeline
+
+    now = now or datetime.now()
+    today = now.strftime("%Y-%m-%d")
+    hour, minute = (int(x) for x in daily_at.split(":"))
+    if now < now.replace(hour=hour, minute=minute, second=0, microsecond=0) or today in store.data["daily_runs"]:
+        return False
+
+    logger.info(f"📅 일일 파이프라인 실행 ({today} {daily_at})")
+    results = run_pipeline(output_dir=get_output_dir(today), notify=True)
+    store.data["daily_runs"].append(today)
+    store.save()
+    return results.get("success", False)
+
+
+def run_daemon(interval_minutes: float = DAEMON_INTERVAL_MINUTES, daily_at: str = None,
+               once: bool = False, backfill: bool = False, websub: bool = False) -> int:
+    """SIGINT/SIGTERM을 받을 때까지 interval_minutes마다 채널을 확인합니다.
+
+    websub=True면 푸시 수신 서버를 함께 띄우고, 알림이 오면 바로 처리합니다.
+    구독 중인 채널은 WEBSUB_FALLBACK_POLL_HOURS마다 한 번만 폴링합니다 (푸시 누락 대비).
+    """
+    from live_store import LiveStore
+    from synthesis_agent import init_gemini
+
+    stop = threading.Event()
+    wake = threading.Event()
+
+    def _stop(signum, frame):
+        logger.info("🛑 종료 신호 수신 - 현재 작업을 마치고 종료합니다.")
+        stop.set()
+        wake.set()
+
+    signal.signal(signal.SIGINT, _stop)
+    signal.signal(signal.SIGTERM, _stop)
+
+    store = LiveStore()
+    model = init_gemini()
+    logger.info(f"🛰️ 상시 실행 모드 시작: {interval_minutes:g}분 간격" + (f", 일일 파이프라인 {daily_at}" if daily_at else ""))
+
+    state = server = None
+    if websub:
+        from channel_registry import load_channels
+        from websub import WebSubServer, WebSubState
+
+        state = WebSubState()
+        server = WebSubServer(state, load_channels(), on_notification=wake.set).start()
+
+    # monotonic()은 부팅 후 경과 시간이라 0으로 시작하면 갓 띄운 호스트에서 첫 전체 확인을 건너뜀
+    next_poll, last_full_poll = 0.0, float("-inf")
+    while not stop.is_set():
+        try:
+            if state is not None:
+                process_pushed(store, state, model)
+            if time.monotonic() >= next_poll:
+                skip = None
+                if state is not None and time.monotonic() - last_full_poll < WEBSUB_FALLBACK_POLL_HOURS * 3600:
+                    skip = state.active_handles()
+                else:
+                    last_full_poll = time.monotonic()
+                poll_once(store, model, backfill=backfill, skip_handles=skip)
+                backfill = False
+                next_poll = time.monotonic() + interval_minutes * 60
+                if daily_at:
+                    maybe_run_daily(store, daily_at)
+        except Exception as e:
+            logger.exception(f"❌ 확인 중 오류 (다음 주기에 재시도): {e}")
+            next_poll = time.monotonic() + interval_minutes * 60
+        if once:
+            break
+        wake.wait(max(0.0, next_poll - time.monotonic()))
+        wake.clear()
+
+    if server is not None:
+        server.stop()
+        state.close()
+    logger.info("👋 상시 실행 모드 종료")
+    return 0
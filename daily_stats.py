@@ -0,0 +1,147 @@
+"""
+일일 집계: research_results에서 인포그래픽 수치와 트렌딩 키워드를 직접 계산 (LLM 호출 없음)
+- 수치: 확인한 채널 수, 새 영상 수, 자막 확보 수, 자막 분량(분), 조회수 합계
+- 키워드: 영상별 토큰(tokenizer.words)을 한 번에 세고, 몇 개 영상에 나왔는지(문서 빈도) 순으로 정렬
+  → 긴 자막 하나가 순위를 독차지하지 않고, 여러 영상이 함께 다룬 단어가 위로 올라옴
+
+인포그래픽의 key_stats / trending_keywords는 이 값으로 채워지며, LLM 응답이 없어도 실제 수치가 표시됩니다.
+"""
+import logging
+import re
+from collections import Counter, defaultdict
+from itertools import chain
+
+from tokenizer import words
+from transcript_files import iter_text
+
+logger = logging.getLogger(__name__)
+
+TOP_KEYWORDS = 8
+TITLE_WEIGHT = 3  # 제목 단어를 자막보다 강하게 반영 (topic_clusters와 같은 값)
+
+_VIEW_UNITS = {"k": 1e3, "m": 1e6, "b": 1e9, "천": 1e3, "만": 1e4, "억": 1e8}
+_VIEWS = re.compile(r"([\d,.]+)\s*([KMBkmb천만억]?)")
+
+
+def parse_view_count(text) -> int:
+    """'1,234 views', '1.2K views', '조회수 1.2만회' → 정수. 알 수 없으면 None."""
+    if isinstance(text, int):
+        return text
+    match = _VIEWS.search(text or "")
+    if not match:
+        return None
+    try:
+        number = float(match.group(1).replace(",", ""))
+    except ValueError:
+        return None
+    return int(number * _VIEW_UNITS.get(match.group(2).lower(), 1))
+
+
+def parse_duration_minutes(text: str) -> float:
+    """'12:34' / '1:02:03' → 분. 형식이 다르면 0."""
+    parts = (text or "").strip().split(":")
+    if len(parts) < 2 or not all(p.isdigit() for p in parts):
+        return 0.0
+    seconds = 0
+    for part in parts:
+        seconds = seconds * 60 + int(part)
+    return seconds / 60
+
+
+def _human(number: float) -> str:
+    if number >= 1e8:
+        return f"{number / 1e8:.1f}억"
+    if number >= 1e4:
+        return f"{number / 1e4:.1f}만"
+    return f"{int(number):,}"
+
+
+# ─────────────────────────────────────────────
+# 집계
+# ─────────────────────────────────────────────
+def keyword_counts(videos: list) -> list:
+    """[(표시 단어, 문서 빈도, 전체 빈도)] - 문서 빈도 → 전체 빈도 순"""
+    doc_freq, term_freq = Counter(), Counter()
+    surfaces = defaultdict(Counter)
+    for video in videos:
+        head = " ".join([
+            (video.get("title", "") + " ") * TITLE_WEIGHT,
+            video.get("summary", ""),
+            " ".join(video.get("facts", [])),
+        ])
+        tokens = Counter()
+        for chunk in chain([head], iter_text(video)):
+            tokens.update(token for _, token in words(chunk))
+        term_freq.update(tokens)
+        doc_freq.update(tokens.keys())
+        # 표시 형태(OpenAI, GPT 등 원래 대소문자)는 제목/요약에서만 세어도 충분
+        for surface, token in words(f"{video.get('title', '')} {video.get('summary', '')}"):
+            surfaces[token][surface] += 1
+    ranked = sorted(term_freq, key=lambda t: (-doc_freq[t], -term_freq[t], t))
+    return [
+        ((surfaces[t].most_common(1)[0][0] if surfaces[t] else t), doc_freq[t], term_freq[t])
+        for t in ranked
+    ]
+
+
+def compute_daily_stats(research_results: dict) -> dict:
+    """research_results → 집계 dict (결과가 없으면 None)"""
+    if not research_results:
+        return None
+    channels = research_results.get("channels", [])
+    videos = [v for ch in channels for v in ch.get("videos", [])]
+
+    minutes = 0.0
+    views, views_known = 0, 0
+    for video in videos:
+        minutes += video.get("transcript_minutes") or parse_duration_minutes(video.get("duration", ""))
+        count = parse_view_count(video.get("view_count", ""))
+        if count is not None:
+            views += count
+            views_known += 1
+
+    keywords = keyword_counts(videos)
+    stats = {
+        "channels_scanned": len(research_results.get("scanned", [])) or len(channels),
+        "channels_with_videos": sum(1 for ch in channels if ch.get("videos")),
+        "videos": len(videos),
+        "transcripts": sum(1 for v in videos if v.get("has_transcript")),
+        "transcript_minutes": round(minutes, 1),
+        "views": views if views_known else None,
+        "views_known": views_known,
+        "keywords": [{"keyword": k, "videos": df, "count": tf} for k, df, tf in keywords[:30]],
+    }
+    logger.info(f"🔢 일일 집계: 영상 {stats['videos']}개, 자막 {stats['transcript_minutes']:.0f}분, "
+                f"키워드 {len(keywords)}종")
+    return stats
+
+
+def key_stats(stats: dict) -> list:
+    """인포그래픽 key_stats 형식"""
+    if not stats:
+        return []
+    result = [
+        {"label": "분석 채널", "value": f"{stats['channels_scanned']}개", "icon": "📺"},
+        {"label": "신규 영상", "value": f"{stats['videos']}개", "icon": "🎬"},
+        {"label": "자막 확보", "value": f"{stats['transcripts']}개", "icon": "📝"},
+    ]
+    if stats["transcript_minutes"]:
+        result.append({"label": "자막 분량", "value": f"{stats['transcript_minutes']:.0f}분", "icon": "⏱️"})
+    if stats["views"] is not None:
+        result.append({"label": "조회수 합계", "value": _human(stats["views"]), "icon": "👀"})
+    return result
+
+
+def trending_keywords(stats: dict, limit: int = TOP_KEYWORDS) -> list:
+    """인포그래픽 trending_keywords 형식 (영상 2개 이상에 나온 단어 우선)"""
+    if not stats:
+        return []
+    keywords = stats["keywords"]
+    shared = [k["keyword"] for k in keywords if k["videos"] >= 2]
+    return (shared or [k["keyword"] for k in keywords])[:limit]
+
+
+def stats_outline(stats: dict) -> str:
+    """LLM 프롬프트에 넣을 짧은 집계 요약"""
+    values = ", ".join(f"{s['label']} {s['value']}" for s in key_stats(stats))
+    return f"{values}\n트렌딩 키워드: {', '.join(trending_keywords(stats))}"
@@ -0,0 +1,63 @@
+"""
+상시 실행 모드(daemon.py)가 처리한 영상 저장소
+- video_id별로 채널, 영상 정보, 자막 파일 경로, 요약, 알림 상태를 .cache/live_videos.json에 보관
+- 일일 파이프라인은 여기 있는 자막/요약을 재사용 (같은 영상을 다시 받거나 다시 요약하지 않음)
+- LIVE_RETENTION_DAYS보다 오래된 항목은 저장 시 정리
+"""
+import json
+import logging
+import os
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from cassette import is_replaying
+from config import LIVE_STORE_PATH
+
+logger = logging.getLogger(__name__)
+
+LIVE_RETENTION_DAYS = 3
+
+
+class LiveStore:
+    def __init__(self, path: Path = LIVE_STORE_PATH):
+        self.path = Path(path)
+        self.data = {"videos": {}, "daily_runs": []}
+        if self.path.exists():
+            try:
+                self.data.update(json.loads(self.path.read_text(encoding="utf-8")))
+            except (OSError, ValueError):
+                logger.warning(f"⚠️ 실시간 영상 저장소를 읽을 수 없어 새로 시작합니다: {self.path}")
+
+    @property
+    def videos(self) -> dict:
+        return self.data["videos"]
+
+    def __contains__(self, video_id: str) -> bool:
+        return video_id in self.videos
+
+    def get(self, video_id: str):
+        return self.videos.get(video_id)
+
+    def put(self, video_id: str, entry: dict):
+        self.videos[video_id] = entry
+
+    def prune(self, now: datetime = None):
+        cutoff = ((now or datetime.now()) - timedelta(days=LIVE_RETENTION_DAYS)).isoformat(timespec="seconds")
+        stale = [vid for vid, entry in self.videos.items() if entry.get("first_seen_at", "") < cutoff]
+        for vid in stale:
+            del self.videos[vid]
+        self.data["daily_runs"] = self.data["daily_runs"][-LIVE_RETENTION_DAYS:]
+
+    def save(self):
+        self.prune()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(self.data, ensure_ascii=False, indent=2), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+
+def open_live_store():
+    """일일 파이프라인에서 재사용할 저장소. 파일이 없거나 카세트 재생 중이면 None."""
+    if is_replaying() or not Path(LIVE_STORE_PATH).exists():
+        return None
+    return LiveStore()
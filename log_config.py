@@ -0,0 +1,40 @@
+"""
+로깅 설정: 실행 진입점에서만 한 번 호출
+- 모듈 import 시에는 핸들러를 붙이거나 디렉토리를 만들지 않음
+"""
+import logging
+import sys
+from pathlib import Path
+
+LOG_FORMAT = "%(asctime)s [%(levelname)s] %(message)s"
+LOG_DATEFMT = "%Y-%m-%d %H:%M:%S"
+
+_configured = False
+
+
+def setup_logging(log_file: Path = None, level: int = logging.INFO):
+    """루트 로거를 설정합니다. 여러 번 호출해도 핸들러는 한 번만 추가됩니다."""
+    global _configured
+
+    # Windows 콘솔 출력 인코딩 설정
+    if sys.stdout.encoding and sys.stdout.encoding.lower() != "utf-8":
+        sys.stdout.reconfigure(encoding="utf-8")
+
+    root = logging.getLogger()
+    if not _configured:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter(LOG_FORMAT, LOG_DATEFMT))
+        root.addHandler(handler)
+        root.setLevel(level)
+        _configured = True
+
+    if log_file is not None:
+        log_file = Path(log_file).resolve()
+        already = any(
+            isinstance(h, logging.FileHandler) and Path(h.baseFilename) == log_file
+            for h in root.handlers
+        )
+        if not already:
+            file_handler = logging.FileHandler(log_file, encoding="utf-8")
+            file_handler.setFormatter(logging.Formatter(LOG_FORMAT, LOG_DATEFMT))
+            root.addHandler(file_handler)
@@ -1,32 +1,30 @@
 """
-메인 오케스트레이터: 리서치 → 종합 → 출력물 생성 전체 파이프라인
+메인 오케스트레이터: 리서치 → 종합 → 출력물 생성 (→ 텔레그램 알림) 전체 파이프라인
+- 단계 간 결과는 파일을 다시 읽지 않고 메모리로 전달
+- 명령행 진입점은 cli.py (`python cli.py run`)
 """
 import sys
 import logging
 import traceback
 from datetime import datetime
+from pathlib import Path
 
 from config import get_today_output_dir
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S",
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler(
-            get_today_output_dir() / "pipeline.log",
-            encoding="utf-8",
-        ),
-    ],
-)
 logger = logging.getLogger(__name__)
 
 
-def run_pipeline():
-    """전체 파이프라인 실행"""
+def run_pipeline(output_dir: Path = None, notify: bool = False, research_options: dict = None) -> dict:
+    """전체 파이프라인 실행
+
+    Args:
+        output_dir: 출력 디렉토리 (기본: 오늘 날짜)
+        notify: True면 마지막에 같은 프로세스에서 텔레그램 알림까지 전송 (실패해도 항상 시도)
+        research_options: run_research()에 전달할 인자 (channels, hours, max_results)
+    """
     start_time = datetime.now()
-    output_dir = get_today_output_dir()
+    output_dir = output_dir or get_today_output_dir()
+    research_results = None
 
     logger.info("╔" + "═" * 58 + "╗")
     logger.info("║  🚀 YouTube-NotebookLM 자동화 파이프라인 시작              ║")
@@ -44,7 +42,7 @@ def run_pipeline():
         logger.info("=" * 60)
 
         from research_agent import run_research
-        research_results = run_research()
+        research_results = run_research(output_dir=output_dir, **(research_options or {}))
         results["stages"]["research"] = {
             "success": True,
             "total_videos": research_results.get("total_videos", 0),
@@ -66,7 +64,7 @@ def run_pipeline():
         logger.info("=" * 60)
 
         from synthesis_agent import run_synthesis
-        synthesis_results = run_synthesis(research_results)
+        synthesis_results = run_synthesis(research_results, output_dir=output_dir)
         results["stages"]["synthesis"] = {
             "success": synthesis_results.get("success", False),
         }
@@ -81,13 +79,17 @@ def run_pipeline():
         from slide_generator import generate_slides_html
         from infographic_generator import generate_infographic_html
 
-        slides_path = generate_slides_html()
-        infographic_path = generate_infographic_html()
+        slides_path = generate_slides_html(synthesis_results.get("slides_data"), output_dir=output_dir)
+        infographic_path = generate_infographic_html(synthesis_results.get("infographic_data"), output_dir=output_dir)
+
+        from postprocess import postprocess_day
+        size_report = postprocess_day(output_dir)
 
         results["stages"]["output"] = {
             "success": True,
             "slides": slides_path,
             "infographic": infographic_path,
+            "sizes": size_report["totals"],
         }
 
         results["success"] = True
@@ -105,9 +107,29 @@ def run_pipeline():
         logger.info(f"║  📂 출력: {output_dir}" + " " * max(0, 38 - len(str(output_dir))) + "║")
         logger.info("╚" + "═" * 58 + "╝")
 
+        if notify:
+            results["stages"]["notify"] = {"success": notify_results(research_results, output_dir)}
+
     return results
 
 
+def notify_results(research_results: dict = None, output_dir: Path = None) -> bool:
+    """리서치 결과(메모리 또는 파일)로 일일 리포트를 만들어 텔레그램으로 전송합니다."""
+    from telegram_notifier import build_daily_report, send_telegram_message
+
+    try:
+        report = build_daily_report(research_results, output_dir=output_dir)
+        success = send_telegram_message(report)
+    except Exception as e:
+        logger.error(f"❌ 텔레그램 알림 오류: {e}")
+        return False
+    if not success:
+        logger.info("ℹ️ 텔레그램 전송 실패 - 토큰/Chat ID를 확인하세요.")
+    return success
+
+
 if __name__ == "__main__":
-    results = run_pipeline()
-    sys.exit(0 if results.get("success") else 1)
+    # 하위 호환: `python main.py` == `python cli.py run --no-notify`
+    from cli import main
+
+    sys.exit(main(["run", "--no-notify"]))
@@ -0,0 +1,183 @@
+"""
+후처리 단계: 출력물 최소화 + 사전 압축(gzip/brotli) + 크기 리포트
+- slides.html / infographic.html: 공백·주석 제거, <style> CSS 최소화 (제자리 갱신)
+- HTML/마크다운/JSON 산출물 옆에 .gz / .br 파일 생성 (정적 호스팅용)
+- output/<date>/size_report.json 과 output/size_history.jsonl 에 전후 크기 기록
+"""
+import gzip
+import json
+import logging
+import re
+from datetime import datetime
+from pathlib import Path
+
+from config import OUTPUT_DIR
+
+logger = logging.getLogger(__name__)
+
+MINIFY_TARGETS = ("slides.html", "infographic.html")
+COMPRESS_TARGETS = (
+    "slides.html",
+    "infographic.html",
+    "combined_summary.md",
+    "podcast_script.md",
+    "research_results.json",
+)
+SIZE_HISTORY = "size_history.jsonl"
+GROWTH_WARN_RATIO = 1.5  # 직전 기록 대비 전송 크기가 이 비율 이상 커지면 경고
+
+try:
+    import brotli
+    HAS_BROTLI = True
+except ImportError:
+    HAS_BROTLI = False
+
+
+# ─────────────────────────────────────────────
+# HTML 최소화
+# ─────────────────────────────────────────────
+_PRESERVE = re.compile(r"<(pre|textarea|script)\b.*?</\1>", re.S | re.I)
+_STYLE = re.compile(r"(<style\b[^>]*>)(.*?)(</style>)", re.S | re.I)
+_COMMENT = re.compile(r"<!--(?!\[if).*?-->", re.S)
+_BETWEEN_TAGS = re.compile(r">\s+<")
+_SPACES = re.compile(r"\s{2,}")
+
+
+def minify_html(html: str) -> str:
+    """공백/주석을 줄입니다. <pre>, <textarea>, <script> 내용은 그대로 유지."""
+    from asset_bundler import minify_css
+
+    preserved = []
+
+    def _stash(match):
+        preserved.append(match.group(0))
+        return f"\x00{len(preserved) - 1}\x00"
+
+    html = _PRESERVE.sub(_stash, html)
+    html = _STYLE.sub(lambda m: m.group(1) + minify_css(m.group(2)) + m.group(3), html)
+    html = _COMMENT.sub("", html)
+    html = _BETWEEN_TAGS.sub("><", html)
+    html = _SPACES.sub(" ", html)
+    html = re.sub(r"\x00(\d+)\x00", lambda m: preserved[int(m.group(1))], html)
+    return html.strip() + "\n"
+
+
+# ─────────────────────────────────────────────
+# 사전 압축
+# ─────────────────────────────────────────────
+def compress_file(path: Path) -> dict:
+    """path 옆에 .gz (및 가능하면 .br) 파일을 쓰고 크기를 반환합니다."""
+    data = path.read_bytes()
+    sizes = {"raw": len(data)}
+
+    # mtime=0: 내용이 같으면 압축 파일도 바이트 단위로 같아 불필요한 git diff가 생기지 않음
+    gz = gzip.compress(data, compresslevel=9, mtime=0)
+    path.with_name(path.name + ".gz").write_bytes(gz)
+    sizes["gzip"] = len(gz)
+
+    if HAS_BROTLI:
+        br = brotli.compress(data, quality=11)
+        path.with_name(path.name + ".br").write_bytes(br)
+        sizes["brotli"] = len(br)
+    else:
+        # brotli가 없는 환경에서 다시 실행된 경우 이전 .br이 원본과 어긋나지 않도록 제거
+        path.with_name(path.name + ".br").unlink(missing_ok=True)
+    return sizes
+
+
+# ─────────────────────────────────────────────
+# 날짜 단위 후처리
+# ─────────────────────────────────────────────
+def postprocess_day(day_dir: Path, history: bool = True) -> dict:
+    """한 날짜의 출력물을 최소화/압축하고 크기 리포트를 기록합니다."""
+    day_dir = Path(day_dir)
+    report_path = day_dir / "size_report.json"
+    previous = json.loads(report_path.read_text(encoding="utf-8")).get("files", {}) if report_path.exists() else {}
+    files = {}
+
+    for name in COMPRESS_TARGETS:
+        path = day_dir / name
+        if not path.exists():
+            continue
+        original = path.stat().st_size
+        if name in MINIFY_TARGETS:
+            html = path.read_text(encoding="utf-8")
+            minified = minify_html(html)
+            if minified != html:
+                path.write_text(minified, encoding="utf-8")
+            elif previous.get(name, {}).get("minified") == original:
+                # 이미 최소화된 파일을 다시 처리하는 경우 최초 렌더링 크기를 유지
+                original = previous[name]["original"]
+        sizes = compress_file(path)
+        files[name] = {"original": original, "minified": sizes.pop("raw"), **sizes}
+
+    transfer_key = "brotli" if HAS_BROTLI else "gzip"
+    totals = {
+        "original": sum(f["original"] for f in files.values()),
+        "minified": sum(f["minified"] for f in files.values()),
+        "transfer": sum(f.get(transfer_key, f["minified"]) for f in files.values()),
+    }
+    report = {
+        "date": day_dir.name,
+        "generated_at": datetime.now().isoformat(timespec="seconds"),
+        "transfer_encoding": transfer_key,
+        "files": files,
+        "totals": totals,
+    }
+    report_path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    logger.info(
+        f"🗜️ 후처리 완료: {totals['original']:,}B → 최소화 {totals['minified']:,}B → 전송 {totals['transfer']:,}B ({transfer_key})"
+    )
+    if history:
+        _append_history(day_dir.parent, report)
+    return report
+
+
+def _append_history(output_root: Path, report: dict):
+    """날짜별 총 크기를 size_history.jsonl에 기록하고, 직전 날짜 대비 급증 시 경고합니다."""
+    history_path = output_root / SIZE_HISTORY
+    entries = {}
+    if history_path.exists():
+        for line in history_path.read_text(encoding="utf-8").splitlines():
+            if line.strip():
+                entry = json.loads(line)
+                entries[entry["date"]] = entry
+
+    entries[report["date"]] = {"date": report["date"], **report["totals"]}
+    dates = sorted(entries)
+    history_path.write_text(
+        "".join(json.dumps(entries[d], ensure_ascii=False) + "\n" for d in dates), encoding="utf-8"
+    )
+
+    position = dates.index(report["date"])
+    if position == 0:
+        return
+    previous, current = entries[dates[position - 1]], entries[report["date"]]
+    if previous.get("transfer") and current["transfer"] > previous["transfer"] * GROWTH_WARN_RATIO:
+        logger.warning(
+            f"⚠️ 전송 크기 급증: {previous['date']} {previous['transfer']:,}B → {current['date']} {current['transfer']:,}B"
+        )
+
+
+def record_history(output_root: Path, day_dir: Path):
+    """이미 작성된 size_report.json을 size_history.jsonl에 반영합니다."""
+    report_path = Path(day_dir) / "size_report.json"
+    if report_path.exists():
+        _append_history(Path(output_root), json.loads(report_path.read_text(encoding="utf-8")))
+
+
+def postprocess_archive(output_root: Path = OUTPUT_DIR) -> list:
+    """output/ 아래 모든 날짜를 후처리합니다."""
+    reports = []
+    for day_dir in sorted(d for d in Path(output_root).iterdir() if d.is_dir() and d.name[:4].isdigit()):
+        reports.append(postprocess_day(day_dir))
+    return reports
+
+
+if __name__ == "__main__":
+    from config import get_today_output_dir
+    from log_config import setup_logging
+
+    setup_logging()
+    postprocess_day(get_today_output_dir())
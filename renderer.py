@@ -0,0 +1,63 @@
+"""
+렌더링 엔진: templates/ 디렉토리의 Jinja2 템플릿을 미리 컴파일하여 재사용
+- 자동 HTML 이스케이프 (LLM 텍스트의 '<' 등이 페이지를 깨뜨리지 않음)
+- 공통 레이아웃/파셜 (_base.html, _fonts.html, css/*.css)
+- 컴파일된 템플릿은 프로세스 내 캐시 + 디스크 바이트코드 캐시(.cache/jinja)에 보관
+"""
+import logging
+from functools import lru_cache
+
+from config import CACHE_DIR, TEMPLATES_DIR
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1)
+def get_environment():
+    """템플릿 환경을 한 번만 생성합니다 (jinja2 import도 이 시점으로 지연)."""
+    from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
+
+    bytecode_dir = CACHE_DIR / "jinja"
+    bytecode_dir.mkdir(parents=True, exist_ok=True)
+
+    return Environment(
+        loader=FileSystemLoader(str(TEMPLATES_DIR)),
+        autoescape=select_autoescape(["html"]),
+        bytecode_cache=FileSystemBytecodeCache(str(bytecode_dir)),
+        # 배치 렌더링 중에는 템플릿 파일 변경을 다시 확인하지 않음
+        auto_reload=False,
+        trim_blocks=True,
+        lstrip_blocks=False,
+        keep_trailing_newline=True,
+        cache_size=-1,
+    )
+
+
+@lru_cache(maxsize=None)
+def get_template(name: str):
+    """컴파일된 템플릿을 반환합니다."""
+    return get_environment().get_template(name)
+
+
+def render(name: str, payload: dict) -> str:
+    """단일 페이로드를 렌더링합니다."""
+    return get_template(name).render(**payload)
+
+
+def render_many(name: str, payloads) -> list:
+    """여러 페이로드를 같은 컴파일된 템플릿으로 렌더링합니다."""
+    template = get_template(name)
+    return [template.render(**payload) for payload in payloads]
+
+
+@lru_cache(maxsize=1)
+def template_version() -> str:
+    """templates/ 전체 내용의 해시. 디자인이 바뀌면 값이 바뀌어 재렌더링 대상이 됩니다."""
+    import hashlib
+
+    digest = hashlib.sha256()
+    for path in sorted(TEMPLATES_DIR.rglob("*")):
+        if path.is_file():
+            digest.update(path.relative_to(TEMPLATES_DIR).as_posix().encode("utf-8"))
+            digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
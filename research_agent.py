@@ -1,98 +1,79 @@
 """
 리서치 에이전트: YouTube 채널 모니터링 및 트랜스크립트 추출
-- scrapetube로 최근 영상 목록 수집 (API 키 불필요)
+- 채널 Atom 피드(조건부 GET) 또는 scrapetube로 최근 영상 목록 수집 (API 키 불필요)
 - youtube-transcript-api로 자막 추출 (API 키 불필요)
 - 채널별 요약 마크다운 생성
 """
 import json
 import logging
-from datetime import datetime, timezone, timedelta
+import urllib.error
+from datetime import datetime
 from pathlib import Path
 
-import scrapetube
-from youtube_transcript_api import YouTubeTranscriptApi
-from youtube_transcript_api._errors import (
-    TranscriptsDisabled,
-    NoTranscriptFound,
-)
-
+from cassette import get_cassette, record_call, is_replaying
 from config import (
-    YOUTUBE_CHANNELS,
+    ADAPTIVE_SCHEDULE,
     HOURS_LOOKBACK,
     MAX_VIDEOS_PER_CHANNEL,
+    STREAM_TRANSCRIPTS,
     TRANSCRIPT_LANGUAGES,
     get_today_output_dir,
 )
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S",
-)
 logger = logging.getLogger(__name__)
 
 
 # ─────────────────────────────────────────────
 # 1. 최근 영상 수집
 # ─────────────────────────────────────────────
-def fetch_recent_videos(channel_handle: str, max_results: int = MAX_VIDEOS_PER_CHANNEL):
-    """scrapetube으로 채널의 최근 영상 목록을 가져옵니다."""
-    logger.info(f"📡 채널 스캔 중: {channel_handle}")
-    try:
-        # scrapetube는 채널 URL에서 직접 영상 목록을 가져옴
-        videos = scrapetube.get_channel(
-            channel_url=f"https://www.youtube.com/{channel_handle}",
-            limit=max_results,
-            sort_by="newest",
-        )
-        results = []
-        cutoff_time = datetime.now(timezone.utc) - timedelta(hours=HOURS_LOOKBACK)
+def fetch_recent_videos(channel_handle: str, max_results: int = MAX_VIDEOS_PER_CHANNEL,
+                        hours: int = HOURS_LOOKBACK, channel_id: str = None, raise_errors: bool = False):
+    """채널의 최근 영상 목록을 가져옵니다 (피드 → scrapetube 순서, video_discovery 참고).
 
-        for video in videos:
-            video_id = video.get("videoId", "")
-            title = video.get("title", {})
-            if isinstance(title, dict):
-                title = title.get("runs", [{}])[0].get("text", "제목 없음")
-
-            # 게시 시간 텍스트 파싱 (예: "1 hour ago", "3 hours ago", "1 day ago")
-            published_text = ""
-            time_text = video.get("publishedTimeText", {})
-            if isinstance(time_text, dict):
-                published_text = time_text.get("simpleText", "")
-
-            # 24시간 이내 판단
-            is_recent = _is_within_hours(published_text, HOURS_LOOKBACK)
-
-            if is_recent:
-                view_count = video.get("viewCountText", {})
-                if isinstance(view_count, dict):
-                    view_count = view_count.get("simpleText", "조회수 없음")
-
-                length_text = video.get("lengthText", {})
-                if isinstance(length_text, dict):
-                    length_text = length_text.get("simpleText", "")
-
-                results.append({
-                    "video_id": video_id,
-                    "title": title,
-                    "published_text": published_text,
-                    "view_count": view_count if isinstance(view_count, str) else "",
-                    "duration": length_text if isinstance(length_text, str) else "",
-                    "url": f"https://www.youtube.com/watch?v={video_id}",
-                })
+    raise_errors면 실패를 빈 목록으로 바꾸지 않고 예외를 그대로 올림 (작업 큐 재시도, 스캔 실패 기록용).
+    """
+    from video_discovery import discover_videos
 
+    logger.info(f"📡 채널 스캔 중: {channel_handle}")
+    try:
+        results = discover_videos({"handle": channel_handle, "channel_id": channel_id}, max_results, hours)
         logger.info(f"  → {len(results)}개 최근 영상 발견")
         return results
 
     except Exception as e:
         logger.error(f"  ❌ 채널 스캔 실패 ({channel_handle}): {e}")
+        if raise_errors:
+            raise
         return []
 
 
+_TRANSIENT_ERRORS = ("RequestBlocked", "IpBlocked", "YouTubeRequestFailed", "TooManyRequests",
+                     "ConnectionError", "ConnectTimeout", "ReadTimeout", "Timeout", "URLError", "timeout")
+
+
+def is_transient_error(e: Exception) -> bool:
+    """잠시 후 다시 시도하면 될 수 있는 오류인지 (네트워크, 429, 5xx)"""
+    code = getattr(e, "code", None)
+    if code is None:
+        code = getattr(getattr(e, "response", None), "status_code", None)
+    if isinstance(code, int):
+        return code == 429 or code >= 500
+    if isinstance(e, (ConnectionError, TimeoutError, urllib.error.URLError)):
+        return True
+    # 카세트 재생 시에는 ReplayedError.error_type에 원래 타입명이 담김
+    return getattr(e, "error_type", type(e).__name__) in _TRANSIENT_ERRORS or "429" in str(e)
+
+
 def _is_within_hours(published_text: str, hours: int) -> bool:
     """YouTube의 상대 시간 텍스트를 파싱하여 N시간 이내인지 판단합니다."""
+    age = parse_age_hours(published_text)
+    return age is not None and age <= hours
+
+
+def parse_age_hours(published_text: str):
+    """상대 시간 텍스트("3 hours ago", "2일 전")를 경과 시간(시간 단위)으로 바꿉니다. 알 수 없으면 None."""
     if not published_text:
-        return False
+        return None
 
     text = published_text.lower().strip()
 
@@ -102,53 +83,53 @@ def _is_within_hours(published_text: str, hours: int) -> bool:
 
     # 영어 패턴
     if "just now" in text or "moment" in text:
-        return True
+        return 0
     if "second" in text or "초" in text:
-        return True
+        return 0
     if "minute" in text or "분" in text:
-        return True
+        return 0
+
+    num = int("".join(c for c in text if c.isdigit()) or "0")
 
     # 시간 단위
     if "hour" in text or "시간" in text:
-        try:
-            num = int("".join(c for c in text if c.isdigit()) or "0")
-            return num <= hours
-        except ValueError:
-            return False
+        return num
 
     # 일 단위
     if "day" in text or "일" in text:
-        try:
-            num = int("".join(c for c in text if c.isdigit()) or "0")
-            return num * 24 <= hours
-        except ValueError:
-            return False
+        return num * 24
 
     # 주 단위
     if "week" in text or "주" in text:
-        try:
-            num = int("".join(c for c in text if c.isdigit()) or "0")
-            return num * 24 * 7 <= hours
-        except ValueError:
-            return False
+        return num * 24 * 7
 
-    return False
+    return None
 
 
 # ─────────────────────────────────────────────
 # 2. 트랜스크립트 추출
 # ─────────────────────────────────────────────
-def extract_transcript(video_id: str) -> dict:
-    """YouTube 영상의 자막(트랜스크립트)을 추출합니다."""
+_NO_TRANSCRIPT_ERRORS = ("TranscriptsDisabled", "NoTranscriptFound")
+
+
+def extract_transcript(video_id: str, path: Path = None, raise_transient: bool = False) -> dict:
+    """YouTube 영상의 자막(트랜스크립트)을 추출합니다.
+
+    path가 주어지면 자막을 합친 문자열을 만들지 않고 세그먼트를 파일로 바로 씁니다 (결과의 text는 비어 있음).
+    raise_transient면 네트워크/429/5xx 오류는 실패 결과 대신 예외로 올림 (작업 큐가 백오프 후 재시도).
+    """
     logger.info(f"  📝 트랜스크립트 추출 중: {video_id}")
     try:
-        ytt_api = YouTubeTranscriptApi()
-        transcript = ytt_api.fetch(
-            video_id,
-            languages=TRANSCRIPT_LANGUAGES,
-        )
-        full_text = " ".join([entry.text for entry in transcript])
-        duration_sec = max([e.start + e.duration for e in transcript], default=0)
+        transcript = record_call("transcript.fetch", video_id, lambda: _fetch_segments(video_id))
+        if path is not None:
+            from transcript_files import write_segments
+
+            stats = write_segments(path, transcript)
+            logger.info(f"    ✅ {stats['char_count']}자 저장 완료 (약 {int(stats['duration_minutes'])}분)")
+            return {"success": True, "text": "", "path": path, **stats}
+
+        full_text = " ".join([entry["text"] for entry in transcript])
+        duration_sec = max([e["start"] + e["duration"] for e in transcript], default=0)
 
         logger.info(f"    ✅ {len(full_text)}자 추출 완료 (약 {int(duration_sec // 60)}분)")
         return {
@@ -159,21 +140,81 @@ def extract_transcript(video_id: str) -> dict:
             "duration_minutes": round(duration_sec / 60, 1),
         }
 
-    except (TranscriptsDisabled, NoTranscriptFound) as e:
-        logger.warning(f"    ⚠️ 자막 없음 ({video_id}): {type(e).__name__}")
-        return {"success": False, "text": "", "error": str(e)}
-
     except Exception as e:
+        # youtube_transcript_api를 지연 로드하므로 예외 타입은 이름으로 판별
+        # (카세트 재생 시에는 ReplayedError.error_type에 원래 타입명이 담김)
+        error_type = getattr(e, "error_type", type(e).__name__)
+        if error_type in _NO_TRANSCRIPT_ERRORS:
+            logger.warning(f"    ⚠️ 자막 없음 ({video_id}): {error_type}")
+            return {"success": False, "text": "", "error": str(e)}
         logger.error(f"    ❌ 트랜스크립트 추출 실패 ({video_id}): {e}")
+        if raise_transient and is_transient_error(e):
+            raise
         return {"success": False, "text": "", "error": str(e)}
 
 
+def fill_transcript(video: dict, live=None, output_dir: Path = None, raise_transient: bool = False) -> dict:
+    """영상 dict에 자막을 채웁니다. 상시 실행 모드(live_store)가 이미 처리한 영상은 자막/요약을 재사용.
+
+    output_dir가 주어지면 자막은 output_dir/transcripts/에 파일로 저장하고 video에는 transcript_path만 남깁니다.
+    """
+    from transcript_files import adopt, portable_path, resolve_path, spill, transcript_file
+
+    entry = live.get(video["video_id"]) if live is not None else None
+    if entry and entry.get("transcript_path") and not resolve_path(entry["transcript_path"]).exists():
+        entry = None  # 자막 파일이 지워졌으면 다시 추출
+    if entry and entry.get("transcript_success"):
+        logger.info(f"  ♻️ 상시 실행 모드 자막 재사용: {video['video_id']}")
+        video["transcript_success"] = True
+        video["transcript_minutes"] = entry.get("transcript_minutes", 0.0)
+        if entry.get("summary"):
+            video["summary"] = entry["summary"]
+        if entry.get("transcript_path"):
+            # 상시 실행 모드가 쓴 파일(사이드카 포함)을 그대로 사용
+            video["transcript_path"] = entry["transcript_path"]
+            return adopt(video, output_dir) if output_dir is not None else video
+        video["transcript"] = entry.get("transcript", "")  # 자막 원문을 저장하던 예전 항목
+        return spill(video, output_dir) if output_dir is not None else video
+
+    path = transcript_file(output_dir, video["video_id"]) if output_dir is not None else None
+    transcript_result = extract_transcript(video["video_id"], path, raise_transient)
+    video["transcript_success"] = transcript_result.get("success", False)
+    video["transcript_minutes"] = transcript_result.get("duration_minutes", 0.0)
+    if transcript_result.get("path"):
+        video["transcript_path"] = portable_path(transcript_result["path"])
+    else:
+        video["transcript"] = transcript_result.get("text", "")
+    return video
+
+
+def _fetch_segments(video_id: str) -> list:
+    """youtube-transcript-api로 자막 세그먼트를 가져와 dict 리스트로 반환합니다."""
+    from youtube_transcript_api import YouTubeTranscriptApi
+
+    ytt_api = YouTubeTranscriptApi()
+    transcript = ytt_api.fetch(
+        video_id,
+        languages=TRANSCRIPT_LANGUAGES,
+    )
+    return [
+        {"text": entry.text, "start": entry.start, "duration": entry.duration}
+        for entry in transcript
+    ]
+
+
 # ─────────────────────────────────────────────
 # 3. 채널별 요약 마크다운 생성
 # ─────────────────────────────────────────────
-def generate_channel_summary(channel_info: dict, videos_data: list) -> str:
-    """채널의 수집된 영상 데이터를 마크다운 형식으로 정리합니다."""
-    lines = [
+def channel_slug(handle: str) -> str:
+    """채널 핸들을 파일명으로 쓸 수 있는 이름으로 변환합니다 (@ai.yeongseon → ai_yeongseon)."""
+    return handle.replace("@", "").replace(".", "_").replace("-", "_")
+
+
+def iter_channel_summary(channel_info: dict, videos_data: list):
+    """채널의 수집된 영상 데이터를 마크다운 조각으로 차례로 내보냅니다 (자막은 파일에서 조각 단위로 읽음)."""
+    from transcript_files import iter_text
+
+    yield "\n".join([
         f"# {channel_info['name']} ({channel_info['handle']})",
         f"",
         f"**수집 시각**: {datetime.now().strftime('%Y-%m-%d %H:%M')}",
@@ -182,45 +223,149 @@ def generate_channel_summary(channel_info: dict, videos_data: list) -> str:
         f"",
         "---",
         "",
-    ]
+    ]) + "\n"
 
     for i, video in enumerate(videos_data, 1):
-        lines.append(f"## {i}. {video['title']}")
-        lines.append(f"")
-        lines.append(f"- **URL**: {video['url']}")
-        lines.append(f"- **게시 시점**: {video.get('published_text', 'N/A')}")
-        lines.append(f"- **길이**: {video.get('duration', 'N/A')}")
-        lines.append(f"- **조회수**: {video.get('view_count', 'N/A')}")
-        lines.append(f"")
-
-        if video.get("transcript"):
-            lines.append(f"### 트랜스크립트")
-            lines.append(f"")
-            lines.append(video["transcript"])
-            lines.append(f"")
+        yield "\n".join([
+            f"## {i}. {video['title']}",
+            f"",
+            f"- **URL**: {video['url']}",
+            f"- **게시 시점**: {video.get('published_text', 'N/A')}",
+            f"- **길이**: {video.get('duration', 'N/A')}",
+            f"- **조회수**: {video.get('view_count', 'N/A')}",
+            f"",
+        ]) + "\n"
+
+        written = False
+        for chunk in iter_text(video):
+            if not written:
+                yield "### 트랜스크립트\n\n"
+                written = True
+            yield chunk
+        if written:
+            yield "\n\n"
         else:
-            lines.append(f"> ⚠️ 자막을 추출할 수 없습니다.")
-            lines.append(f"")
+            yield "> ⚠️ 자막을 추출할 수 없습니다.\n\n"
+
+        yield "---\n\n"
 
-        lines.append("---")
-        lines.append("")
 
-    return "\n".join(lines)
+def generate_channel_summary(channel_info: dict, videos_data: list) -> str:
+    """채널의 수집된 영상 데이터를 마크다운 형식으로 정리합니다."""
+    return "".join(iter_channel_summary(channel_info, videos_data))
 
 
 # ─────────────────────────────────────────────
 # 4. 메인 리서치 실행
 # ─────────────────────────────────────────────
-def run_research() -> dict:
-    """모든 채널에서 최근 영상을 수집하고 트랜스크립트를 추출합니다."""
-    output_dir = get_today_output_dir()
+def polite_delay():
+    """봇 탐지 회피를 위한 채널 간 랜덤 지연 (카세트 재생 시에는 불필요)"""
+    import time
+    import random
+
+    if not is_replaying():
+        time.sleep(random.uniform(2, 5))
+
+
+def add_channel_result(all_results: dict, channel: dict, videos: list, summary_dir: Path) -> dict:
+    """트랜스크립트까지 채워진 영상 목록으로 채널 요약 마크다운을 저장하고 결과에 추가합니다."""
+    if STREAM_TRANSCRIPTS:
+        # 작업 큐/상시 실행 모드에서 메모리로 받은 자막도 파일로 옮겨 결과에는 경로만 남김
+        from transcript_files import spill
+        for video in videos:
+            spill(video, summary_dir.parent)
+
+    summary_path = summary_dir / f"{channel_slug(channel['handle'])}.md"
+    with open(summary_path, "w", encoding="utf-8") as f:
+        f.writelines(iter_channel_summary(channel, videos))
+    logger.info(f"  💾 요약 저장: {summary_path.name}")
+
+    transcript_count = sum(1 for v in videos if v.get("transcript_success"))
+    channel_result = {
+        "name": channel["name"],
+        "handle": channel["handle"],
+        "videos_found": len(videos),
+        "transcripts_extracted": transcript_count,
+        "summary_file": str(summary_path),
+        "videos": [
+            {
+                "video_id": v.get("video_id", ""),
+                "published_at": v.get("published_at", ""),
+                "title": v["title"],
+                "url": v["url"],
+                "view_count": v.get("view_count", ""),
+                "duration": v.get("duration", ""),
+                "transcript_minutes": v.get("transcript_minutes", 0.0),
+                "has_transcript": v.get("transcript_success", False),
+                **({"transcript_path": v["transcript_path"]} if v.get("transcript_path")
+                   else {"transcript": v.get("transcript", "")}),
+                **({"summary": v["summary"]} if v.get("summary") else {}),
+            }
+            for v in videos
+        ],
+    }
+    all_results["channels"].append(channel_result)
+    all_results["total_videos"] += len(videos)
+    all_results["total_transcripts"] += transcript_count
+    return channel_result
+
+
+def run_research(channels: list = None, hours: int = HOURS_LOOKBACK,
+                 max_results: int = MAX_VIDEOS_PER_CHANNEL, output_dir: Path = None,
+                 shard: tuple = None, workers: int = 1, queue: Path = None, rescan: bool = False) -> dict:
+    """모든 채널에서 최근 영상을 수집하고 트랜스크립트를 추출합니다.
+
+    Args:
+        channels: 처리할 채널 목록 (기본: channels.csv 전체)
+        shard: (i, n)이면 n개로 나눈 채널 중 i번째 샤드만 처리하고
+            research_results.shard-i-of-n.json에 저장 (merge_shards()로 병합)
+        workers: 2 이상이면 채널을 workers개 샤드로 나눠 프로세스별로 수집 후 병합
+        queue: 작업 큐(SQLite) 경로. 지정하면 채널/영상 작업을 큐에 넣고 워커들과 함께 처리 후 수집
+        rescan: 작업 큐에 남은 같은 날짜의 작업을 지우고 처음부터 다시 스캔
+    """
+    from channel_registry import load_channels
+
+    output_dir = output_dir or get_today_output_dir()
+    scheduled = False
+    if channels is None:
+        channels = load_channels()
+        if ADAPTIVE_SCHEDULE and not is_replaying():
+            from channel_schedule import load_stats, plan_scan
+            channels = plan_scan(channels, load_stats(), hours, max_results)
+            scheduled = True
+
+    if queue is not None:
+        from research_queue import run_research_queued
+        results = run_research_queued(channels, hours, max_results, output_dir, queue_path=queue, workers=workers,
+                                      rescan=rescan)
+    elif shard is None and workers > 1:
+        results = _run_research_parallel(channels, hours, max_results, output_dir, workers)
+    else:
+        results = _scan_channels(channels, hours, max_results, output_dir, shard)
+
+    # 샤드 실행은 merge-shards에서 한 번에 통계를 갱신
+    if scheduled and shard is None:
+        from channel_schedule import update_channel_stats
+        update_channel_stats(results)
+    return results
+
+
+def _scan_channels(channels: list, hours: int, max_results: int, output_dir: Path, shard: tuple = None) -> dict:
+    """채널 목록을 순서대로 스캔하여 research_results.json(또는 샤드 파일)을 저장합니다."""
+    from channel_registry import shard_channels, shard_filename
+    from live_store import open_live_store
+
+    if shard is not None:
+        channels = shard_channels(channels, *shard)
     summary_dir = output_dir / "channel_summaries"
 
     logger.info("=" * 60)
     logger.info("🔍 리서치 에이전트 시작")
     logger.info(f"📅 날짜: {datetime.now().strftime('%Y-%m-%d %H:%M')}")
     logger.info(f"📂 출력 디렉토리: {output_dir}")
-    logger.info(f"🔎 최근 {HOURS_LOOKBACK}시간 이내 영상 수집")
+    logger.info(f"🔎 최근 {hours}시간 이내 영상 수집")
+    if shard is not None:
+        logger.info(f"🧩 샤드 {shard[0]}/{shard[1]}: {len(channels)}개 채널")
     logger.info("=" * 60)
 
     all_results = {
@@ -228,64 +373,44 @@ def run_research() -> dict:
         "channels": [],
         "total_videos": 0,
         "total_transcripts": 0,
+        "scanned": [ch["handle"] for ch in channels],
     }
 
-    for channel in YOUTUBE_CHANNELS:
+    live = open_live_store()
+    for channel in channels:
         logger.info(f"\n{'─' * 40}")
         logger.info(f"📺 {channel['name']}")
         logger.info(f"{'─' * 40}")
 
-        # 1. 최근 영상 수집
-        # 봇 탐지 회피를 위한 랜덤 지연
-        import time
-        import random
-        time.sleep(random.uniform(2, 5))
-        
-        videos = fetch_recent_videos(channel["handle"])
+        # 1. 최근 영상 수집 (적응형 일정이 있으면 채널별 조회 기간/깊이 사용)
+        scan = channel.get("scan", {})
+        channel_hours = scan.get("hours", hours)
+        polite_delay()
+        try:
+            videos = fetch_recent_videos(channel["handle"], max_results=scan.get("max_results", max_results),
+                                         hours=channel_hours, channel_id=channel.get("channel_id"), raise_errors=True)
+        except Exception:
+            # 실패한 스캔은 "새 영상 없음"으로 기록하지 않음 (적응형 일정의 게시 빈도가 잘못 낮아지지 않도록)
+            all_results["scanned"].remove(channel["handle"])
+            all_results.setdefault("failed_channels", []).append(channel["handle"])
+            continue
 
         if not videos:
-            logger.info(f"  ℹ️ 최근 {HOURS_LOOKBACK}시간 이내 새 영상 없음")
+            logger.info(f"  ℹ️ 최근 {channel_hours}시간 이내 새 영상 없음")
             continue
 
         # 2. 각 영상의 트랜스크립트 추출
-        videos_with_transcripts = []
         for video in videos:
-            transcript_result = extract_transcript(video["video_id"])
-            video["transcript"] = transcript_result.get("text", "")
-            video["transcript_success"] = transcript_result.get("success", False)
-            videos_with_transcripts.append(video)
-
-        # 3. 채널 요약 마크다운 생성 및 저장
-        summary_md = generate_channel_summary(channel, videos_with_transcripts)
-        safe_name = channel["handle"].replace("@", "").replace(".", "_").replace("-", "_")
-        summary_path = summary_dir / f"{safe_name}.md"
-        summary_path.write_text(summary_md, encoding="utf-8")
-        logger.info(f"  💾 요약 저장: {summary_path.name}")
-
-        # 통계 업데이트
-        transcript_count = sum(1 for v in videos_with_transcripts if v.get("transcript_success"))
-        channel_result = {
-            "name": channel["name"],
-            "handle": channel["handle"],
-            "videos_found": len(videos),
-            "transcripts_extracted": transcript_count,
-            "summary_file": str(summary_path),
-            "videos": [
-                {
-                    "title": v["title"],
-                    "url": v["url"],
-                    "has_transcript": v.get("transcript_success", False),
-                    "transcript": v.get("transcript", ""),
-                }
-                for v in videos_with_transcripts
-            ],
-        }
-        all_results["channels"].append(channel_result)
-        all_results["total_videos"] += len(videos)
-        all_results["total_transcripts"] += transcript_count
+            fill_transcript(video, live, output_dir if STREAM_TRANSCRIPTS else None)
+
+        # 3. 채널 요약 마크다운 생성 및 통계 업데이트
+        add_channel_result(all_results, channel, videos, summary_dir)
 
     # 결과 JSON 저장
     results_path = output_dir / "research_results.json"
+    if shard is not None:
+        all_results["shard"] = {"index": shard[0], "count": shard[1]}
+        results_path = output_dir / shard_filename(*shard)
     results_path.write_text(json.dumps(all_results, ensure_ascii=False, indent=2), encoding="utf-8")
 
     logger.info(f"\n{'=' * 60}")
@@ -297,14 +422,41 @@ def run_research() -> dict:
     return all_results
 
 
+def _run_research_parallel(channels: list, hours: int, max_results: int, output_dir: Path, workers: int) -> dict:
+    """채널을 workers개 샤드로 나눠 프로세스 풀에서 수집한 뒤 research_results.json으로 병합합니다."""
+    from concurrent.futures import ProcessPoolExecutor
+    from channel_registry import SHARD_PATTERN, merge_shards
+
+    if get_cassette() is not None:
+        # 카세트 파일은 한 프로세스에서만 기록/재생
+        logger.warning("⚠️ 카세트 모드에서는 병렬 수집을 사용하지 않습니다.")
+        return run_research(channels, hours, max_results, output_dir)
+
+    for stale in output_dir.glob(SHARD_PATTERN):
+        stale.unlink()
+
+    logger.info(f"🧩 {len(channels)}개 채널을 {workers}개 프로세스로 나눠 수집")
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(run_research, channels, hours, max_results, output_dir, (i, workers))
+            for i in range(1, workers + 1)
+        ]
+        for future in futures:
+            future.result()
+    return merge_shards(output_dir, channels=channels, cleanup=True)
+
+
 if __name__ == "__main__":
     import sys
+    from log_config import setup_logging
+
+    setup_logging()
 
     # --test 모드: 첫 번째 채널만 테스트
     if "--test" in sys.argv:
         logger.info("🧪 테스트 모드 - 첫 번째 채널만 실행")
-        from config import YOUTUBE_CHANNELS as channels
-        test_channel = channels[0]
+        from channel_registry import load_channels
+        test_channel = load_channels()[0]
         videos = fetch_recent_videos(test_channel["handle"], max_results=2)
         if videos:
             for v in videos:
@@ -314,6 +466,7 @@ if __name__ == "__main__":
         else:
             print("ℹ️ 최근 24시간 이내 영상 없음 - 최근 영상으로 테스트합니다")
             # 최근 영상이 없어도 채널의 가장 최근 영상으로 테스트
+            import scrapetube
             all_videos = scrapetube.get_channel(
                 channel_url=f"https://www.youtube.com/{test_channel['handle']}",
                 limit=1,
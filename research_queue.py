@@ -0,0 +1,173 @@
+"""
+리서치 작업 큐 연동: 채널/영상 단위 작업을 work_queue에 넣고 여러 워커가 나눠 처리
+- channel 작업: 최근 영상 목록 수집 → 영상마다 video 작업 추가
+- video 작업: 트랜스크립트 추출 (output_dir/transcripts/에 .txt/.seg로 저장하고 결과에는 경로만)
+- collect_results(): 완료된 작업 결과로 채널 요약과 research_results.json 생성 (run_research와 같은 형식)
+
+한 워커가 멈추거나 종료되어도 그 워커가 임대한 작업만 임대 만료 후 다른 워커가 다시 처리합니다.
+
+사용법:
+    python cli.py research --queue              # 작업 추가 + 이 프로세스도 워커로 참여 + 결과 수집
+    python cli.py research --queue --rescan     # 같은 날짜의 지난 작업을 지우고 처음부터 다시
+    python cli.py worker [--queue PATH]         # 같은 호스트의 다른 프로세스에서 같은 큐 처리
+"""
+import json
+import logging
+from datetime import datetime
+from pathlib import Path
+
+from config import HOURS_LOOKBACK, MAX_VIDEOS_PER_CHANNEL, STREAM_TRANSCRIPTS, WORK_QUEUE_PATH
+
+logger = logging.getLogger(__name__)
+
+
+# ─────────────────────────────────────────────
+# 작업 처리기
+# ─────────────────────────────────────────────
+def handle_channel(job, queue) -> dict:
+    """일시적 오류(네트워크, 429, 5xx)는 예외로 올려 임대/백오프 재시도에 맡기고,
+    그 밖의 실패는 "error"를 담아 완료 처리합니다 (collect_results에서 실패 채널로 분류)."""
+    from research_agent import fetch_recent_videos, is_transient_error, polite_delay
+
+    channel = job.payload["channel"]
+    scan = channel.get("scan", {})
+    polite_delay()
+    try:
+        videos = fetch_recent_videos(
+            channel["handle"],
+            max_results=scan.get("max_results", job.payload.get("max_results", MAX_VIDEOS_PER_CHANNEL)),
+            hours=scan.get("hours", job.payload.get("hours", HOURS_LOOKBACK)),
+            channel_id=channel.get("channel_id"),
+            raise_errors=True,
+        )
+    except Exception as e:
+        if is_transient_error(e):
+            raise
+        return {"videos": [], "error": str(e)}
+    for video in videos:
+        queue.enqueue(job.run, "video", f"video:{video['video_id']}",
+                      {"video": video, "handle": channel["handle"], "output_dir": job.payload.get("output_dir")})
+    return {"videos": videos}
+
+
+def handle_video(job, queue) -> dict:
+    from live_store import open_live_store
+    from research_agent import fill_transcript
+
+    # 자막은 워커가 바로 파일(.txt + 시각 사이드카 .seg)로 쓰고 결과 행에는 경로만 남김
+    # 일시적 오류는 예외로 올라와 작업 큐가 재시도, 자막 없음 등은 transcript_success=False로 완료
+    output_dir = job.payload.get("output_dir")
+    output_dir = Path(output_dir) if output_dir and STREAM_TRANSCRIPTS else None
+    video = fill_transcript(dict(job.payload["video"]), open_live_store(), output_dir, raise_transient=True)
+    return {"path": video.get("transcript_path"), "text": video.get("transcript", ""),
+            "success": video["transcript_success"], "minutes": video.get("transcript_minutes", 0.0),
+            "summary": video.get("summary", "")}
+
+
+HANDLERS = {"channel": handle_channel, "video": handle_video}
+
+
+# ─────────────────────────────────────────────
+# 작업 추가 / 워커 / 결과 수집
+# ─────────────────────────────────────────────
+def enqueue_channels(queue, run: str, channels: list, hours: int = HOURS_LOOKBACK,
+                     max_results: int = MAX_VIDEOS_PER_CHANNEL, output_dir: Path = None) -> int:
+    added = 0
+    output_dir = str(Path(output_dir).resolve()) if output_dir is not None else None
+    for channel in channels:
+        payload = {"channel": channel, "hours": hours, "max_results": max_results, "output_dir": output_dir}
+        added += queue.enqueue(run, "channel", f"channel:{channel['handle']}", payload)
+    logger.info(f"📥 작업 큐에 채널 {added}개 추가 (기존 {len(channels) - added}개) - run {run}")
+    return added
+
+
+def run_queue_worker(run: str = None, queue_path=WORK_QUEUE_PATH, stop_when_drained: bool = True) -> dict:
+    """큐의 채널/영상 작업을 처리합니다 (같은 호스트의 별도 프로세스에서 실행 가능)."""
+    from work_queue import WorkQueue, run_worker
+
+    with WorkQueue(queue_path) as queue:
+        return run_worker(queue, run, HANDLERS, stop_when_drained=stop_when_drained)
+
+
+def collect_results(queue, run: str, output_dir: Path, channels: list) -> dict:
+    """완료된 작업 결과를 모아 research_results.json을 만듭니다."""
+    from research_agent import add_channel_result
+
+    summary_dir = output_dir / "channel_summaries"
+    summary_dir.mkdir(parents=True, exist_ok=True)
+    channel_jobs = {job["payload"]["channel"]["handle"]: job for job in queue.results(run, "channel")}
+    video_jobs = {job["key"]: job for job in queue.results(run, "video")}
+
+    all_results = {
+        "date": datetime.now().strftime("%Y-%m-%d"),
+        "channels": [],
+        "total_videos": 0,
+        "total_transcripts": 0,
+        "scanned": [],
+    }
+    failed = []
+    for channel in channels:
+        job = channel_jobs.get(channel["handle"])
+        error = (job["result"] or {}).get("error") if job else None
+        if job is None or job["status"] != "done" or error:
+            failed.append(channel["handle"])
+            reason = (job["error"] or error) if job else "작업 없음"
+            logger.warning(f"⚠️ 채널 작업 미완료: {channel['handle']} ({reason})")
+            continue
+        all_results["scanned"].append(channel["handle"])
+        videos = job["result"]["videos"]
+        if not videos:
+            continue
+        for video in videos:
+            video_job = video_jobs.get(f"video:{video['video_id']}")
+            transcript = (video_job or {}).get("result") or {}
+            if transcript.get("path"):
+                video["transcript_path"] = transcript["path"]
+            else:
+                video["transcript"] = transcript.get("text", "")
+            video["transcript_success"] = transcript.get("success", False)
+            video["transcript_minutes"] = transcript.get("minutes", 0.0)
+            if transcript.get("summary"):
+                video["summary"] = transcript["summary"]
+        add_channel_result(all_results, channel, videos, summary_dir)
+
+    if failed:
+        all_results["failed_channels"] = failed
+    results_path = output_dir / "research_results.json"
+    results_path.write_text(json.dumps(all_results, ensure_ascii=False, indent=2), encoding="utf-8")
+    logger.info(
+        f"✅ 작업 큐 결과 수집: {len(all_results['channels'])}개 채널 / {all_results['total_videos']}개 영상"
+        + (f" (미완료 채널 {len(failed)}개)" if failed else "")
+    )
+    return all_results
+
+
+def run_research_queued(channels: list, hours: int, max_results: int, output_dir: Path,
+                        queue_path=WORK_QUEUE_PATH, workers: int = 1, rescan: bool = False) -> dict:
+    """채널 작업을 큐에 넣고, 이 프로세스(+ workers-1개 보조 프로세스)도 워커로 참여한 뒤 결과를 수집합니다.
+
+    같은 호스트의 다른 `cli.py worker` 프로세스가 같은 큐를 처리하고 있어도 됩니다.
+    run은 날짜라 같은 날 다시 실행하면 끝난 작업을 그대로 모으므로, 다시 스캔하려면 rescan=True.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    from work_queue import WorkQueue, run_worker
+
+    run = output_dir.name
+    with WorkQueue(queue_path) as queue:
+        if rescan:
+            logger.info(f"🧹 작업 큐의 지난 작업 {queue.clear(run)}개 삭제 - run {run}")
+        enqueue_channels(queue, run, channels, hours, max_results, output_dir)
+
+        helpers = None
+        if workers > 1:
+            helpers = ProcessPoolExecutor(max_workers=workers - 1)
+            for _ in range(workers - 1):
+                helpers.submit(run_queue_worker, run, queue_path)
+        try:
+            run_worker(queue, run, HANDLERS)
+        finally:
+            if helpers is not None:
+                helpers.shutdown(wait=True)
+
+        logger.info(f"📊 작업 큐 상태 ({run}): {queue.counts(run)}")
+        return collect_results(queue, run, output_dir, channels)
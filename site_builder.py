@@ -0,0 +1,289 @@
+"""
+정적 사이트 빌더: output/ 날짜별 결과 → docs/ (GitHub Pages)
+- docs/index.html: 최신 다이제스트 + 최근 아카이브
+- docs/archive/page-N.html: 페이지 번호는 가장 오래된 날짜부터 고정 (새 날짜는 마지막 페이지에만 추가)
+- docs/days/YYYY-MM-DD/: 날짜별 페이지와 산출물 복사본
+- docs/channels/<slug>.html: 채널별 페이지 (channels/<slug>.json에 항목 누적)
+
+증분 빌드:
+- 기본적으로 docs/days/에 없는 새 날짜(와 --day로 지정한 날짜)만 처리하므로
+  아카이브가 커져도 하루 추가 비용은 일정합니다.
+- 모든 파일은 내용 해시가 다를 때만 다시 씁니다 (git diff에는 실제로 바뀐 파일만 남음).
+"""
+import hashlib
+import json
+import logging
+from pathlib import Path
+
+from config import BASE_DIR, OUTPUT_DIR
+
+logger = logging.getLogger(__name__)
+
+DOCS_DIR = BASE_DIR / "docs"
+PAGE_SIZE = 30
+
+# output/<date>/ 원본 → docs/days/<date>/ 복사본
+DAY_ARTIFACTS = {
+    "slides.html": "slides.html",
+    "infographic.html": "infographic.html",
+    "combined_summary.md": "summary.md",
+    "podcast_script.md": "podcast.md",
+}
+
+
+# ─────────────────────────────────────────────
+# 파일 쓰기 헬퍼
+# ─────────────────────────────────────────────
+def _digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def write_if_changed(path: Path, content) -> bool:
+    """내용이 다를 때만 파일을 씁니다. 실제로 썼으면 True."""
+    data = content.encode("utf-8") if isinstance(content, str) else content
+    if path.exists() and path.stat().st_size == len(data) and _digest(path.read_bytes()) == _digest(data):
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return True
+
+
+def _read_json(path: Path, default=None):
+    if not path.exists():
+        return default
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return default
+
+
+def _dump_json(data) -> str:
+    return json.dumps(data, ensure_ascii=False, indent=2, sort_keys=True) + "\n"
+
+
+# ─────────────────────────────────────────────
+# 날짜 메타데이터
+# ─────────────────────────────────────────────
+def _source_fingerprint(day_dir: Path) -> str:
+    """날짜 원본 파일들의 내용 해시 (mtime은 git checkout마다 바뀌므로 사용하지 않음)."""
+    digest = hashlib.sha256()
+    for name in sorted(list(DAY_ARTIFACTS) + ["research_results.json", "infographic_data.json"]):
+        path = day_dir / name
+        if path.exists():
+            digest.update(name.encode("utf-8"))
+            digest.update(_digest(path.read_bytes()).encode("ascii"))
+    return digest.hexdigest()[:16]
+
+
+def build_day_meta(day_dir: Path) -> dict:
+    """output/<date>/ 원본에서 사이트에 필요한 요약 정보만 추출합니다."""
+    from research_agent import channel_slug
+
+    research = _read_json(day_dir / "research_results.json", {})
+    infographic = _read_json(day_dir / "infographic_data.json", {})
+
+    channels = []
+    for ch in research.get("channels", []):
+        channels.append({
+            "name": ch.get("name", ch.get("handle", "")),
+            "handle": ch.get("handle", ""),
+            "slug": channel_slug(ch.get("handle", "")),
+            "videos": [
+                {
+                    "title": v.get("title", ""),
+                    "url": v.get("url", ""),
+                    "has_transcript": bool(v.get("has_transcript")),
+                }
+                for v in ch.get("videos", [])
+            ],
+        })
+
+    return {
+        "date": day_dir.name,
+        "fingerprint": _source_fingerprint(day_dir),
+        "headline": infographic.get("headline", ""),
+        "total_videos": research.get("total_videos", 0),
+        "channel_count": len(channels),
+        "channels": channels,
+        "artifacts": sorted(dst for src, dst in DAY_ARTIFACTS.items() if (day_dir / src).exists()),
+    }
+
+
+# ─────────────────────────────────────────────
+# 사이트 빌더
+# ─────────────────────────────────────────────
+class SiteBuilder:
+    """output/ → docs/ 증분 빌더"""
+
+    def __init__(self, output_root: Path = OUTPUT_DIR, docs_dir: Path = DOCS_DIR, page_size: int = PAGE_SIZE):
+        self.output_root = Path(output_root)
+        self.docs_dir = Path(docs_dir)
+        self.page_size = page_size
+        self.written = []
+
+    # ── 경로 ──
+    def _day_doc_dir(self, date: str) -> Path:
+        return self.docs_dir / "days" / date
+
+    def _write(self, path: Path, content) -> None:
+        if write_if_changed(path, content):
+            self.written.append(path)
+
+    def source_days(self) -> list:
+        if not self.output_root.exists():
+            return []
+        return sorted(d.name for d in self.output_root.iterdir() if d.is_dir() and d.name[:4].isdigit())
+
+    def built_days(self) -> list:
+        days_dir = self.docs_dir / "days"
+        if not days_dir.exists():
+            return []
+        return sorted(d.name for d in days_dir.iterdir() if (d / "meta.json").exists())
+
+    # ── 빌드 ──
+    def build(self, days: list = None, rescan: bool = False) -> dict:
+        """새 날짜(+ 지정 날짜)만 빌드합니다. rescan=True면 모든 날짜의 원본 해시를 확인합니다."""
+        sources = self.source_days()
+        built = set(self.built_days())
+
+        candidates = set(days or []) | (set(sources) - built)
+        if rescan:
+            candidates |= set(sources)
+
+        changed = []
+        for date in sorted(candidates):
+            day_dir = self.output_root / date
+            if not day_dir.is_dir():
+                logger.warning(f"⚠️ 출력 디렉토리 없음: {day_dir}")
+                continue
+            meta = build_day_meta(day_dir)
+            previous = _read_json(self._day_doc_dir(date) / "meta.json")
+            if previous and previous.get("fingerprint") == meta["fingerprint"]:
+                continue
+            self._build_day(day_dir, meta, previous)
+            changed.append(meta)
+
+        all_days = sorted(built | {m["date"] for m in changed})
+        if changed or not (self.docs_dir / "index.html").exists():
+            self._build_archive(all_days, {m["date"] for m in changed})
+            self._build_redirects()
+
+        logger.info(f"🌐 사이트 빌드: {len(changed)}일 갱신, {len(self.written)}개 파일 기록 (전체 {len(all_days)}일)")
+        return {
+            "changed_days": [m["date"] for m in changed],
+            "written": [str(p.relative_to(self.docs_dir)) for p in self.written],
+            "total_days": len(all_days),
+        }
+
+    def _build_day(self, day_dir: Path, meta: dict, previous: dict = None):
+        from renderer import render
+
+        target = self._day_doc_dir(meta["date"])
+        for src, dst in DAY_ARTIFACTS.items():
+            if (day_dir / src).exists():
+                self._write(target / dst, (day_dir / src).read_bytes())
+
+        self._write(target / "index.html", render("site/day.html", {
+            "root": "../../",
+            "day_root": "",
+            "day": meta,
+        }))
+        self._write(target / "meta.json", _dump_json(meta))
+
+        # 이 날짜에 등장한 채널(+ 이전 빌드에 있었던 채널)만 채널 페이지 갱신
+        touched = {ch["slug"]: ch for ch in (previous or {}).get("channels", [])}
+        touched.update({ch["slug"]: ch for ch in meta["channels"]})
+        current = {ch["slug"] for ch in meta["channels"]}
+        for slug, ch in touched.items():
+            self._update_channel(ch, meta["date"], ch if slug in current else None)
+
+    def _update_channel(self, channel: dict, date: str, day_entry: dict = None):
+        from renderer import render
+
+        index_path = self.docs_dir / "channels" / f"{channel['slug']}.json"
+        index = _read_json(index_path, {"name": channel["name"], "handle": channel["handle"], "entries": []})
+        entries = [e for e in index["entries"] if e["date"] != date]
+        if day_entry is not None:
+            entries.append({"date": date, "videos": day_entry["videos"]})
+        entries.sort(key=lambda e: e["date"], reverse=True)
+        index.update({"name": channel["name"], "handle": channel["handle"], "entries": entries})
+
+        self._write(index_path, _dump_json(index))
+
+        names_path = self.docs_dir / "channels" / "_index.json"
+        names = _read_json(names_path, {})
+        if entries:
+            names[channel["slug"]] = channel["name"]
+        else:
+            names.pop(channel["slug"], None)
+        self._write(names_path, _dump_json(names))
+        self._write(self.docs_dir / "channels" / f"{channel['slug']}.html", render("site/channel.html", {
+            "root": "../",
+            "channel": index,
+            "entries": entries,
+        }))
+
+    def _page_of(self, position: int) -> int:
+        return position // self.page_size + 1
+
+    def _load_metas(self, dates: list) -> list:
+        metas = [_read_json(self._day_doc_dir(d) / "meta.json") for d in dates]
+        return [m for m in metas if m]
+
+    def _build_archive(self, all_days: list, changed: set):
+        """변경된 날짜가 속한 아카이브 페이지와 index.html만 다시 만듭니다."""
+        from renderer import render
+
+        page_count = max(1, -(-len(all_days) // self.page_size))
+        positions = {d: i for i, d in enumerate(all_days)}
+        pages = {self._page_of(positions[d]) for d in changed if d in positions}
+        # 페이지 수가 늘어나면 이전 마지막 페이지의 페이저도 갱신
+        pages.add(page_count)
+        if page_count > 1:
+            pages.add(page_count - 1)
+
+        for page in sorted(pages):
+            dates = all_days[(page - 1) * self.page_size: page * self.page_size]
+            self._write(self.docs_dir / "archive" / f"page-{page}.html", render("site/archive.html", {
+                "root": "../",
+                "days": list(reversed(self._load_metas(dates))),
+                "page": page,
+                "page_count": page_count,
+            }))
+
+        recent = list(reversed(self._load_metas(all_days[-self.page_size:])))
+        channel_names = _read_json(self.docs_dir / "channels" / "_index.json", {})
+        channels = sorted(
+            ({"slug": slug, "name": name} for slug, name in channel_names.items()),
+            key=lambda ch: ch["name"],
+        )
+        latest = recent[0] if recent else None
+
+        self._write(self.docs_dir / "index.html", render("site/index.html", {
+            "root": "",
+            "day_root": f"days/{latest['date']}/" if latest else "",
+            "latest": latest,
+            "days": recent,
+            "page": page_count,
+            "page_count": page_count,
+            "channels": channels,
+        }))
+
+    def _build_redirects(self):
+        """예전 고정 링크(slides.html 등)는 한 번만 만들어지는 리다이렉트 페이지로 유지합니다."""
+        from renderer import render
+
+        for name in ("slides.html", "infographic.html"):
+            self._write(self.docs_dir / name, render("site/redirect.html", {"root": "", "target": "index.html"}))
+
+
+def build_site(days: list = None, rescan: bool = False, output_root: Path = OUTPUT_DIR, docs_dir: Path = DOCS_DIR) -> dict:
+    """docs/ 사이트를 증분 빌드합니다."""
+    return SiteBuilder(output_root, docs_dir).build(days=days, rescan=rescan)
+
+
+if __name__ == "__main__":
+    from log_config import setup_logging
+
+    setup_logging()
+    build_site()
@@ -1,140 +1,61 @@
 """
-슬라이드 생성기: JSON 데이터 → Reveal.js HTML 슬라이드
+슬라이드 생성기: JSON 데이터 → Reveal.js HTML 슬라이드 (templates/slides.html)
 """
 import json
 import logging
 from pathlib import Path
 from datetime import datetime
 
-from config import get_today_output_dir
+from config import BUNDLE_ASSETS, get_today_output_dir
+from renderer import render, render_many
 
 logger = logging.getLogger(__name__)
 
-REVEAL_TEMPLATE = """<!DOCTYPE html>
-<html lang="ko">
-<head>
-    <meta charset="utf-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title}</title>
-    <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/reveal.js@5.1.0/dist/reveal.css">
-    <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/reveal.js@5.1.0/dist/theme/night.css">
-    <style>
-        @import url('https://fonts.googleapis.com/css2?family=Noto+Sans+KR:wght@300;400;700;900&display=swap');
-        
-        :root {{
-            --r-main-font: 'Noto Sans KR', sans-serif;
-            --r-heading-font: 'Noto Sans KR', sans-serif;
-            --r-main-color: #e8e8e8;
-            --r-heading-color: #ffffff;
-            --r-link-color: #64b5f6;
-            --accent-gradient: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            --accent-blue: #42a5f5;
-            --accent-purple: #ab47bc;
-            --accent-green: #66bb6a;
-        }}
-        
-        .reveal {{
-            font-family: var(--r-main-font);
-        }}
-        
-        .reveal .slides section {{
-            text-align: left;
-            padding: 40px;
-        }}
-        
-        .reveal h1 {{
-            font-size: 2.2em;
-            font-weight: 900;
-            background: var(--accent-gradient);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-            margin-bottom: 0.3em;
-        }}
-        
-        .reveal h2 {{
-            font-size: 1.6em;
-            font-weight: 700;
-            color: var(--accent-blue);
-            border-bottom: 2px solid rgba(100, 181, 246, 0.3);
-            padding-bottom: 10px;
-            margin-bottom: 30px;
-        }}
-        
-        .reveal h3 {{
-            font-size: 1.2em;
-            color: var(--accent-purple);
-        }}
-        
-        .reveal ul {{
-            list-style: none;
-            padding: 0;
-        }}
-        
-        .reveal ul li {{
-            padding: 8px 0 8px 30px;
-            position: relative;
-            font-size: 0.85em;
-            line-height: 1.6;
-        }}
-        
-        .reveal ul li::before {{
-            content: '▸';
-            position: absolute;
-            left: 8px;
-            color: var(--accent-blue);
-            font-weight: bold;
-        }}
-        
-        .title-slide h1 {{
-            font-size: 2.8em;
-            text-align: center;
-        }}
-        
-        .title-slide .date {{
-            text-align: center;
-            color: rgba(255,255,255,0.6);
-            font-size: 1.1em;
-            margin-top: 20px;
-        }}
-        
-        .slide-number {{
-            font-family: 'Noto Sans KR', sans-serif !important;
-            font-size: 14px !important;
-            color: rgba(255,255,255,0.4) !important;
-        }}
-        
-        .speaker-notes {{
-            display: none;
-        }}
-    </style>
-</head>
-<body>
-    <div class="reveal">
-        <div class="slides">
-{slides_html}
-        </div>
-    </div>
-    <script src="https://cdn.jsdelivr.net/npm/reveal.js@5.1.0/dist/reveal.js"></script>
-    <script>
-        Reveal.initialize({{
-            hash: true,
-            slideNumber: true,
-            transition: 'slide',
-            backgroundTransition: 'fade',
-            center: false,
-            width: 1280,
-            height: 720,
-        }});
-    </script>
-</body>
-</html>
-"""
+SLIDES_TEMPLATE = "slides.html"
+
+
+def build_slides_context(slides_data: dict) -> dict:
+    """슬라이드 데이터를 템플릿 컨텍스트로 정규화합니다."""
+    return {
+        "title": slides_data.get("title", "AI/테크 데일리"),
+        "date": slides_data.get("date", datetime.now().strftime("%Y년 %m월 %d일")),
+        "slides": [
+            {
+                "title": slide.get("title", ""),
+                "content": slide.get("content", []),
+                "notes": slide.get("notes", ""),
+            }
+            for slide in slides_data.get("slides", [])
+        ],
+    }
+
+
+def render_slides_html(slides_data: dict, bundle: bool = BUNDLE_ASSETS) -> str:
+    """슬라이드 데이터 하나를 HTML 문자열로 렌더링합니다.
 
+    bundle=True면 reveal.js와 서브셋 폰트를 인라인한 단일 파일로 만듭니다 (vendor/ 필요).
+    """
+    context = build_slides_context(slides_data)
+    html = render(SLIDES_TEMPLATE, context)
+    if bundle:
+        from asset_bundler import build_bundle
 
-def generate_slides_html(slides_data: dict = None) -> str:
+        assets = build_bundle(html, reveal=True)
+        if assets:
+            html = render(SLIDES_TEMPLATE, {**context, "bundle": assets})
+    return html
+
+
+def render_slides_many(payloads, bundle: bool = BUNDLE_ASSETS) -> list:
+    """여러 날짜의 슬라이드 데이터를 같은 컴파일된 템플릿으로 렌더링합니다."""
+    if bundle:
+        return [render_slides_html(p, bundle=True) for p in payloads]
+    return render_many(SLIDES_TEMPLATE, (build_slides_context(p) for p in payloads))
+
+
+def generate_slides_html(slides_data: dict = None, output_dir: Path = None) -> str:
     """슬라이드 데이터를 Reveal.js HTML로 변환합니다."""
-    output_dir = get_today_output_dir()
+    output_dir = output_dir or get_today_output_dir()
 
     if slides_data is None:
         json_path = output_dir / "slides_data.json"
@@ -144,47 +65,7 @@ def generate_slides_html(slides_data: dict = None) -> str:
             logger.error("❌ slides_data.json이 없습니다.")
             return ""
 
-    title = slides_data.get("title", "AI/테크 데일리")
-    date = slides_data.get("date", datetime.now().strftime("%Y년 %m월 %d일"))
-    slides = slides_data.get("slides", [])
-
-    slides_html_parts = []
-
-    # 타이틀 슬라이드
-    slides_html_parts.append(f"""
-            <section class="title-slide">
-                <h1>{title}</h1>
-                <div class="date">{date}</div>
-            </section>""")
-
-    # 콘텐츠 슬라이드
-    for slide in slides:
-        slide_title = slide.get("title", "")
-        content = slide.get("content", [])
-        notes = slide.get("notes", "")
-
-        items_html = "\n".join(f"                        <li>{item}</li>" for item in content)
-
-        slides_html_parts.append(f"""
-            <section>
-                <h2>{slide_title}</h2>
-                <ul>
-{items_html}
-                </ul>
-                <aside class="notes">{notes}</aside>
-            </section>""")
-
-    # 엔딩 슬라이드
-    slides_html_parts.append(f"""
-            <section class="title-slide">
-                <h1>감사합니다</h1>
-                <div class="date">AI/테크 데일리 종합 | {date}</div>
-            </section>""")
-
-    full_html = REVEAL_TEMPLATE.format(
-        title=title,
-        slides_html="\n".join(slides_html_parts),
-    )
+    full_html = render_slides_html(slides_data)
 
     # HTML 파일 저장
     html_path = output_dir / "slides.html"
@@ -195,6 +76,9 @@ def generate_slides_html(slides_data: dict = None) -> str:
 
 
 if __name__ == "__main__":
+    from log_config import setup_logging
+
+    setup_logging()
     path = generate_slides_html()
     if path:
         print(f"✅ 슬라이드 생성 완료: {path}")
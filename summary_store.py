@@ -0,0 +1,88 @@
+"""
+영상별 요약 저장소: video_id + 자막 해시 기준으로 3줄 요약과 핵심 사실을 보관
+- output/video_summaries.json (날짜별 결과와 함께 커밋되어 다음 실행/재종합에서 재사용)
+- 자막이 같으면 LLM을 다시 호출하지 않고, 새 영상이나 자막이 바뀐 영상만 다시 분석
+- 긴 자막은 시간/문장 경계로 나눠 구간별로 병렬 요약한 뒤 하나로 합침 (synthesis_agent.analyze_chunks)
+- 실패한 요약(API 키 없음, 사용량 초과 등)은 저장하지 않으므로 다음 실행에서 재시도
+- 종합 보고서(combined_summary.md)는 이 항목들로 구성 (synthesis_agent.build_combined_summary)
+"""
+import json
+import logging
+import os
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from cassette import is_replaying
+from config import VIDEO_SUMMARIES_PATH
+
+logger = logging.getLogger(__name__)
+
+RETENTION_DAYS = 90
+
+
+class SummaryStore:
+    def __init__(self, path: Path = VIDEO_SUMMARIES_PATH):
+        self.path = Path(path)
+        self.entries = {}
+        self.hits = self.misses = 0
+        self._dirty = False
+        if self.path.exists():
+            try:
+                self.entries = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                logger.warning(f"⚠️ 영상 요약 저장소를 읽을 수 없어 새로 시작합니다: {self.path}")
+
+    def get(self, video_id: str, digest: str):
+        entry = self.entries.get(video_id)
+        return entry if entry and entry.get("transcript_hash") == digest else None
+
+    def put(self, video_id: str, entry: dict):
+        self.entries[video_id] = entry
+        self._dirty = True
+
+    def summarize(self, video: dict, model) -> dict:
+        """video(자막 포함)의 요약 항목. 저장된 항목이 없거나 자막이 바뀌었을 때만 LLM 호출.
+
+        반환값의 "ok"가 False면 요약 실패(저장하지 않음)이고 summary에는 실패 안내 문구가 담깁니다.
+        """
+        from synthesis_agent import ANALYZE_CHARS, analyze_chunks
+        from transcript_files import iter_chunks, text_hash
+
+        # 해시는 자막 파일을 조각 단위로 읽어 계산하고, LLM에는 시간(또는 문장) 경계로 나눈 구간을 보냄
+        digest = text_hash(video)
+        entry = self.get(video["video_id"], digest)
+        if entry is not None:
+            self.hits += 1
+            return {**entry, "ok": True}
+
+        self.misses += 1
+        analysis = analyze_chunks(list(iter_chunks(video, ANALYZE_CHARS)), model)
+        entry = {
+            "transcript_hash": digest,
+            "title": video.get("title", ""),
+            "url": video.get("url", ""),
+            "published_at": video.get("published_at", ""),
+            "summary": analysis["summary"],
+            "facts": analysis["facts"],
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+        }
+        if analysis["ok"]:
+            self.put(video["video_id"], entry)
+        return {**entry, "ok": analysis["ok"]}
+
+    def prune(self, now: datetime = None):
+        cutoff = ((now or datetime.now()) - timedelta(days=RETENTION_DAYS)).isoformat(timespec="seconds")
+        for video_id in [vid for vid, e in self.entries.items() if e.get("created_at", "") < cutoff]:
+            del self.entries[video_id]
+            self._dirty = True
+
+    def save(self):
+        """변경이 있을 때만 저장합니다 (카세트 재생 중에는 저장하지 않음)."""
+        self.prune()
+        if not self._dirty or is_replaying():
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(self.entries, ensure_ascii=False, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        os.replace(tmp, self.path)
+        self._dirty = False
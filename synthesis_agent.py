@@ -1,81 +1,166 @@
 """
 종합 에이전트: 리서치 결과를 통합하여 NotebookLM에 전달하고 콘텐츠 생성
-- 채널별 요약을 하나의 종합 보고서로 통합
+- 영상별 요약/핵심 사실(summary_store, 새 영상만 LLM 호출)을 하나의 종합 보고서로 통합
 - Gemini API로 팟캐스트 스크립트 생성
 - 슬라이드/인포그래픽 데이터 구조화
 """
+import importlib.util
 import json
 import logging
-from datetime import datetime
+import os
+import time
+from datetime import date, datetime
+from itertools import chain
 from pathlib import Path
 
-try:
-    import google.generativeai as genai
-    HAS_GEMINI = True
-except ImportError:
-    HAS_GEMINI = False
-
-from config import GEMINI_API_KEY, GEMINI_MODEL, get_today_output_dir
-
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S",
+from cassette import CassetteMiss, get_cassette
+from config import (
+    CHUNKED_SUMMARY, GEMINI_API_KEY, GEMINI_MODEL, INFOGRAPHIC_LLM, RISING_TOPICS, SUMMARY_CHUNK_WORKERS,
+    get_today_output_dir,
 )
+
 logger = logging.getLogger(__name__)
 
 
 # ─────────────────────────────────────────────
 # Gemini API 초기화
 # ─────────────────────────────────────────────
+# google.generativeai는 import 비용이 크므로 설치 여부만 확인하고 실제 로드는 init_gemini()에서 수행
+def _module_available(name: str) -> bool:
+    try:
+        return importlib.util.find_spec(name) is not None
+    except ModuleNotFoundError:
+        return False
+
+
+HAS_GEMINI = _module_available("google.generativeai")
+
+
 def init_gemini():
     """Gemini API 초기화"""
+    cassette = get_cassette()
+    if cassette is not None and cassette.replaying:
+        # 재생 모드: SDK/API 키 없이 기록된 응답만 사용
+        return cassette.wrap_model(None)
+
     if not HAS_GEMINI:
         logger.warning("⚠️ google-generativeai 패키지가 설치되지 않았습니다.")
         return None
     if not GEMINI_API_KEY:
         logger.warning("⚠️ GEMINI_API_KEY 환경변수가 설정되지 않았습니다.")
         return None
+    import google.generativeai as genai
+
     genai.configure(api_key=GEMINI_API_KEY)
-    return genai.GenerativeModel(GEMINI_MODEL)
+    model = genai.GenerativeModel(GEMINI_MODEL)
+    if cassette is not None:
+        model = cassette.wrap_model(model)
+    return model
 
 
 # ─────────────────────────────────────────────
 # 1. 종합 보고서 생성
 # ─────────────────────────────────────────────
-def build_combined_summary(output_dir: Path) -> str:
-    """모든 채널 요약을 하나의 종합 보고서로 통합합니다."""
+COMBINED_PROMPT_BUDGET = 30000  # 프롬프트에 넣는 종합 보고서 최대 길이 (팟캐스트 기준, 슬라이드/인포그래픽은 더 짧음)
+
+
+def build_combined_summary(output_dir: Path, research_results: dict = None,
+                           budget: int = COMBINED_PROMPT_BUDGET) -> str:
+    """모든 채널 요약을 하나의 종합 보고서로 통합합니다.
+
+    research_results의 영상에 요약(summary_store)이 채워져 있으면 자막 원문 대신 영상별 요약/핵심 사실로 구성하고,
+    없으면(자막이 포함되지 않은 예전 결과) channel_summaries/*.md를 그대로 합칩니다.
+    보고서 전체는 조각 단위로 combined_summary.md에 쓰고, 반환값은 프롬프트에 필요한 앞 budget 글자까지만 담습니다.
+    """
+    if research_results and any(
+        v.get("summary") for ch in research_results.get("channels", []) for v in ch.get("videos", [])
+    ):
+        channels = [ch for ch in research_results.get("channels", []) if ch.get("videos")]
+        combined = _write_combined(output_dir, _iter_entry_sections(channels), len(channels), budget)
+        logger.info(f"📄 종합 보고서 저장 (영상별 요약 기반): {output_dir / 'combined_summary.md'}")
+        return combined
+
     summary_dir = output_dir / "channel_summaries"
     if not summary_dir.exists():
         logger.error("❌ 채널 요약 디렉토리가 없습니다.")
         return ""
 
-    summaries = []
-    for md_file in sorted(summary_dir.glob("*.md")):
-        content = md_file.read_text(encoding="utf-8")
-        if content.strip():
-            summaries.append(content)
-
-    if not summaries:
+    md_files = [f for f in sorted(summary_dir.glob("*.md")) if f.stat().st_size]
+    if not md_files:
         logger.warning("⚠️ 수집된 채널 요약이 없습니다.")
         return ""
 
-    combined = f"""# 📊 AI/테크 유튜브 일일 종합 보고서
+    combined = _write_combined(output_dir, _iter_markdown_sections(md_files), len(md_files), budget)
+    logger.info(f"📄 종합 보고서 저장: {output_dir / 'combined_summary.md'}")
+    return combined
+
+
+def _write_combined(output_dir: Path, sections, channel_count: int, budget: int) -> str:
+    """보고서 조각을 파일에 차례로 쓰면서 앞 budget 글자만 메모리에 모아 반환합니다."""
+    header = f"""# 📊 AI/테크 유튜브 일일 종합 보고서
 
 **생성일**: {datetime.now().strftime('%Y년 %m월 %d일 %H:%M')}
-**분석 대상**: {len(summaries)}개 채널
+**분석 대상**: {channel_count}개 채널
 
 ---
 
 """
-    combined += "\n\n---\n\n".join(summaries)
-
-    # 종합 보고서 저장
+    head, size = [], 0
     combined_path = output_dir / "combined_summary.md"
-    combined_path.write_text(combined, encoding="utf-8")
-    logger.info(f"📄 종합 보고서 저장: {combined_path}")
-
-    return combined
+    tmp = combined_path.with_name(f"{combined_path.name}.{os.getpid()}.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        for piece in chain([header], sections):
+            f.write(piece)
+            if size < budget:
+                head.append(piece[:budget - size])
+                size += len(head[-1])
+    os.replace(tmp, combined_path)
+    return "".join(head)
+
+
+def _iter_markdown_sections(md_files: list):
+    for i, md_file in enumerate(md_files):
+        if i:
+            yield "\n\n---\n\n"
+        with open(md_file, encoding="utf-8") as f:
+            for block in iter(lambda: f.read(1 << 16), ""):
+                yield block
+
+
+def _cited(text: str, url: str, seconds) -> str:
+    from transcript_files import deep_link, timestamp
+
+    if seconds is None or not url:
+        return text
+    return f"{text} [▶ {timestamp(seconds)}]({deep_link(url, seconds)})"
+
+
+def _iter_entry_sections(channels: list):
+    from transcript_files import has_transcript, read_text
+
+    for n, ch in enumerate(channels):
+        if n:
+            yield "\n\n---\n\n"
+        lines = [f"# {ch['name']} ({ch['handle']})", ""]
+        for i, video in enumerate(ch["videos"], 1):
+            lines += [f"## {i}. {video['title']}", "", f"- **URL**: {video['url']}"]
+            if video.get("published_at"):
+                lines.append(f"- **게시 시각**: {video['published_at']}")
+            lines.append("")
+            if video.get("summary"):
+                summary = video["summary"].strip().split("\n")
+                times = video.get("summary_times") or [None] * len(summary)
+                lines += [_cited(line, video["url"], t) for line, t in zip(summary, times)] + [""]
+                if video.get("facts"):
+                    times = video.get("fact_times") or [None] * len(video["facts"])
+                    lines += ["**핵심 사실**", ""]
+                    lines += [_cited(f"- {fact}", video["url"], t) for fact, t in zip(video["facts"], times)] + [""]
+            elif has_transcript(video):
+                # 요약에 실패한 영상은 자막 앞부분으로 대체
+                lines += ["### 트랜스크립트 (일부)", "", read_text(video, 3000), ""]
+            else:
+                lines += ["> ⚠️ 자막이 없어 요약할 수 없습니다.", ""]
+        yield "\n".join(lines)
 
 
 # ─────────────────────────────────────────────
@@ -104,40 +189,215 @@ PODCAST_PROMPT = """당신은 AI/테크 분야의 인기 팟캐스트 진행자
 
 
 # ─────────────────────────────────────────────
-# 1.5. 개별 영상 요약 (Telegram 전송용)
+# 1.5. 개별 영상 요약 + 핵심 사실 (summary_store, Telegram 전송용)
 # ─────────────────────────────────────────────
 SUMMARY_PROMPT = """아래는 유튜브 영상의 자막(트랜스크립트)입니다.
-이 영상의 핵심 내용을 3개의 불릿포인트로 요약해주세요.
+이 영상의 핵심 내용을 3개의 요약 문장과, 구체적인 사실(수치, 도구/제품 이름, 발표 내용 등) 최대 5개로 정리해주세요.
 
 **요구사항:**
 - 한국어로 작성
-- 각 포인트는 명확하고 구체적으로
+- 각 요약 문장은 명확하고 구체적으로
 - 이모지 사용 가능
-- 불릿포인트 기호는 '•' 사용
+- 아래 JSON 형식으로만 출력
+
+{{"summary": ["요약 1", "요약 2", "요약 3"], "facts": ["사실 1", "사실 2"]}}
 
 자막:
 {transcript}
 """
 
 
-def summarize_video_content(transcript: str, model) -> str:
-    """개별 영상의 자막을 3줄 요약합니다."""
+CHUNK_PROMPT = """아래는 유튜브 영상 자막의 일부({label}, 전체 {count}개 구간 중 {index}번째)입니다.
+이 구간에서 다룬 핵심 내용을 2~3개의 문장과, 구체적인 사실(수치, 도구/제품 이름, 발표 내용 등) 최대 3개로 정리해주세요.
+
+**요구사항:**
+- 한국어로 작성
+- 아래 JSON 형식으로만 출력
+
+{{"points": ["내용 1", "내용 2"], "facts": ["사실 1"]}}
+
+자막:
+{transcript}
+"""
+
+MERGE_PROMPT = """아래는 한 유튜브 영상의 자막을 {count}개 구간으로 나눠 정리한 내용입니다 (시간 순).
+영상 전체를 아우르도록 3개의 요약 문장과, 구체적인 사실 최대 5개로 다시 정리해주세요.
+앞부분에만 치우치지 말고 영상 후반의 내용도 반영하세요.
+
+**요구사항:**
+- 한국어로 작성
+- 각 요약 문장은 명확하고 구체적으로
+- 이모지 사용 가능
+- 아래 JSON 형식으로만 출력
+
+{{"summary": ["요약 1", "요약 2", "요약 3"], "facts": ["사실 1", "사실 2"]}}
+
+구간별 정리:
+{sections}
+"""
+
+
+def _bullets(items) -> str:
+    return "\n".join(f"• {str(item).strip().lstrip('•-* ').strip()}" for item in items if str(item).strip())
+
+
+ANALYZE_CHARS = 15000  # 요약 프롬프트 하나에 넣는 자막 길이 (더 길면 구간별로 나눠 요약)
+MAX_SUMMARY_CHUNKS = 12  # 구간이 이보다 많으면(수 시간 라이브 등) 이웃 구간을 묶어 개수를 맞춤
+
+
+def _json_block(text: str):
+    """응답에서 JSON 블록을 꺼내 dict로 (형식이 다르면 None)"""
+    block = text
+    if "```json" in block:
+        block = block.split("```json")[1].split("```")[0]
+    elif "```" in block:
+        block = block.split("```")[1].split("```")[0]
+    try:
+        data = json.loads(block.strip())
+    except ValueError:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _failure(e: Exception) -> dict:
+    if isinstance(e, CassetteMiss):
+        raise e  # 재생이 기록과 어긋나면 실패 문구로 덮지 않고 멈춤
+    logger.error(f"  ❌ 영상 요약 실패: {e}")
+    if "429" in str(e):
+        return {"summary": "• (사용량 초과로 요약 불가)", "facts": [], "ok": False}
+    return {"summary": f"• (요약 실패: {str(e)})", "facts": [], "ok": False}
+
+
+def _facts(data: dict) -> list:
+    return [str(f).strip() for f in data.get("facts", []) if str(f).strip()]
+
+
+def _analysis(text: str) -> dict:
+    """요약 응답 → 결과 dict (JSON 형식을 지키지 않은 응답은 전체를 요약으로 사용)"""
+    data = _json_block(text)
+    if data is None:
+        return {"summary": text, "facts": [], "ok": True}
+    summary = data.get("summary", [])
+    return {
+        "summary": _bullets(summary) if isinstance(summary, list) else str(summary).strip(),
+        "facts": _facts(data),
+        "ok": True,
+    }
+
+
+def analyze_video(transcript: str, model) -> dict:
+    """개별 영상 자막 → {"summary": 3줄 불릿, "facts": [...], "ok": 저장해도 되는 결과인지}
+
+    자막이 ANALYZE_CHARS보다 길면 문장 경계에서 나눠 analyze_chunks로 요약합니다.
+    """
+    if CHUNKED_SUMMARY and transcript and len(transcript) > ANALYZE_CHARS:
+        from transcript_files import split_sentences
+
+        return analyze_chunks([(None, None, text) for text in split_sentences([transcript], ANALYZE_CHARS)], model)
+    return _analyze_single(transcript, model)
+
+
+def _analyze_single(transcript: str, model) -> dict:
     if not transcript or len(transcript) < 50:
-        return ""
-    
+        return {"summary": "", "facts": [], "ok": False}
+
     if model is None:
-        return "• (API 키 미설정으로 요약 불가)"
+        return {"summary": "• (API 키 미설정으로 요약 불가)", "facts": [], "ok": False}
 
     try:
-        # 자막이 너무 길 경우 앞부분만 사용 (토큰 절약)
-        prompt = SUMMARY_PROMPT.format(transcript=transcript[:15000])
-        response = model.generate_content(prompt)
-        return response.text.strip()
+        # CHUNKED_SUMMARY=0이면 앞부분만 사용 (토큰 절약)
+        prompt = SUMMARY_PROMPT.format(transcript=transcript[:ANALYZE_CHARS])
+        text = model.generate_content(prompt).text.strip()
     except Exception as e:
-        logger.error(f"  ❌ 영상 요약 실패: {e}")
-        if "429" in str(e):
-             return "• (사용량 초과로 요약 불가)"
-        return f"• (요약 실패: {str(e)})"
+        return _failure(e)
+
+    return _analysis(text)
+
+
+def _regroup(chunks: list, limit: int = MAX_SUMMARY_CHUNKS) -> list:
+    """구간이 limit개를 넘으면 이웃한 구간끼리 합쳐 limit개 이하로 만듭니다."""
+    if len(chunks) <= limit:
+        return chunks
+    size = -(-len(chunks) // limit)
+    groups = [chunks[i:i + size] for i in range(0, len(chunks), size)]
+    return [(group[0][0], group[-1][1], " ".join(c[2] for c in group)) for group in groups]
+
+
+def _chunk_label(chunk: tuple, index: int, count: int) -> str:
+    from transcript_files import timestamp
+
+    start, end, _ = chunk
+    if start is None:
+        return f"{index}/{count} 구간"
+    return f"{timestamp(start)}~{timestamp(end)}"
+
+
+def _summarize_chunk(chunk: tuple, index: int, count: int, model) -> dict:
+    """구간 하나 → {"label", "points", "facts"} (실패하면 "error")"""
+    label = _chunk_label(chunk, index, count)
+    prompt = CHUNK_PROMPT.format(label=label, count=count, index=index, transcript=chunk[2])
+    try:
+        text = model.generate_content(prompt).text.strip()
+    except Exception as e:
+        return {"label": label, "error": e}
+    data = _json_block(text)
+    if data is None:
+        return {"label": label, "points": [text], "facts": []}
+    points = data.get("points", [])
+    return {
+        "label": label,
+        "points": [str(p).strip() for p in (points if isinstance(points, list) else [points]) if str(p).strip()],
+        "facts": _facts(data),
+    }
+
+
+def analyze_chunks(chunks: list, model) -> dict:
+    """자막 구간들 [(시작 초, 끝 초, 자막)] → analyze_video와 같은 형식의 결과
+
+    구간이 하나면 한 번에 요약하고, 여러 개면 구간별 요약을 병렬로 요청한 뒤 한 번 더 합칩니다
+    (긴 영상도 지연 시간은 구간 하나 + 합치기 한 번).
+    """
+    chunks = [c for c in chunks if c[2].strip()]
+    if not CHUNKED_SUMMARY:
+        chunks = chunks[:1]
+    if len(chunks) <= 1:
+        return _analyze_single(chunks[0][2] if chunks else "", model)
+    if model is None:
+        return {"summary": "• (API 키 미설정으로 요약 불가)", "facts": [], "ok": False}
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    started = time.perf_counter()
+    chunks = _regroup(chunks)
+    count = len(chunks)
+    with ThreadPoolExecutor(max_workers=max(1, min(SUMMARY_CHUNK_WORKERS, count))) as pool:
+        partials = list(pool.map(lambda args: _summarize_chunk(args[1], args[0], count, model),
+                                 enumerate(chunks, 1)))
+    failed = next((p["error"] for p in partials if "error" in p), None)
+    if failed is not None:
+        return _failure(failed)
+
+    sections = "\n\n".join(
+        f"[{p['label']}]\n" + "\n".join(f"- {point}" for point in p["points"])
+        + ("\n사실: " + "; ".join(p["facts"]) if p["facts"] else "")
+        for p in partials
+    )
+    try:
+        text = model.generate_content(MERGE_PROMPT.format(count=count, sections=sections)).text.strip()
+    except Exception as e:
+        result = _failure(e)
+        # 합치기만 실패하면 구간별 첫 문장을 고르게 뽑아 보여주고, 저장하지 않아 다음 실행에서 다시 시도
+        picks = sorted({int(i * (count - 1) / 2 + 0.5) for i in range(min(3, count))})
+        return {**result, "summary": _bullets(partials[i]["points"][0] for i in picks if partials[i]["points"]),
+                "facts": list(dict.fromkeys(f for p in partials for f in p["facts"]))[:5]}
+
+    logger.info(f"  🧩 긴 자막을 {count}개 구간으로 나눠 요약 ({(time.perf_counter() - started) * 1000:.0f}ms)")
+    return _analysis(text)
+
+
+def summarize_video_content(transcript: str, model) -> str:
+    """개별 영상의 자막을 3줄 요약합니다."""
+    return analyze_video(transcript, model)["summary"]
 
 
 def generate_podcast_script(combined_summary: str, model) -> str:
@@ -153,6 +413,8 @@ def generate_podcast_script(combined_summary: str, model) -> str:
         script = response.text
         logger.info(f"  ✅ 팟캐스트 스크립트 생성 완료 ({len(script)}자)")
         return script
+    except CassetteMiss:
+        raise
     except Exception as e:
         logger.error(f"  ❌ Gemini API 오류: {e}")
         return _generate_podcast_fallback(combined_summary, error_msg=str(e))
@@ -204,7 +466,7 @@ SLIDES_PROMPT = """아래 유튜브 채널 종합 요약을 기반으로, 프레
 - 총 8~12장 슬라이드
 - 각 슬라이드에는 title, content (불릿포인트 리스트), notes (발표자 노트) 포함
 - 첫 슬라이드: 제목 슬라이드
-- 중간 슬라이드: 채널별 또는 주제별 핵심 내용
+- 중간 슬라이드: 채널별 또는 주제별 핵심 내용 (로컬 주제 분석이 있으면 그 주제 구성을 따라주세요)
 - 마지막 슬라이드: 요약 및 시사점
 
 **JSON 형식:**
@@ -222,20 +484,32 @@ SLIDES_PROMPT = """아래 유튜브 채널 종합 요약을 기반으로, 프레
 }}
 ```
 
-종합 요약:
+{topics}종합 요약:
 {content}
 """
 
+TOPICS_BLOCK = """로컬 주제 분석 (비슷한 영상끼리 묶은 결과, 주제별 키워드와 영상):
+{outline}
 
-def generate_slides_data(combined_summary: str, model) -> dict:
-    """슬라이드 구조 데이터를 생성합니다."""
+"""
+
+
+def _topics_block(topics: dict) -> str:
+    from topic_clusters import topics_outline
+
+    return TOPICS_BLOCK.format(outline=topics_outline(topics)) if topics else ""
+
+
+def generate_slides_data(combined_summary: str, model, topics: dict = None) -> dict:
+    """슬라이드 구조 데이터를 생성합니다. topics(로컬 주제 묶기 결과)가 있으면 주제 구성을 프롬프트에 넣고 본문은 줄여 보냅니다."""
     logger.info("📊 슬라이드 데이터 생성 중...")
 
     if model is None:
-        return _generate_slides_fallback(combined_summary, error_msg="API Key Not Configured")
+        return _generate_slides_fallback(combined_summary, error_msg="API Key Not Configured", topics=topics)
 
     try:
-        prompt = SLIDES_PROMPT.format(content=combined_summary[:25000])
+        limit = 15000 if topics else 25000
+        prompt = SLIDES_PROMPT.format(topics=_topics_block(topics), content=combined_summary[:limit])
         response = model.generate_content(prompt)
         text = response.text
 
@@ -249,13 +523,15 @@ def generate_slides_data(combined_summary: str, model) -> dict:
         logger.info(f"  ✅ {len(slides_data.get('slides', []))}장 슬라이드 생성 완료")
         return slides_data
 
+    except CassetteMiss:
+        raise
     except Exception as e:
         logger.error(f"  ❌ 슬라이드 데이터 생성 실패: {e}")
-        return _generate_slides_fallback(combined_summary, error_msg=str(e))
+        return _generate_slides_fallback(combined_summary, error_msg=str(e), topics=topics)
 
 
-def _generate_slides_fallback(combined_summary: str, error_msg: str = None) -> dict:
-    """Gemini 없이 기본 슬라이드 구조 생성"""
+def _generate_slides_fallback(combined_summary: str, error_msg: str = None, topics: dict = None) -> dict:
+    """Gemini 없이 기본 슬라이드 구조 생성 (로컬 주제 묶기 결과가 있으면 주제별 슬라이드 포함)"""
     
     warning_title = "⚠️ API 설정 확인 필요"
     warning_desc = "GEMINI_API_KEY 환경변수를 설정해주세요"
@@ -266,6 +542,8 @@ def _generate_slides_fallback(combined_summary: str, error_msg: str = None) -> d
     elif error_msg:
         warning_desc = f"오류 발생: {error_msg}"
 
+    from topic_clusters import topic_slides
+
     return {
         "title": f"AI/테크 유튜브 일일 종합 - {datetime.now().strftime('%Y.%m.%d')}",
         "date": datetime.now().strftime("%Y년 %m월 %d일"),
@@ -288,6 +566,7 @@ def _generate_slides_fallback(combined_summary: str, error_msg: str = None) -> d
                 ],
                 "notes": "API 키 설정 안내",
             },
+            *topic_slides(topics),
         ],
     }
 
@@ -300,9 +579,7 @@ INFOGRAPHIC_PROMPT = """아래 유튜브 채널 종합 요약을 기반으로, 
 **요구사항:**
 - headline: 한 줄 핵심 타이틀
 - subheadline: 부제목
-- key_stats: 주요 통계/수치 3~5개 (각각 label, value, icon 포함)
-- main_topics: 주요 토픽 3~5개 (각각 title, description, keywords 포함)  
-- trending_keywords: 트렌딩 키워드 5~8개
+{stats_fields}- main_topics: 주요 토픽 3~5개 (각각 title, description, keywords 포함, 로컬 주제 분석이 있으면 그 묶음을 기준으로)
 - takeaway: 핵심 시사점 한 문장
 
 **JSON 형식:**
@@ -311,36 +588,69 @@ INFOGRAPHIC_PROMPT = """아래 유튜브 채널 종합 요약을 기반으로, 
   "headline": "핵심 타이틀",
   "subheadline": "부제목",
   "date": "날짜",
-  "key_stats": [
-    {{"label": "분석 채널", "value": "9개", "icon": "📺"}},
-    {{"label": "신규 영상", "value": "15개", "icon": "🎬"}}
-  ],
-  "main_topics": [
+{stats_example}  "main_topics": [
     {{
       "title": "토픽 제목",
       "description": "설명",
       "keywords": ["키워드1", "키워드2"]
     }}
   ],
-  "trending_keywords": ["키워드1", "키워드2"],
   "takeaway": "핵심 시사점"
 }}
 ```
 
-종합 요약:
+{stats}{topics}종합 요약:
 {content}
 """
 
+# 로컬 집계가 없을 때만 LLM에 요청하는 항목
+INFOGRAPHIC_STATS_FIELDS = """- key_stats: 주요 통계/수치 3~5개 (각각 label, value, icon 포함)
+- trending_keywords: 트렌딩 키워드 5~8개
+"""
+INFOGRAPHIC_STATS_EXAMPLE = """  "key_stats": [
+    {"label": "분석 채널", "value": "9개", "icon": "📺"},
+    {"label": "신규 영상", "value": "15개", "icon": "🎬"}
+  ],
+  "trending_keywords": ["키워드1", "키워드2"],
+"""
+STATS_BLOCK = """로컬 집계 (실제 수치, 헤드라인/시사점 작성에 참고):
+{outline}
+
+"""
+
+
+def _infographic_prompt(combined_summary: str, topics: dict, stats: dict) -> str:
+    from daily_stats import stats_outline
+
+    limit = 12000 if topics else 20000
+    return INFOGRAPHIC_PROMPT.format(
+        stats_fields="" if stats else INFOGRAPHIC_STATS_FIELDS,
+        stats_example="" if stats else INFOGRAPHIC_STATS_EXAMPLE,
+        stats=STATS_BLOCK.format(outline=stats_outline(stats)) if stats else "",
+        topics=_topics_block(topics),
+        content=combined_summary[:limit],
+    )
+
+
+def generate_infographic_data(combined_summary: str, model, topics: dict = None, stats: dict = None) -> dict:
+    """인포그래픽 데이터를 생성합니다.
+
+    stats(daily_stats 집계)가 있으면 key_stats/trending_keywords는 LLM에 묻지 않고 집계값으로 채우고,
+    main_topics가 비면 로컬 주제 묶기 결과로 채웁니다. INFOGRAPHIC_LLM=0이면 LLM을 호출하지 않습니다.
+    """
+    from daily_stats import key_stats, trending_keywords
+    from topic_clusters import main_topics
 
-def generate_infographic_data(combined_summary: str, model) -> dict:
-    """인포그래픽 데이터를 생성합니다."""
     logger.info("🎨 인포그래픽 데이터 생성 중...")
 
+    if not INFOGRAPHIC_LLM and stats:
+        logger.info("  ℹ️ INFOGRAPHIC_LLM=0: 로컬 집계/주제 묶기 결과로 생성")
+        return _generate_infographic_fallback(topics=topics, stats=stats)
     if model is None:
-        return _generate_infographic_fallback(error_msg="API Key Not Configured")
+        return _generate_infographic_fallback(error_msg="API Key Not Configured", topics=topics, stats=stats)
 
     try:
-        prompt = INFOGRAPHIC_PROMPT.format(content=combined_summary[:20000])
+        prompt = _infographic_prompt(combined_summary, topics, stats)
         response = model.generate_content(prompt)
         text = response.text
 
@@ -350,100 +660,125 @@ def generate_infographic_data(combined_summary: str, model) -> dict:
             text = text.split("```")[1].split("```")[0]
 
         data = json.loads(text.strip())
+        if stats:
+            data["key_stats"] = key_stats(stats)
+            data["trending_keywords"] = trending_keywords(stats)
+        if not data.get("main_topics"):
+            data["main_topics"] = main_topics(topics)
         logger.info("  ✅ 인포그래픽 데이터 생성 완료")
         return data
 
+    except CassetteMiss:
+        raise
     except Exception as e:
         logger.error(f"  ❌ 인포그래픽 데이터 생성 실패: {e}")
-        return _generate_infographic_fallback(error_msg=str(e))
+        return _generate_infographic_fallback(error_msg=str(e), topics=topics, stats=stats)
 
 
-def _generate_infographic_fallback(error_msg: str = None) -> dict:
-    state_msg = "API 키 필요"
-    if error_msg and "429" in error_msg:
-        state_msg = "사용량 초과"
-    
+def _generate_infographic_fallback(error_msg: str = None, topics: dict = None, stats: dict = None) -> dict:
+    """LLM 없이 인포그래픽 데이터 생성 (집계/주제 묶기 결과가 있으면 실제 수치와 주제로 채움)"""
+    from daily_stats import key_stats, trending_keywords
+    from topic_clusters import main_topics
+
+    stats_list = key_stats(stats)
+    if error_msg:
+        state_msg = "사용량 초과" if "429" in error_msg else "API 키 필요"
+        stats_list.append({"label": "상태", "value": state_msg, "icon": "⚠️"})
+        takeaway = f"오류: {error_msg}"
+    elif topics and topics.get("topics"):
+        top = topics["topics"][0]
+        takeaway = f"오늘 가장 많이 다룬 주제는 '{top['label']}' (영상 {top['size']}개)입니다."
+    else:
+        takeaway = "GEMINI_API_KEY를 설정하면 자동 분석이 가능합니다."
+
     return {
         "headline": "AI/테크 데일리 인사이트",
         "subheadline": f"{datetime.now().strftime('%Y년 %m월 %d일')} 유튜브 트렌드",
         "date": datetime.now().strftime("%Y년 %m월 %d일"),
-        "key_stats": [
-            {"label": "분석 채널", "value": "9개", "icon": "📺"},
-            {"label": "상태", "value": state_msg, "icon": "⚠️"},
-        ],
-        "main_topics": [],
-        "trending_keywords": ["AI", "자동화", "트렌드"],
-        "takeaway": f"오류: {error_msg}" if error_msg else "GEMINI_API_KEY를 설정하면 자동 분석이 가능합니다.",
+        "key_stats": stats_list,
+        "main_topics": main_topics(topics),
+        "trending_keywords": trending_keywords(stats),
+        "takeaway": takeaway,
     }
 
 
 # ─────────────────────────────────────────────
 # 5. 메인 종합 실행
 # ─────────────────────────────────────────────
-def run_synthesis(research_results: dict = None) -> dict:
+def run_synthesis(research_results: dict = None, output_dir: Path = None) -> dict:
     """종합 에이전트 실행: 통합, 팟캐스트, 슬라이드, 인포그래픽 생성"""
-    output_dir = get_today_output_dir()
+    output_dir = output_dir or get_today_output_dir()
     model = init_gemini()
 
     logger.info("=" * 60)
     logger.info("📊 종합 에이전트 시작")
     logger.info("=" * 60)
 
-    # 1. 종합 보고서 생성
-    combined = build_combined_summary(output_dir)
-    if not combined:
-        logger.error("❌ 종합할 데이터가 없습니다. 리서치 에이전트를 먼저 실행하세요.")
-        return {"success": False, "error": "No data to synthesize"}
+    if research_results is None and (output_dir / "research_results.json").exists():
+        research_results = json.loads((output_dir / "research_results.json").read_text(encoding="utf-8"))
 
-    # 1.5. 개별 영상 요약 (research_results.json 업데이트)
+    # 1. 개별 영상 요약 (저장소에 없거나 자막이 바뀐 영상만 LLM 호출)
     if research_results:
+        from summary_store import SummaryStore
+        from transcript_files import cite, has_transcript
+
         logger.info("📝 개별 영상 요약 생성 중...")
-        updated_count = 0
-        for channel in research_results.get("channels", []):
-            for video in channel.get("videos", []):
-                # 자막이 있고 요약이 없는 경우에만 수행
-                # (research_results에는 전체 transcript가 없으므로, 파일에서 읽거나 
-                #  이전 단계에서 transcript가 포함된 full data를 넘겨받아야 함.
-                #  메모리 효율을 위해 여기서는 research_agent가 저장한 개별 md 파일을 읽지 않고,
-                #  research_results에 transcript가 포함되어 있다고 가정하거나,
-                #  별도로 자막 파일을 읽어야 함.
-                #  
-                #  *수정*: research_agent.py를 보면 research_results.json에는 'transcript' 필드가 포함되지 않음.
-                #  대신 channel_summaries/*.md 파일에 자막이 있음.
-                #  하지만 파싱하기 복잡하므로, research_results.json 구조를 변경하여 transcript를 포함시키거나
-                #  여기서 md 파일을 다시 읽어야 함.
-                #  
-                #  가장 쉬운 방법: research_agent.py에서 json 저장 시 transcript 포함하도록 수정.
-                #  하지만 이미 실행된 결과에 대해 돌리려면... 
-                #  일단 manual_test에서는 transcript가 메모리에 있으므로 전달됨.
-                pass 
-        
-        # 실제 구현: 
-        # run_synthesis는 main.py에서 호출될 때 'results'를 받음.
-        # research_agent.py의 run_research() 반환값에는 transcript가 포함되어 있지 않음 (videos_with_transcripts는 지역변수).
-        # 따라서 research_agent.py를 수정하여 transcript를 결과에 포함시키거나,
-        # 여기서 md 파일을 파싱해야 함.
-        # 
-        # 전략: research_agent.py가 JSON에 transcript를 포함하도록 수정하는 것이 가장 정석임.
-        # 하지만 당장 테스트를 위해선, research_results 딕셔너리에 transcript가 있다고 가정하고 처리.
-        # (main.py에서 run_research의 리턴값을 그대로 넘김)
-        
+        store = SummaryStore()
+        cited = 0
         for channel in research_results.get("channels", []):
             for video in channel.get("videos", []):
-                # video 객체에 transcript가 있다면 요약 시도
-                if video.get("has_transcript") and "transcript" in video:
-                     summary = summarize_video_content(video["transcript"], model)
-                     video["summary"] = summary
-                     updated_count += 1
-        
-        if updated_count > 0:
-            logger.info(f"  ✅ {updated_count}개 영상 요약 완료")
+                if not (video.get("has_transcript") and has_transcript(video)):
+                    continue
+                entry = store.summarize(video, model)
+                if entry["ok"]:
+                    video["summary"] = entry["summary"]
+                    video["facts"] = entry["facts"]
+                    # 요약 줄/핵심 사실의 자막 위치 → 보고서와 텔레그램에서 &t= 링크
+                    cited += cite(video)
+        store.save()
+        if cited:
+            logger.info(f"  ⏱️ 자막 시각 연결: {cited}개 영상")
+
+        if store.hits or store.misses:
+            logger.info(f"  ✅ 영상 요약: 새로 요약 {store.misses}개, 저장소 재사용 {store.hits}개")
             # 업데이트된 결과를 다시 저장
             results_path = output_dir / "research_results.json"
             results_path.write_text(json.dumps(research_results, ensure_ascii=False, indent=2), encoding="utf-8")
         else:
             logger.info("  ℹ️ 요약할 영상 자막을 찾지 못했습니다 (JSON에 transcript 미포함 가능성).")
 
+    # 1.5. 종합 보고서 생성
+    combined = build_combined_summary(output_dir, research_results)
+    if not combined:
+        logger.error("❌ 종합할 데이터가 없습니다. 리서치 에이전트를 먼저 실행하세요.")
+        return {"success": False, "error": "No data to synthesize"}
+
+    # 1.6. 로컬 주제 묶기 / 일일 집계 (LLM 없이, 슬라이드/인포그래픽의 주제 구성과 수치에 사용)
+    topics = stats = trends = None
+    if research_results:
+        from daily_stats import compute_daily_stats
+        from topic_clusters import cluster_topics
+
+        topics = cluster_topics(research_results)
+        if topics:
+            (output_dir / "topics.json").write_text(json.dumps(topics, ensure_ascii=False, indent=2), encoding="utf-8")
+        stats = compute_daily_stats(research_results)
+
+        from transcript_index import build_day_index
+        from trend_store import update_trends
+
+        day = research_results.get("date") or output_dir.name
+        try:
+            date.fromisoformat(day)
+        except ValueError:
+            # 날짜를 알 수 없는 결과(직접 만든 폴더 등)는 트렌드만 건너뛰고 나머지 종합은 계속
+            logger.warning(f"⚠️ 날짜(YYYY-MM-DD)를 알 수 없어 트렌드 기록을 건너뜁니다: {day}")
+        else:
+            trends = update_trends(build_day_index(research_results, output_dir), day)
+            if trends:
+                (output_dir / "trends.json").write_text(json.dumps(trends, ensure_ascii=False, indent=2),
+                                                        encoding="utf-8")
+
     # 2. 팟캐스트 스크립트 생성
     podcast = generate_podcast_script(combined, model)
     podcast_path = output_dir / "podcast_script.md"
@@ -451,12 +786,14 @@ def run_synthesis(research_results: dict = None) -> dict:
     logger.info(f"🎙️ 팟캐스트 스크립트 저장: {podcast_path}")
 
     # 3. 슬라이드 데이터 생성
-    slides_data = generate_slides_data(combined, model)
+    slides_data = generate_slides_data(combined, model, topics)
     slides_json_path = output_dir / "slides_data.json"
     slides_json_path.write_text(json.dumps(slides_data, ensure_ascii=False, indent=2), encoding="utf-8")
 
     # 4. 인포그래픽 데이터 생성
-    infographic_data = generate_infographic_data(combined, model)
+    infographic_data = generate_infographic_data(combined, model, topics, stats)
+    if RISING_TOPICS and trends and trends["rising"]:
+        infographic_data["rising_topics"] = trends["rising"]
     infographic_json_path = output_dir / "infographic_data.json"
     infographic_json_path.write_text(json.dumps(infographic_data, ensure_ascii=False, indent=2), encoding="utf-8")
 
@@ -469,4 +806,7 @@ def run_synthesis(research_results: dict = None) -> dict:
             "slides_data": str(slides_json_path),
             "infographic_data": str(infographic_json_path),
         },
+        # 같은 프로세스의 다음 단계(HTML 생성)가 파일을 다시 읽지 않도록 메모리로 전달
+        "slides_data": slides_data,
+        "infographic_data": infographic_data,
     }
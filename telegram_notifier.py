@@ -4,65 +4,290 @@
 import os
 import json
 import logging
-import urllib.request
+import re
+import threading
+import time
 import urllib.parse
 from datetime import datetime
 from pathlib import Path
 
-from config import get_today_output_dir
+from cassette import record_call, make_key, is_replaying
+from config import RISING_TOPICS, get_today_output_dir
 
-logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
 logger = logging.getLogger(__name__)
 
-# Windows 콘솔 출력 인코딩 설정
-import sys
-if sys.stdout.encoding != 'utf-8':
-    sys.stdout.reconfigure(encoding='utf-8')
-
 BOT_TOKEN = os.environ.get("TELEGRAM_BOT_TOKEN", "")
-CHAT_ID = os.environ.get("TELEGRAM_CHAT_ID", "")
+CHAT_ID = os.environ.get("TELEGRAM_CHAT_ID", "")  # 쉼표로 여러 채팅 지정 가능
+SUBSCRIBERS_FILE = os.environ.get("TELEGRAM_SUBSCRIBERS_FILE", "")  # 한 줄에 chat_id 하나
+API_BASE = os.environ.get("TELEGRAM_API_BASE", "https://api.telegram.org")  # 로컬 스텁 서버 테스트용
 PAGES_URL = os.environ.get("PAGES_URL", "")
 
+MESSAGE_LIMIT = 4096           # 텔레그램 메시지 최대 길이 (UTF-16 코드 단위)
+GLOBAL_RATE = 30               # 봇 전체 초당 메시지 수
+PER_CHAT_INTERVAL = 1.0        # 같은 채팅에 보내는 메시지 간 최소 간격 (초)
+POOL_SIZE = 4                  # 동시에 유지하는 keep-alive 연결 수
+MAX_ATTEMPTS = 3               # 429(retry_after) 응답 시 최대 시도 횟수
+
+
+def get_chat_ids() -> list:
+    """TELEGRAM_CHAT_ID(쉼표 구분)와 TELEGRAM_SUBSCRIBERS_FILE의 chat_id를 중복 없이 반환합니다."""
+    ids = [c.strip() for c in CHAT_ID.split(",")]
+    if SUBSCRIBERS_FILE and Path(SUBSCRIBERS_FILE).exists():
+        for line in Path(SUBSCRIBERS_FILE).read_text(encoding="utf-8").splitlines():
+            line = line.split("#", 1)[0].strip()
+            ids.append(line)
+    return list(dict.fromkeys(c for c in ids if c))
+
+
+# ─────────────────────────────────────────────
+# 메시지 분할
+# ─────────────────────────────────────────────
+_TAG_PATTERN = re.compile(r"<(/?)([a-zA-Z][a-zA-Z0-9-]*)[^>]*>")
+
+
+def _utf16_len(text: str) -> int:
+    return len(text.encode("utf-16-le")) // 2
+
+
+def _scan_tags(text: str, stack: list) -> list:
+    """text의 HTML 태그를 따라가며 열린 태그 스택([(name, open_tag)])을 갱신합니다."""
+    for match in _TAG_PATTERN.finditer(text):
+        closing, name = match.group(1), match.group(2).lower()
+        if not closing:
+            stack.append((name, match.group(0)))
+        else:
+            for i in range(len(stack) - 1, -1, -1):
+                if stack[i][0] == name:
+                    del stack[i:]
+                    break
+    return stack
+
+
+def _split_long_line(line: str, limit: int) -> list:
+    """한 줄이 limit보다 길면 태그/엔티티 중간이 아닌 위치(가능하면 공백)에서 자릅니다."""
+    pieces = []
+    while _utf16_len(line) > limit:
+        cut = limit
+        while _utf16_len(line[:cut]) > limit:
+            cut -= 1
+        head = line[:cut]
+        # 태그 또는 &엔티티; 중간에서 자르지 않기
+        for opener, closer in (("<", ">"), ("&", ";")):
+            pos = head.rfind(opener)
+            if pos > 0 and closer not in head[pos:]:
+                cut = pos
+                head = line[:cut]
+        space = head.rfind(" ")
+        if space > limit // 2 and head.rfind("<", 0, space) <= head.rfind(">", 0, space):
+            cut = space + 1
+        pieces.append(line[:cut])
+        line = line[cut:]
+    pieces.append(line)
+    return pieces
+
+
+def split_message(text: str, limit: int = MESSAGE_LIMIT) -> list:
+    """긴 HTML 메시지를 줄 단위로 limit 이하 조각으로 나눕니다.
+
+    조각 경계에서 열려 있는 태그는 닫고 다음 조각 앞에서 다시 엽니다.
+    """
+    if _utf16_len(text) <= limit:
+        return [text]
+
+    # 태그를 닫고 다시 여는 데 필요한 여유분
+    budget = limit - 200
+    chunks, current, stack = [], [], []
+    prefix = ""
+
+    def flush():
+        body = prefix + "\n".join(current)
+        closing = "".join(f"</{name}>" for name, _ in reversed(stack))
+        chunks.append(body + closing)
+
+    size = 0
+    for raw_line in text.split("\n"):
+        for line in _split_long_line(raw_line, budget):
+            line_size = _utf16_len(line) + 1
+            if current and size + line_size > budget:
+                flush()
+                prefix = "".join(tag for _, tag in stack)
+                current, size = [], _utf16_len(prefix)
+            current.append(line)
+            size += line_size
+            _scan_tags(line, stack)
+    if current:
+        flush()
+    return [c for c in chunks if c.strip()]
+
+
+# ─────────────────────────────────────────────
+# 전송 (keep-alive 연결 풀 + 속도 제한)
+# ─────────────────────────────────────────────
+class RateLimiter:
+    """봇 전체(초당 GLOBAL_RATE)와 채팅별(PER_CHAT_INTERVAL) 전송 간격을 맞춥니다."""
+
+    def __init__(self, global_rate: float = GLOBAL_RATE, per_chat_interval: float = PER_CHAT_INTERVAL):
+        self.global_interval = 1.0 / global_rate if global_rate else 0.0
+        self.per_chat_interval = per_chat_interval
+        self._lock = threading.Lock()
+        self._next_global = 0.0
+        self._next_chat = {}
+
+    def _reserve(self, chat_id: str) -> float:
+        with self._lock:
+            now = time.monotonic()
+            chat_slot = max(now, self._next_chat.get(chat_id, 0.0))
+            slot = max(chat_slot, self._next_global)
+            self._next_global = slot + self.global_interval
+            self._next_chat[chat_id] = slot + self.per_chat_interval
+            return slot - now
+
+    def wait(self, chat_id: str):
+        delay = self._reserve(chat_id)
+        if delay > 0:
+            time.sleep(delay)
+
+    def defer(self, chat_id: str, seconds: float):
+        """429 응답의 retry_after만큼 해당 채팅 전송을 미룹니다."""
+        with self._lock:
+            self._next_chat[chat_id] = max(self._next_chat.get(chat_id, 0.0), time.monotonic() + seconds)
+
+
+class TelegramSender:
+    """keep-alive HTTPS 연결을 재사용하여 여러 채팅에 메시지를 보냅니다.
+
+    API_BASE를 http://127.0.0.1:PORT 로 바꾸면 로컬 스텁 서버로 테스트할 수 있습니다.
+    """
+
+    def __init__(self, token: str = None, api_base: str = None, pool_size: int = POOL_SIZE,
+                 limiter: RateLimiter = None):
+        import queue
+
+        self.token = token if token is not None else BOT_TOKEN
+        self.api = urllib.parse.urlsplit(api_base or API_BASE)
+        self.limiter = limiter or RateLimiter()
+        self.pool_size = max(1, pool_size)
+        self._pool = queue.LifoQueue()
+        for _ in range(self.pool_size):
+            self._pool.put(None)  # 연결은 처음 사용할 때 생성
 
-def send_telegram_message(text: str, parse_mode: str = "HTML") -> bool:
-    """텔레그램으로 메시지를 전송합니다."""
-    if not BOT_TOKEN or not CHAT_ID:
+    # ── 연결 풀 ──
+    def _connect(self):
+        import http.client  # ssl/http.client 로드는 실제 전송 시점으로 지연
+
+        cls = http.client.HTTPSConnection if self.api.scheme == "https" else http.client.HTTPConnection
+        return cls(self.api.netloc, timeout=10)
+
+    def _request(self, method: str, params: dict) -> dict:
+        import http.client
+
+        path = f"{self.api.path.rstrip('/')}/bot{self.token}/{method}"
+        body = urllib.parse.urlencode(params).encode("utf-8")
+        headers = {"Content-Type": "application/x-www-form-urlencoded", "Connection": "keep-alive"}
+
+        conn = self._pool.get()
+        try:
+            for attempt in range(2):
+                conn = conn or self._connect()
+                try:
+                    conn.request("POST", path, body=body, headers=headers)
+                    resp = conn.getresponse()
+                    data = resp.read()
+                    if resp.getheader("Connection", "").lower() == "close":
+                        conn.close()
+                        conn = None
+                    return json.loads(data)
+                except (http.client.HTTPException, ConnectionError, OSError):
+                    # 서버가 유휴 keep-alive 연결을 끊은 경우 한 번만 다시 연결
+                    conn.close()
+                    conn = None
+                    if attempt:
+                        raise
+        finally:
+            self._pool.put(conn)
+
+    def close(self):
+        while not self._pool.empty():
+            conn = self._pool.get_nowait()
+            if conn is not None:
+                conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ── 전송 ──
+    def send_chunk(self, chat_id: str, text: str, parse_mode: str = "HTML", max_attempts: int = MAX_ATTEMPTS) -> dict:
+        """메시지 한 조각을 속도 제한에 맞춰 전송합니다. 429면 retry_after 후 재시도.
+
+        max_attempts=1이면 429 응답을 그대로 반환합니다 (아웃박스가 재시도 시점을 직접 관리).
+        """
+        params = {
+            "chat_id": chat_id,
+            "text": text,
+            "disable_web_page_preview": "false",
+        }
+        if parse_mode:
+            params["parse_mode"] = parse_mode
+        result = {}
+        for attempt in range(max_attempts):
+            if not is_replaying():
+                self.limiter.wait(chat_id)
+            result = record_call("telegram.sendMessage", make_key(chat_id, text, parse_mode),
+                                 lambda: self._request("sendMessage", params))
+            retry_after = (result.get("parameters") or {}).get("retry_after")
+            if result.get("ok") or result.get("error_code") != 429 or retry_after is None or attempt + 1 == max_attempts:
+                return result
+            logger.warning(f"⏳ 텔레그램 속도 제한 ({chat_id}): {retry_after}초 후 재시도")
+            self.limiter.defer(chat_id, float(retry_after))
+        return result
+
+
+def send_telegram_message(text: str, parse_mode: str = "HTML", chat_ids: list = None, batch: str = None) -> bool:
+    """텔레그램으로 메시지를 전송합니다. 긴 메시지는 분할, 여러 채팅이면 병렬 전송.
+
+    메시지는 먼저 아웃박스(SQLite)에 저장되므로 기한 내 못 보낸 조각은 다음 실행에서 재개됩니다.
+    이번 메시지에 대기 중인 조각이 남지 않으면 True (차단된 채팅 등 전송 불가 조각은 제외).
+    """
+    from telegram_outbox import open_outbox
+
+    chat_ids = chat_ids or get_chat_ids()
+    if is_replaying():
+        chat_ids = chat_ids or [CHAT_ID]
+    elif not BOT_TOKEN or not chat_ids:
         logger.warning("⚠️ TELEGRAM_BOT_TOKEN 또는 TELEGRAM_CHAT_ID가 설정되지 않았습니다.")
         return False
 
-    url = f"https://api.telegram.org/bot{BOT_TOKEN}/sendMessage"
-    data = urllib.parse.urlencode({
-        "chat_id": CHAT_ID,
-        "text": text,
-        "parse_mode": parse_mode,
-        "disable_web_page_preview": "false",
-    }).encode("utf-8")
-
-    try:
-        req = urllib.request.Request(url, data=data)
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            result = json.loads(resp.read())
-            if result.get("ok"):
-                logger.info("✅ 텔레그램 메시지 전송 성공")
-                return True
-            else:
-                logger.error(f"❌ 텔레그램 오류: {result}")
-                return False
-    except Exception as e:
-        logger.error(f"❌ 텔레그램 전송 실패: {e}")
-        return False
+    with open_outbox() as outbox:
+        keys = outbox.enqueue(chat_ids, text, parse_mode, batch=batch)
+        outbox.deliver()
+        stats = outbox.stats(keys)
 
+    if stats["failed"]:
+        logger.warning(f"⚠️ 전송 불가 조각 {stats['failed']}개 (봇 차단/잘못된 chat_id 등)")
+    if stats["pending"] == 0 and stats["sent"]:
+        logger.info(f"✅ 텔레그램 메시지 전송 성공 ({len(chat_ids)}개 채팅)")
+        return True
+    logger.error(f"❌ 텔레그램 전송 미완료: 조각 {len(keys)}개 중 {stats['pending']}개 대기 (다음 실행에서 재개)")
+    return False
 
-def build_daily_report() -> str:
-    """오늘의 결과를 텔레그램 메시지 형식으로 생성합니다."""
-    output_dir = get_today_output_dir()
+
+def build_daily_report(results: dict = None, output_dir: Path = None) -> str:
+    """오늘의 결과를 텔레그램 메시지 형식으로 생성합니다.
+
+    results가 주어지면 (같은 프로세스에서 이어 실행하는 경우) research_results.json을 다시 읽지 않습니다.
+    """
     today = datetime.now().strftime("%Y년 %m월 %d일")
 
     # 리서치 결과 로드
-    results_path = output_dir / "research_results.json"
-    if results_path.exists():
-        results = json.loads(results_path.read_text(encoding="utf-8"))
-    else:
+    if results is None:
+        output_dir = output_dir or get_today_output_dir()
+        results_path = output_dir / "research_results.json"
+        if results_path.exists():
+            results = json.loads(results_path.read_text(encoding="utf-8"))
+    if results is None:
         return f"📊 <b>AI/테크 데일리 다이제스트</b>\n📅 {today}\n\n⚠️ 오늘의 결과가 없습니다."
 
     total_videos = results.get("total_videos", 0)
@@ -80,14 +305,19 @@ def build_daily_report() -> str:
     ]
 
     if channels:
+        from html import escape
+
+        from transcript_files import deep_link, timestamp
+
         lines.append("📺 <b>채널별 요약:</b>")
         for ch in channels:
             video_count = ch.get("videos_found", 0)
-            lines.append(f"  • {ch['name']}: {video_count}개 영상")
+            lines.append(f"  • {escape(ch['name'])}: {video_count}개 영상")
             for v in ch.get("videos", [])[:2]:
                 emoji = "✅" if v.get("has_transcript") else "⚠️"
-                title = v['title'][:45]
-                url = v.get('url', '')
+                # 제목/요약의 <, & 등이 HTML 파싱 오류(400)로 리포트 전체를 막지 않도록 이스케이프
+                title = escape(v['title'][:45])
+                url = escape(v.get('url', ''))
                 summary = v.get('summary', '')
 
                 if url:
@@ -97,11 +327,30 @@ def build_daily_report() -> str:
                 
                 if summary:
                     summary_lines = summary.strip().split('\n')
-                    for line in summary_lines:
+                    times = v.get('summary_times') or [None] * len(summary_lines)
+                    for line, seconds in zip(summary_lines, times):
+                        line = escape(line)
+                        if seconds is not None and url:
+                            # 자막에서 해당 내용이 나온 시점으로 바로 이동
+                            line += f" <a href='{escape(deep_link(v['url'], seconds))}'>▶ {timestamp(seconds)}</a>"
                         lines.append(f"    {line}")
                     lines.append("")  # Add empty line after summary
         lines.append("")
 
+    # 이번 주 떠오르는 주제 (종합 단계에서 trend_store가 기록한 trends.json)
+    if RISING_TOPICS:
+        from html import escape
+
+        trends_path = (output_dir or get_today_output_dir()) / "trends.json"
+        rising = json.loads(trends_path.read_text(encoding="utf-8")).get("rising", []) if trends_path.exists() else []
+        if rising:
+            lines.append("🚀 <b>이번 주 떠오르는 주제:</b>")
+            for item in rising:
+                spike = " ⚡" if item.get("spike") else ""
+                lines.append(f"  • {escape(item['term'])}{spike}: {item['last_week']}회 → {item['this_week']}회 "
+                             f"({item['change']}, 채널 {item['channels']}개)")
+            lines.append("")
+
     # 링크 추가 (수집된 영상이 있을 때만)
     # User Request: Remove slides/infographics links
 
@@ -111,7 +360,26 @@ def build_daily_report() -> str:
     return "\n".join(lines)
 
 
+def build_video_alert(channel: dict, video: dict, summary: str = "") -> str:
+    """상시 실행 모드의 새 영상 알림 메시지 (영상 하나)"""
+    from html import escape
+
+    lines = [
+        f"🆕 <b>{escape(channel['name'])}</b> 새 영상",
+        f"🎬 <a href='{escape(video['url'])}'>{escape(video['title'])}</a>",
+    ]
+    meta = " · ".join(x for x in (video.get("published_text"), video.get("duration"), video.get("view_count")) if x)
+    if meta:
+        lines.append(f"🕒 {escape(meta)}")
+    lines.append("")
+    lines.append(escape(summary.strip()) if summary else "⚠️ 자막이 아직 없어 요약 없이 알립니다.")
+    return "\n".join(lines)
+
+
 if __name__ == "__main__":
+    from log_config import setup_logging
+
+    setup_logging()
     report = build_daily_report()
     print(report)
     print("---")
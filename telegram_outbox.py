@@ -0,0 +1,255 @@
+"""
+텔레그램 아웃박스: 전송할 메시지를 SQLite에 먼저 저장한 뒤 워커가 전송
+- 메시지 조각 단위로 키(배치 + chat_id + 순번 + 내용 해시)를 만들어 중복 저장/전송 방지
+- 429 응답은 retry_after 시점까지 해당 채팅만 미루고 나머지 채팅 전송은 계속 진행
+- 타임아웃/연결 오류는 지수 백오프로 재시도, 기한 내 못 보낸 메시지는 다음 실행에서 재개
+- 400/403(잘못된 요청, 봇 차단)처럼 재시도해도 성공할 수 없는 경우만 failed로 종료
+  (단, HTML 파싱 오류 400은 태그를 뺀 일반 텍스트로 한 번 더 보냄)
+
+사용법:
+    python cli.py outbox            # 상태 확인
+    python cli.py outbox --flush    # 대기 중인 메시지 전송 재개
+"""
+import html
+import logging
+import random
+import re
+import sqlite3
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from cassette import is_replaying, make_key
+from config import TELEGRAM_DELIVERY_DEADLINE, TELEGRAM_OUTBOX_PATH
+
+logger = logging.getLogger(__name__)
+
+BACKOFF_BASE = 5.0       # 첫 재시도 대기 (초)
+BACKOFF_MAX = 600.0      # 최대 재시도 대기 (초)
+BATCH_SIZE = 200         # 한 번에 꺼내는 전송 대상 수
+RETENTION_DAYS = 30      # sent/failed 기록 보관 기간
+PERMANENT_ERRORS = (400, 403)
+PARSE_ERROR = "can't parse entities"  # 400 중 parse_mode 없이 다시 보내면 되는 경우
+_TAG = re.compile(r"<[^>]+>")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    key TEXT PRIMARY KEY,
+    batch TEXT NOT NULL,
+    chat_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    parse_mode TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,
+    last_error TEXT,
+    created_at TEXT NOT NULL,
+    sent_at TEXT
+);
+CREATE INDEX IF NOT EXISTS outbox_ready ON outbox (status, next_attempt_at);
+CREATE INDEX IF NOT EXISTS outbox_chat ON outbox (batch, chat_id, seq);
+"""
+
+
+def _retry_after(result: dict):
+    """429 응답의 parameters.retry_after (없으면 None → 지수 백오프)"""
+    if not result or result.get("error_code") != 429:
+        return None
+    return (result.get("parameters") or {}).get("retry_after")
+
+
+def plain_text(text: str) -> str:
+    """HTML 메시지 → 태그 없는 일반 텍스트"""
+    return html.unescape(_TAG.sub("", text))
+
+
+class Outbox:
+    """SQLite 기반 텔레그램 메시지 아웃박스 (DB 접근은 생성한 스레드에서만)"""
+
+    def __init__(self, path=TELEGRAM_OUTBOX_PATH):
+        if str(path) != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(str(path))
+        self.db.row_factory = sqlite3.Row
+        self.db.executescript(_SCHEMA)
+        self._prune()
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _prune(self):
+        cutoff = (datetime.now() - timedelta(days=RETENTION_DAYS)).isoformat(timespec="seconds")
+        with self.db:
+            self.db.execute("DELETE FROM outbox WHERE status != 'pending' AND created_at < ?", (cutoff,))
+
+    # ── 저장 ──
+    def enqueue(self, chat_ids: list, text: str, parse_mode: str = "HTML", batch: str = None) -> list:
+        """메시지를 조각으로 나누어 채팅별로 저장합니다. 이미 있는 키는 무시. 전체 키 목록 반환."""
+        from telegram_notifier import split_message
+
+        batch = batch or datetime.now().strftime("%Y-%m-%d")
+        now = datetime.now().isoformat(timespec="seconds")
+        chunks = split_message(text)
+        keys, rows = [], []
+        for chat_id in chat_ids:
+            for seq, chunk in enumerate(chunks):
+                key = make_key(batch, chat_id, seq, chunk, parse_mode)
+                keys.append(key)
+                rows.append((key, batch, str(chat_id), seq, chunk, parse_mode, time.time(), now))
+        with self.db:
+            cursor = self.db.executemany(
+                "INSERT OR IGNORE INTO outbox (key, batch, chat_id, seq, text, parse_mode, next_attempt_at, created_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+        logger.info(f"📮 아웃박스 저장: {cursor.rowcount}개 신규 / {len(rows)}개 조각 ({len(chat_ids)}개 채팅)")
+        return keys
+
+    # ── 조회 ──
+    def _ready(self, limit: int = BATCH_SIZE) -> list:
+        """지금 보낼 수 있는 조각 (채팅별로 앞 순번이 모두 전송된 것만)."""
+        return self.db.execute(
+            """
+            SELECT * FROM outbox o
+            WHERE status = 'pending' AND next_attempt_at <= ?
+              AND NOT EXISTS (
+                  SELECT 1 FROM outbox p
+                  WHERE p.batch = o.batch AND p.chat_id = o.chat_id AND p.seq < o.seq AND p.status != 'sent'
+              )
+            ORDER BY next_attempt_at, batch, seq
+            LIMIT ?
+            """,
+            (time.time(), limit),
+        ).fetchall()
+
+    def _next_wakeup(self):
+        """가장 빠른 대기 메시지까지 남은 시간(초). 대기 메시지가 없으면 None."""
+        row = self.db.execute("SELECT MIN(next_attempt_at) FROM outbox WHERE status = 'pending'").fetchone()
+        if row[0] is None:
+            return None
+        return max(0.0, row[0] - time.time())
+
+    def stats(self, keys: list = None) -> dict:
+        """상태별 조각 수. keys를 주면 해당 메시지만 집계."""
+        counts = {"pending": 0, "sent": 0, "failed": 0}
+        if keys is None:
+            rows = self.db.execute("SELECT status, COUNT(*) FROM outbox GROUP BY status").fetchall()
+        else:
+            rows = []
+            for i in range(0, len(keys), 500):
+                part = keys[i:i + 500]
+                rows += self.db.execute(
+                    f"SELECT status, COUNT(*) FROM outbox WHERE key IN ({','.join('?' * len(part))}) GROUP BY status",
+                    part,
+                ).fetchall()
+        for status, count in rows:
+            counts[status] = counts.get(status, 0) + count
+        return counts
+
+    # ── 전송 ──
+    def _record(self, row, result: dict, error: str = None):
+        attempts = row["attempts"] + 1
+        now = time.time()
+        if result and result.get("ok"):
+            self.db.execute(
+                "UPDATE outbox SET status = 'sent', attempts = ?, sent_at = ?, last_error = NULL WHERE key = ?",
+                (attempts, datetime.now().isoformat(timespec="seconds"), row["key"]),
+            )
+            return "sent"
+
+        code = (result or {}).get("error_code")
+        description = (result or {}).get("description") or ""
+        if code == 400 and row["parse_mode"] and PARSE_ERROR in description.lower():
+            # 태그를 지우고 엔티티를 푼 일반 텍스트로 바로 재시도 (키는 그대로라 중복 전송 없음)
+            self.db.execute(
+                "UPDATE outbox SET text = ?, parse_mode = '', attempts = ?, next_attempt_at = ?, last_error = ?"
+                " WHERE key = ?",
+                (plain_text(row["text"]), attempts, now, f"{code}: {description}", row["key"]),
+            )
+            logger.warning(f"⚠️ 텔레그램 HTML 파싱 실패 ({row['chat_id']}): 일반 텍스트로 다시 보냄 - {description}")
+            return "retry"
+        if code in PERMANENT_ERRORS:
+            message = f"{code}: {result.get('description', '')}"
+            self.db.execute(
+                "UPDATE outbox SET status = 'failed', attempts = ?, last_error = ? WHERE key = ?",
+                (attempts, message, row["key"]),
+            )
+            # 앞 조각이 실패하면 뒤 조각도 보내지 않음 (순서가 어긋난 메시지 방지)
+            self.db.execute(
+                "UPDATE outbox SET status = 'failed', last_error = ? WHERE batch = ? AND chat_id = ? AND seq > ?"
+                " AND status = 'pending'",
+                (f"앞 조각 실패 ({message})", row["batch"], row["chat_id"], row["seq"]),
+            )
+            logger.error(f"❌ 텔레그램 전송 불가 ({row['chat_id']}): {message}")
+            return "failed"
+
+        retry_after = _retry_after(result)
+        if retry_after is not None:
+            delay = float(retry_after)
+            message = f"429: retry_after={retry_after}"
+        else:
+            delay = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** (attempts - 1)) * (0.5 + random.random())
+            message = error or f"{code}: {(result or {}).get('description', '')}"
+        self.db.execute(
+            "UPDATE outbox SET attempts = ?, next_attempt_at = ?, last_error = ? WHERE key = ?",
+            (attempts, now + delay, message, row["key"]),
+        )
+        logger.warning(f"⏳ 텔레그램 재시도 예정 ({row['chat_id']}, {attempts}회): {delay:.1f}초 후 - {message}")
+        return "retry"
+
+    def deliver(self, sender=None, deadline: float = TELEGRAM_DELIVERY_DEADLINE) -> dict:
+        """대기 중인 메시지를 deadline(초) 동안 전송합니다. 남은 메시지는 다음 실행에서 재개."""
+        from concurrent.futures import ThreadPoolExecutor
+        from telegram_notifier import TelegramSender
+
+        end = time.monotonic() + deadline
+        own_sender = sender is None
+        sender = sender or TelegramSender()
+
+        def _attempt(row):
+            try:
+                return sender.send_chunk(row["chat_id"], row["text"], row["parse_mode"], max_attempts=1), None
+            except Exception as e:
+                return None, f"{type(e).__name__}: {e}"
+
+        counts = {"sent": 0, "failed": 0, "retry": 0}
+        try:
+            with ThreadPoolExecutor(max_workers=sender.pool_size) as pool:
+                while time.monotonic() < end:
+                    ready = self._ready()
+                    if not ready:
+                        wait = self._next_wakeup()
+                        if wait is None or time.monotonic() + wait > end:
+                            break
+                        time.sleep(max(wait, 0.05))
+                        continue
+                    for row, (result, error) in zip(ready, pool.map(_attempt, ready)):
+                        outcome = self._record(row, result, error)
+                        counts[outcome] += 1
+                        retry_after = _retry_after(result)
+                        if outcome == "retry" and retry_after is not None:
+                            sender.limiter.defer(row["chat_id"], float(retry_after))
+                    self.db.commit()
+        finally:
+            self.db.commit()
+            if own_sender:
+                sender.close()
+
+        remaining = self.stats()["pending"]
+        logger.info(
+            f"📬 아웃박스 전송: 성공 {counts['sent']}건, 재시도 예약 {counts['retry']}건, "
+            f"실패 {counts['failed']}건, 대기 {remaining}건"
+        )
+        return {**counts, "pending": remaining}
+
+
+def open_outbox() -> Outbox:
+    """카세트 재생 중에는 실제 아웃박스를 건드리지 않도록 메모리 DB를 사용합니다."""
+    return Outbox(":memory:" if is_replaying() else TELEGRAM_OUTBOX_PATH)
@@ -0,0 +1,58 @@
+"""
+테스트 공용 설정: 루트 모듈 import 경로와 로컬 스텁 HTTP 서버
+
+stub_server(respond) → "http://127.0.0.1:PORT"
+    respond(method, path, headers, body) → (status, headers dict, body bytes/str)
+    받은 요청은 server.requests에 (method, path, headers, body)로 쌓임
+"""
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive 연결 재사용 경로도 함께 검증
+
+    def _serve(self):
+        length = int(self.headers.get("Content-Length", 0) or 0)
+        body = self.rfile.read(length) if length else b""
+        request = (self.command, self.path, dict(self.headers), body)
+        self.server.requests.append(request)
+        status, headers, payload = self.server.respond(*request)
+        payload = payload.encode("utf-8") if isinstance(payload, str) else (payload or b"")
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = do_POST = _serve
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    servers = []
+
+    def start(respond):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+        server.daemon_threads = True
+        server.respond = respond
+        server.requests = []
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        start.server = server
+        return f"http://127.0.0.1:{server.server_address[1]}"
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
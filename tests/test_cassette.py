@@ -0,0 +1,38 @@
+"""카세트: 실행 시각이 달라도 같은 프롬프트로 재생되고, 기록에 없는 호출은 폴백으로 덮지 않음"""
+import pytest
+
+from cassette import Cassette, CassetteMiss
+from synthesis_agent import analyze_video, generate_podcast_script
+
+
+class FakeModel:
+    def __init__(self):
+        self.prompts = []
+
+    def generate_content(self, prompt):
+        self.prompts.append(prompt)
+        return type("Response", (), {"text": f"응답 {len(self.prompts)}"})()
+
+
+def report(stamp: str, body: str = "본문") -> str:
+    return f"# 보고서\n\n**생성일**: {stamp}\n**분석 대상**: 1개 채널\n\n# 채널\n\n**수집 시각**: {stamp}\n\n{body}\n"
+
+
+def test_replay_ignores_report_timestamps(tmp_path):
+    path = tmp_path / "cassette.jsonl.gz"
+    model = FakeModel()
+    recorded = generate_podcast_script(report("2026년 01월 01일 09:00"), Cassette(path, "record").wrap_model(model))
+
+    replay = Cassette(path, "replay", replay_speed=0).wrap_model(None)
+    assert generate_podcast_script(report("2026년 01월 02일 17:45"), replay) == recorded == "응답 1"
+
+    with pytest.raises(CassetteMiss):
+        generate_podcast_script(report("2026년 01월 01일 09:00", "다른 본문"), replay)
+
+
+def test_cassette_miss_is_not_turned_into_a_failed_summary(tmp_path):
+    path = tmp_path / "cassette.jsonl.gz"
+    Cassette(path, "record")
+    path.write_bytes(b"")
+    with pytest.raises(CassetteMiss):
+        analyze_video("자막 " * 100, Cassette(path, "replay", replay_speed=0).wrap_model(None))
@@ -0,0 +1,20 @@
+"""명령줄 인자: 서브커맨드 뒤 공통 옵션, --date 형식 검사"""
+import pytest
+
+from cli import build_parser
+
+
+def test_date_must_be_iso_day():
+    parser = build_parser()
+    assert parser.parse_args(["synthesize", "--date", "2026-01-02"]).date == "2026-01-02"
+    assert parser.parse_args(["--date", "2026-01-02", "synthesize"]).date == "2026-01-02"
+    for bad in ("yesterday", "2026-1-2", "20260102", "../x"):
+        with pytest.raises(SystemExit):
+            parser.parse_args(["synthesize", "--date", bad])
+
+
+def test_verbose_is_accepted_before_or_after_bench():
+    parser = build_parser()
+    assert parser.parse_args(["bench", "-v"]).verbose is True
+    assert parser.parse_args(["-v", "bench"]).verbose is True
+    assert parser.parse_args(["bench"]).verbose is False
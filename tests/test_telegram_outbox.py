@@ -0,0 +1,130 @@
+"""텔레그램 아웃박스: 로컬 스텁 Bot API 서버로 429 retry_after, 400 연쇄 실패, 중복 방지 확인"""
+import json
+import time
+from urllib.parse import parse_qs
+
+from telegram_notifier import RateLimiter, TelegramSender, build_daily_report, build_video_alert
+from telegram_outbox import Outbox
+
+
+def _sender(base: str) -> TelegramSender:
+    return TelegramSender(token="TEST", api_base=base, pool_size=2,
+                          limiter=RateLimiter(global_rate=1000, per_chat_interval=0))
+
+
+def _form(body: bytes) -> dict:
+    return {k: v[0] for k, v in parse_qs(body.decode("utf-8")).items()}
+
+
+def _ok():
+    return 200, {"Content-Type": "application/json"}, json.dumps({"ok": True, "result": {}})
+
+
+def _error(code: int, description: str, **parameters):
+    payload = {"ok": False, "error_code": code, "description": description}
+    if parameters:
+        payload["parameters"] = parameters
+    return code, {"Content-Type": "application/json"}, json.dumps(payload)
+
+
+def test_429_retry_after_defers_only_that_chat(stub_server):
+    def respond(method, path, headers, body):
+        return _error(429, "Too Many Requests", retry_after=30) if _form(body)["chat_id"] == "1" else _ok()
+
+    base = stub_server(respond)
+    outbox = Outbox(":memory:")
+    outbox.enqueue(["1", "2"], "안녕하세요", batch="b")
+    sender = _sender(base)
+    result = outbox.deliver(sender, deadline=0.5)
+
+    assert result["sent"] == 1 and result["pending"] == 1
+    row = outbox.db.execute("SELECT * FROM outbox WHERE chat_id = '1'").fetchone()
+    assert row["status"] == "pending"
+    assert row["last_error"] == "429: retry_after=30"
+    assert 25 < row["next_attempt_at"] - time.time() <= 30
+    assert sender.limiter._next_chat["1"] - time.monotonic() > 25
+
+
+def test_429_without_retry_after_falls_back_to_backoff(stub_server):
+    base = stub_server(lambda *request: _error(429, "Too Many Requests"))
+    outbox = Outbox(":memory:")
+    outbox.enqueue(["1"], "안녕하세요", batch="b")
+    sender = _sender(base)
+    result = outbox.deliver(sender, deadline=0.3)
+
+    assert result["retry"] == 1 and result["pending"] == 1
+    row = outbox.db.execute("SELECT * FROM outbox").fetchone()
+    assert row["last_error"] == "429: Too Many Requests"
+    assert row["next_attempt_at"] > time.time()
+
+
+def test_permanent_400_fails_rest_of_batch_for_that_chat(stub_server):
+    def respond(method, path, headers, body):
+        return _error(400, "Bad Request: chat not found") if _form(body)["chat_id"] == "1" else _ok()
+
+    base = stub_server(respond)
+    outbox = Outbox(":memory:")
+    text = "\n".join(f"{i:04d} " + "가" * 100 for i in range(120))  # 여러 조각으로 나뉘는 길이
+    keys = outbox.enqueue(["1", "2"], text, batch="b")
+    chunks = len(keys) // 2
+    assert chunks >= 3
+
+    result = outbox.deliver(_sender(base), deadline=2)
+
+    assert result["sent"] == chunks and result["failed"] == 1 and result["pending"] == 0
+    rows = outbox.db.execute("SELECT seq, status, last_error FROM outbox WHERE chat_id = '1' ORDER BY seq").fetchall()
+    assert [r["status"] for r in rows] == ["failed"] * chunks
+    assert all(r["last_error"].startswith("앞 조각 실패") for r in rows[1:])
+    # 실패한 채팅은 첫 조각만 요청하고 뒤 조각은 보내지 않음
+    assert sum(1 for _, _, _, body in stub_server.server.requests if _form(body)["chat_id"] == "1") == 1
+
+
+def test_parse_error_is_resent_once_as_plain_text(stub_server):
+    def respond(method, path, headers, body):
+        form = _form(body)
+        if form.get("parse_mode") == "HTML":
+            return _error(400, "Bad Request: can't parse entities: Unsupported start tag \"x\"")
+        return _ok()
+
+    base = stub_server(respond)
+    outbox = Outbox(":memory:")
+    outbox.enqueue(["1"], "<b>제목</b> &amp; <x", batch="b")
+    result = outbox.deliver(_sender(base), deadline=2)
+
+    assert result["sent"] == 1 and result["failed"] == 0
+    last = _form(stub_server.server.requests[-1][3])
+    assert "parse_mode" not in last
+    assert last["text"] == "제목 & <x"
+
+
+def test_enqueue_dedupes_and_never_resends(stub_server):
+    base = stub_server(lambda *request: _ok())
+    outbox = Outbox(":memory:")
+    first = outbox.enqueue(["1"], "같은 메시지", batch="b")
+    assert outbox.enqueue(["1"], "같은 메시지", batch="b") == first
+    assert outbox.stats()["pending"] == 1
+
+    outbox.deliver(_sender(base), deadline=1)
+    outbox.enqueue(["1"], "같은 메시지", batch="b")
+    outbox.deliver(_sender(base), deadline=1)
+
+    assert len(stub_server.server.requests) == 1
+    assert outbox.stats() == {"pending": 0, "sent": 1, "failed": 0}
+
+
+def test_daily_report_escapes_titles_and_summaries(tmp_path):
+    results = {"channels": [{
+        "name": "A&B", "videos_found": 1,
+        "videos": [{"title": "x<y & z", "url": "https://www.youtube.com/watch?v=a", "has_transcript": True,
+                    "summary": "• 1 < 2 & 3", "summary_times": [65]}],
+    }]}
+    report = build_daily_report(results, output_dir=tmp_path)
+
+    assert "A&amp;B" in report
+    assert ">x&lt;y &amp; z</a>" in report
+    assert "• 1 &lt; 2 &amp; 3 <a href='https://www.youtube.com/watch?v=a&amp;t=65s'>▶ 1:05</a>" in report
+
+
+def test_video_alert_escapes_url():
+    alert = build_video_alert({"name": "A&B"}, {"title": "x<y", "url": "https://www.youtube.com/watch?v=a&t='1'"})
+    assert "<a href='https://www.youtube.com/watch?v=a&amp;t=&#x27;1&#x27;'>x&lt;y</a>" in alert
@@ -0,0 +1,47 @@
+"""자막 파일: 상시 실행 모드가 쓴 자막 파일 재사용, 요약 저장소 해시"""
+import hashlib
+
+import research_agent
+from research_agent import fill_transcript
+from transcript_files import CHUNK_CHARS, load_segments, portable_path, text_hash, transcript_file, write_segments
+
+SEGMENTS = [{"text": "첫 문장", "start": 0.0, "duration": 2.0}, {"text": "둘째\n문장", "start": 65.0, "duration": 3.0}]
+
+
+def test_live_transcript_file_is_copied_with_its_sidecar(tmp_path, monkeypatch):
+    monkeypatch.setattr(research_agent, "_fetch_segments", lambda video_id: SEGMENTS)
+    # 상시 실행 모드: 전날 폴더에 파일로 쓰고 저장소에는 경로만
+    live_video = fill_transcript({"video_id": "vid1"}, output_dir=tmp_path / "day1")
+    assert "transcript" not in live_video
+    live = {"vid1": {"transcript_success": True, "transcript_path": live_video["transcript_path"],
+                     "transcript_minutes": 1.1, "summary": "• 요약"}}
+    monkeypatch.setattr(research_agent, "_fetch_segments", lambda video_id: 1 / 0)  # 다시 받지 않음
+
+    video = fill_transcript({"video_id": "vid1"}, live, output_dir=tmp_path / "day2")
+
+    assert video["transcript_path"] == portable_path(transcript_file(tmp_path / "day2", "vid1"))
+    assert video["summary"] == "• 요약" and "transcript" not in video
+    assert list(load_segments(video).starts) == [0.0, 65.0]
+
+
+def test_missing_live_transcript_file_is_fetched_again(tmp_path, monkeypatch):
+    path = transcript_file(tmp_path / "day1", "vid1")
+    write_segments(path, SEGMENTS)
+    live = {"vid1": {"transcript_success": True, "transcript_path": portable_path(path)}}
+    path.unlink()
+    monkeypatch.setattr(research_agent, "_fetch_segments", lambda video_id: SEGMENTS)
+
+    video = fill_transcript({"video_id": "vid1"}, live, output_dir=tmp_path / "day2")
+    assert load_segments(video) is not None
+
+
+def test_text_hash_matches_whole_text_digest(tmp_path):
+    def digest(text):
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+    text = "a\nb c " + "가" * CHUNK_CHARS  # 줄바꿈과 여러 조각에 걸친 원문
+    assert text_hash({"transcript": text}) == digest(text)
+
+    path = transcript_file(tmp_path, "vid1")
+    write_segments(path, SEGMENTS)
+    assert text_hash({"transcript_path": str(path)}) == digest("첫 문장 둘째 문장")
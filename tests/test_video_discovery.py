@@ -0,0 +1,93 @@
+"""채널 Atom 피드: 로컬 피드 스텁으로 ETag/Last-Modified 조건부 GET과 304 처리 확인"""
+from datetime import datetime, timedelta, timezone
+
+from video_discovery import FEED_LIMIT, FeedBackend
+
+CHANNEL_ID = "UCtest"
+
+
+def atom(videos: list) -> str:
+    """[(video_id, title, 경과 시간(시간))] → YouTube 채널 피드 형식"""
+    now = datetime.now(timezone.utc)
+    entries = "".join(
+        f"""<entry>
+  <yt:videoId>{video_id}</yt:videoId>
+  <yt:channelId>{CHANNEL_ID}</yt:channelId>
+  <title>{title}</title>
+  <published>{(now - timedelta(hours=age)).isoformat(timespec="seconds")}</published>
+  <media:group><media:community><media:statistics views="1234"/></media:community></media:group>
+</entry>"""
+        for video_id, title, age in videos
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<feed xmlns="http://www.w3.org/2005/Atom" xmlns:yt="http://www.youtube.com/xml/schemas/2015"'
+        f' xmlns:media="http://search.yahoo.com/mrss/">{entries}</feed>'
+    )
+
+
+class FeedStub:
+    """ETag가 같으면 304, 다르면 현재 피드를 돌려주는 채널 피드 서버"""
+
+    def __init__(self, videos: list, etag: str = '"v1"'):
+        self.videos = videos
+        self.etag = etag
+        self.last_modified = "Mon, 01 Jan 2024 00:00:00 GMT"
+
+    def __call__(self, method, path, headers, body):
+        assert path == f"/feeds/videos.xml?channel_id={CHANNEL_ID}"
+        if headers.get("If-None-Match") == self.etag:
+            return 304, {"ETag": self.etag}, b""
+        return 200, {"Content-Type": "application/atom+xml", "ETag": self.etag,
+                     "Last-Modified": self.last_modified}, atom(self.videos)
+
+
+def test_conditional_get_uses_etag_and_serves_304_from_cache(stub_server, tmp_path):
+    feed = FeedStub([("new1", "새 영상", 2), ("old1", "지난 영상", 100)])
+    backend = FeedBackend(base=stub_server(feed), cache_dir=tmp_path)
+
+    first = backend.entries(CHANNEL_ID)
+    second = backend.entries(CHANNEL_ID)
+
+    assert [e["video_id"] for e in first] == ["new1", "old1"]
+    assert second == first
+    requests = stub_server.server.requests
+    assert "If-None-Match" not in requests[0][2]
+    assert requests[1][2]["If-None-Match"] == '"v1"'
+    assert requests[1][2]["If-Modified-Since"] == feed.last_modified
+
+
+def test_changed_etag_refreshes_entries(stub_server, tmp_path):
+    feed = FeedStub([("a", "A", 1)])
+    backend = FeedBackend(base=stub_server(feed), cache_dir=tmp_path)
+    backend.entries(CHANNEL_ID)
+
+    feed.videos, feed.etag = [("b", "B", 0.5), ("a", "A", 1)], '"v2"'
+    assert [e["video_id"] for e in backend.entries(CHANNEL_ID)] == ["b", "a"]
+    assert backend._load_cache(CHANNEL_ID)["etag"] == '"v2"'
+
+
+def test_304_without_cache_refetches_unconditionally(stub_server, tmp_path):
+    feed = FeedStub([("a", "A", 1)])
+    backend = FeedBackend(base=stub_server(feed), cache_dir=tmp_path)
+    # 조건부 헤더는 보냈지만 캐시 항목이 없는 상태 (캐시 파일 손상/유실)
+    tmp_path.joinpath(f"{CHANNEL_ID}.json").write_text('{"etag": "\\"v1\\""}', encoding="utf-8")
+
+    assert [e["video_id"] for e in backend.entries(CHANNEL_ID)] == ["a"]
+    assert "If-None-Match" not in stub_server.server.requests[-1][2]
+
+
+def test_discover_filters_by_age_and_falls_back_when_feed_is_full(stub_server, tmp_path):
+    feed = FeedStub([("new", "새 영상", 3), ("old", "지난 영상", 72)])
+    backend = FeedBackend(base=stub_server(feed), cache_dir=tmp_path)
+    channel = {"handle": "@test", "channel_id": CHANNEL_ID}
+
+    videos = backend.discover(channel, max_results=5, hours=24)
+    assert [v["video_id"] for v in videos] == ["new"]
+    assert videos[0]["view_count"] == "1,234 views"
+    assert backend.discover({"handle": "@test"}, 5, 24) is None  # 채널 ID가 없으면 다음 백엔드로
+
+    # 피드 15개가 모두 기간 안이면 잘린 영상이 있을 수 있으므로 scrapetube에 넘김
+    feed.videos, feed.etag = [(f"v{i}", f"영상 {i}", 1 + i * 0.1) for i in range(FEED_LIMIT)], '"full"'
+    assert backend.discover(channel, max_results=30, hours=24) is None
+    assert len(backend.discover(channel, max_results=5, hours=24)) == 5
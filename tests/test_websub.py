@@ -0,0 +1,125 @@
+"""WebSub 수신 서버: 로컬 허브 흉내 서버로 구독 확인(challenge), 서명 검증, 중복 알림 무시 확인"""
+import hashlib
+import hmac
+import threading
+import urllib.error
+import urllib.request
+from urllib.parse import parse_qs, urlencode
+
+import pytest
+
+from websub import LEASE_SECONDS, WebSubServer, WebSubState, topic_for
+
+SECRET = "s3cret"
+CHANNEL = {"handle": "@test", "name": "테스트", "channel_id": "UCtest"}
+
+
+def notification(video_id: str, title: str = "새 영상") -> bytes:
+    return f"""<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom" xmlns:yt="http://www.youtube.com/xml/schemas/2015">
+  <entry>
+    <yt:videoId>{video_id}</yt:videoId>
+    <yt:channelId>{CHANNEL['channel_id']}</yt:channelId>
+    <title>{title}</title>
+    <published>2026-01-01T00:00:00+00:00</published>
+  </entry>
+</feed>""".encode("utf-8")
+
+
+def sign(body: bytes, secret: str = SECRET) -> str:
+    return "sha1=" + hmac.new(secret.encode("utf-8"), body, hashlib.sha1).hexdigest()
+
+
+def request(url: str, data: bytes = None, headers: dict = None) -> tuple:
+    try:
+        with urllib.request.urlopen(urllib.request.Request(url, data=data, headers=headers or {}), timeout=5) as resp:
+            return resp.status, resp.read().decode("utf-8")
+    except urllib.error.HTTPError as e:
+        return e.code, ""
+
+
+@pytest.fixture
+def server():
+    state = WebSubState(":memory:")
+    woken = threading.Event()
+    server = WebSubServer(state, [CHANNEL], host="127.0.0.1", port=0, path="/websub", callback_url="",
+                          secret=SECRET, on_notification=woken.set).start()
+    server.url = f"http://127.0.0.1:{server.port}/websub"
+    server.woken = woken
+    yield server
+    server.stop()
+    state.close()
+
+
+def verify(server, mode="subscribe", topic=None, challenge="abc123", lease=LEASE_SECONDS) -> tuple:
+    query = {"hub.mode": mode, "hub.topic": topic or topic_for(CHANNEL["channel_id"]),
+             "hub.challenge": challenge, "hub.lease_seconds": lease}
+    return request(f"{server.url}?{urlencode(query)}")
+
+
+def test_challenge_is_echoed_only_for_requested_topics(server):
+    assert verify(server) == (404, "")  # 요청하지 않은 구독 확인은 거부
+
+    server.state.mark_requested(CHANNEL)
+    assert verify(server) == (200, "abc123")
+    assert server.state.get_subscription(topic_for("UCtest"))["status"] == "active"
+    assert server.state.active_handles() == {"@test"}
+    assert not server.state.needs_subscribe("UCtest")
+
+    assert verify(server, mode="unsubscribe", challenge="bye") == (200, "bye")
+    assert server.state.active_handles() == set()
+
+
+def test_signature_mismatch_is_accepted_but_ignored(server):
+    body = notification("vid1")
+    assert request(server.url, body, {"X-Hub-Signature": sign(body, "wrong")})[0] == 202
+    assert request(server.url, body)[0] == 202  # 서명 없음
+    assert server.state.pending_notifications() == []
+    assert not server.woken.is_set()
+
+    assert request(server.url, body, {"X-Hub-Signature": sign(body)})[0] == 202
+    assert [n["video_id"] for n in server.state.pending_notifications()] == ["vid1"]
+    assert server.woken.is_set()
+
+
+def test_duplicate_video_id_is_stored_once(server):
+    first = notification("vid1", "원래 제목")
+    again = notification("vid1", "수정한 제목")
+    for body in (first, again):
+        assert request(server.url, body, {"X-Hub-Signature": sign(body)})[0] == 202
+
+    pending = server.state.pending_notifications()
+    assert [(n["video_id"], n["title"]) for n in pending] == [("vid1", "원래 제목")]
+
+    server.state.mark_processed("vid1")
+    assert request(server.url, first, {"X-Hub-Signature": sign(first)})[0] == 202
+    assert server.state.pending_notifications() == []
+
+
+def test_subscribe_round_trip_with_hub_stand_in(server, stub_server):
+    """허브 흉내 서버: 구독 요청을 받으면 콜백으로 확인 요청을 보내고 challenge 응답을 기록"""
+    verified = []
+
+    def hub(method, path, headers, body):
+        form = {k: v[0] for k, v in parse_qs(body.decode("utf-8")).items()}
+        assert form["hub.secret"] == SECRET and form["hub.mode"] == "subscribe"
+
+        def confirm():
+            query = {"hub.mode": "subscribe", "hub.topic": form["hub.topic"],
+                     "hub.challenge": "xyz", "hub.lease_seconds": str(LEASE_SECONDS)}
+            verified.append(request(f"{form['hub.callback']}?{urlencode(query)}"))
+        thread = threading.Thread(target=confirm)
+        thread.start()
+        hub.threads.append(thread)
+        return 202, {}, b""
+
+    hub.threads = []
+    server.hub = stub_server(hub)
+    server.callback_url = server.url
+
+    assert server.renew_subscriptions() == 1
+    for thread in hub.threads:
+        thread.join(5)
+    assert verified == [(200, "xyz")]
+    assert server.state.active_handles() == {"@test"}
+    assert server.renew_subscriptions() == 0  # 만료 전이라 다시 요청하지 않음
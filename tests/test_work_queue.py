@@ -0,0 +1,139 @@
+"""작업 큐: 임대 만료, heartbeat, 실패/백오프, 모두 처리 후 종료, 일시적 오류 재시도"""
+import time
+import urllib.error
+
+import pytest
+
+import research_agent
+import research_queue
+import work_queue
+from work_queue import Heartbeat, WorkQueue, run_worker
+
+
+@pytest.fixture
+def queue(tmp_path):
+    with WorkQueue(tmp_path / "queue.sqlite", lease_seconds=0.3) as q:
+        yield q
+
+
+def test_expired_lease_is_taken_over_by_another_worker(queue):
+    queue.enqueue("r", "video", "video:a", {})
+    first = queue.lease("r", owner="w1")
+    assert first is not None and queue.lease("r", owner="w2") is None
+
+    time.sleep(0.35)
+    second = queue.lease("r", owner="w2")
+    assert second.id == first.id and second.attempts == 2
+    # 늦게 끝난 원래 워커의 실패 보고는 새 워커의 처리를 방해하지 않음
+    queue.fail(first, "w1", "late")
+    assert queue.counts("r")["leased"] == 1
+
+
+def test_expired_lease_without_attempts_left_fails(queue):
+    queue.enqueue("r", "video", "video:a", {}, max_attempts=1)
+    queue.lease("r", owner="w1")
+    time.sleep(0.35)
+    assert queue.lease("r", owner="w2") is None
+    assert queue.counts("r")["failed"] == 1
+    assert queue.results("r", "video")[0]["error"] == "임대 만료"
+
+
+def test_heartbeat_keeps_lease_alive(queue):
+    queue.enqueue("r", "video", "video:a", {})
+    job = queue.lease("r", owner="w1")
+    with Heartbeat(queue, job, "w1") as beat:
+        time.sleep(0.7)  # 임대 기간의 두 배 이상
+        assert queue.lease("r", owner="w2") is None
+    assert not beat.lost
+    assert queue.heartbeat(job, "w2") is False
+
+
+def test_fail_backs_off_then_gives_up(queue, monkeypatch):
+    monkeypatch.setattr(work_queue, "RETRY_BASE", 0.2)
+    queue.enqueue("r", "video", "video:a", {}, max_attempts=2)
+
+    job = queue.lease("r", owner="w1")
+    queue.fail(job, "w1", "boom")
+    assert queue.counts("r")["queued"] == 1
+    assert queue.lease("r", owner="w1") is None  # 백오프 중
+
+    time.sleep(0.25)
+    job = queue.lease("r", owner="w1")
+    assert job.attempts == 2
+    queue.fail(job, "w1", "boom again")
+    assert queue.counts("r") == {"queued": 0, "leased": 0, "done": 0, "failed": 1}
+    assert queue.results("r", "video")[0]["error"] == "boom again"
+
+
+def test_run_worker_drains_and_retries(queue, monkeypatch):
+    monkeypatch.setattr(work_queue, "RETRY_BASE", 0.0)
+    calls = {"a": 0, "b": 0}
+
+    def handler(job, q):
+        calls[job.payload["name"]] += 1
+        if job.payload["name"] == "a" and calls["a"] < 2:
+            raise RuntimeError("일시적 오류")
+        if job.payload["name"] == "b" and calls["b"] == 1:
+            q.enqueue(job.run, "task", "task:b2", {"name": "b"})
+        return {"ok": job.payload["name"]}
+
+    queue.enqueue("r", "task", "task:a", {"name": "a"})
+    queue.enqueue("r", "task", "task:b", {"name": "b"})
+    queue.enqueue("other", "task", "task:x", {"name": "a"})
+
+    stats = run_worker(queue, "r", {"task": handler}, poll_interval=0.01)
+
+    assert stats == {"done": 3, "failed": 1}
+    assert queue.is_drained("r") and not queue.is_drained("other")
+    assert queue.enqueue("r", "task", "task:a", {"name": "a"}) is False  # 같은 run/key는 한 번만
+
+
+def test_channel_job_retries_transient_errors(queue, monkeypatch, tmp_path):
+    monkeypatch.setattr(work_queue, "RETRY_BASE", 0.0)
+    monkeypatch.setattr(research_agent, "polite_delay", lambda: None)
+    calls = []
+
+    def discover(channel, max_results, hours, backends=None):
+        calls.append(channel["handle"])
+        if channel["handle"] == "@net":
+            raise urllib.error.URLError("connection refused")
+        if channel["handle"] == "@gone":
+            raise ValueError("channel not found")
+        return []
+
+    monkeypatch.setattr("video_discovery.discover_videos", discover)
+    channels = [{"handle": "@net", "name": "N"}, {"handle": "@gone", "name": "G"}, {"handle": "@ok", "name": "O"}]
+    research_queue.enqueue_channels(queue, "r", channels)
+    run_worker(queue, "r", research_queue.HANDLERS, poll_interval=0.01)
+
+    assert calls.count("@net") == work_queue.MAX_ATTEMPTS  # 일시적 오류는 재시도
+    assert calls.count("@gone") == 1                       # 그 밖의 오류는 한 번만
+    results = research_queue.collect_results(queue, "r", tmp_path, channels)
+    assert results["scanned"] == ["@ok"]
+    assert results["failed_channels"] == ["@net", "@gone"]
+
+
+def test_video_job_writes_transcript_files_and_rescan_clears_run(queue, monkeypatch, tmp_path):
+    from transcript_files import load_segments
+
+    monkeypatch.setattr(research_agent, "polite_delay", lambda: None)
+    monkeypatch.setattr("live_store.open_live_store", lambda: None)
+    monkeypatch.setattr(research_agent, "_fetch_segments", lambda video_id: [
+        {"text": "첫 문장", "start": 0.0, "duration": 2.0}, {"text": "둘째\n문장", "start": 65.0, "duration": 3.0}])
+    video = {"video_id": "vid1", "title": "영상", "url": "https://www.youtube.com/watch?v=vid1"}
+    monkeypatch.setattr("video_discovery.discover_videos", lambda *args, **kwargs: [dict(video)])
+    channels = [{"handle": "@ok", "name": "O", "url": "https://www.youtube.com/@ok"}]
+
+    research_queue.enqueue_channels(queue, "r", channels, output_dir=tmp_path)
+    run_worker(queue, "r", research_queue.HANDLERS, poll_interval=0.01)
+
+    result = queue.results("r", "video")[0]["result"]
+    assert result["text"] == "" and result["success"] is True  # 큐에는 자막 원문 대신 경로만
+    collected = research_queue.collect_results(queue, "r", tmp_path, channels)
+    stored = collected["channels"][0]["videos"][0]
+    assert "transcript" not in stored
+    segments = load_segments(stored)
+    assert segments is not None and list(segments.starts) == [0.0, 65.0]
+
+    assert queue.clear("r") == 2
+    assert queue.counts("r") == {"queued": 0, "leased": 0, "done": 0, "failed": 0}
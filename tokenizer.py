@@ -0,0 +1,73 @@
+"""
+가벼운 한국어/영어 토크나이저 (외부 형태소 분석기 없이 순수 파이썬)
+- 한글 / 영문 구간을 나눠 추출 → "AI가", "GPT를"처럼 붙어 있어도 영문 단어와 조사가 분리됨
+- 한글 단어는 끝의 서술 어미(했다, 합니다, 하는 …)와 조사(에서는, 으로, 을/를, 이/가 …)를 가장 긴 것부터 한 번씩 떼어냄
+  (남는 어간이 두 글자 미만이면 떼지 않음: "평가", "아이" 등 보호)
+- 문자 n-gram(char_ngrams)은 색인에서 부분 일치 검색("에이전트" → "AI에이전트", "에이전트형")에 사용
+
+keyword 집계(daily_stats), 주제 묶기(topic_clusters), 자막 색인(transcript_index)이 같은 규칙을 씁니다.
+"""
+import re
+
+_WORD = re.compile(r"[가-힣]+|[A-Za-z][A-Za-z0-9+#]*|\d+[A-Za-z]+")
+
+# 긴 것부터 검사 (에서는 → 에서 → 에 순)
+_ENDINGS = tuple(sorted((
+    "했습니다", "합니다", "했어요", "해요", "했다", "한다", "하는", "해서", "하고", "했고", "하면", "하게", "되는", "됩니다",
+    "이었다", "입니다", "이에요", "이다",
+), key=len, reverse=True))
+_PARTICLES = tuple(sorted((
+    "에서부터", "으로부터", "에게서", "한테서", "이라고", "이라는", "에서는", "에서도", "으로는", "으로도", "까지는", "부터는",
+    "에게는", "에서", "으로", "까지", "부터", "에게", "한테", "께서", "처럼", "보다", "마다", "조차", "이나", "이랑", "라고",
+    "라는", "하고", "은", "는", "이", "가", "을", "를", "의", "에", "로", "와", "과", "도", "만", "랑",
+), key=len, reverse=True))
+# 조사처럼 끝나지만 한 단어인 외래어
+_KEEP = {"마이크로", "매크로", "프로", "레트로", "메타버스", "테슬라", "엔비디아", "카메라", "데이터", "소프트웨어", "하드웨어"}
+
+STOPWORDS = {
+    # 영어
+    "the", "and", "for", "you", "that", "this", "with", "are", "was", "have", "but", "not", "what",
+    "can", "all", "just", "your", "from", "they", "will", "about", "there", "like", "one", "so", "it",
+    "is", "to", "of", "in", "on", "a", "an", "be", "we", "i", "if", "or", "do", "my", "me",
+    # 한국어 (말버릇/지시어/서술어)
+    "그리고", "그래서", "그런데", "근데", "이제", "진짜", "정말", "여러분", "이거", "그거", "저거", "이렇게",
+    "그렇게", "저는", "제가", "우리", "있는", "하는", "합니다", "있습니다", "됩니다", "같은", "이런", "그런",
+    "어떤", "하면", "해서", "그냥", "약간", "많이", "너무", "좀", "뭐", "것", "거", "수", "때", "더", "또",
+    "네", "자", "음", "어", "아", "오늘", "영상", "구독", "좋아요", "있습니", "없습니", "있다", "없다", "있어요",
+}
+
+
+def _strip(word: str, suffixes: tuple) -> str:
+    for suffix in suffixes:
+        if word.endswith(suffix) and len(word) - len(suffix) >= 2:
+            return word[: -len(suffix)]
+    return word
+
+
+def normalize(word: str) -> str:
+    """단어 하나를 색인 토큰으로 (영문은 소문자, 한글은 어미/조사 제거)"""
+    if word[0] < "가":
+        return word.lower()
+    if word in _KEEP:
+        return word
+    return _strip(_strip(word, _ENDINGS), _PARTICLES)
+
+
+def words(text: str):
+    """(원문 단어, 정규화 토큰) 쌍. 불용어/한 글자 토큰은 제외."""
+    for word in _WORD.findall(text):
+        token = normalize(word)
+        if len(token) >= 2 and token not in STOPWORDS:
+            yield (token if word[0] >= "가" else word), token
+
+
+def tokenize(text: str) -> list:
+    """정규화 토큰 목록"""
+    return [token for _, token in words(text)]
+
+
+def char_ngrams(token: str, n: int = 2) -> list:
+    """문자 n-gram (n보다 짧은 토큰은 그대로)"""
+    if len(token) <= n:
+        return [token]
+    return [token[i:i + n] for i in range(len(token) - n + 1)]
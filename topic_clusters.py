@@ -0,0 +1,191 @@
+"""
+로컬 주제 묶기: 오늘 영상들을 TF-IDF 벡터로 만들어 비슷한 영상끼리 주제 그룹으로 묶음 (LLM 호출 없음)
+- 영상 텍스트(제목 ×3 + 요약/핵심 사실 + 자막)를 단어 단위로 나눠 해시 특징(2^18차원)으로 매핑
+- SciPy 희소 행렬로 TF(로그) × IDF, 행 정규화 → 코사인 유사도
+- 평균 연결 계층 군집(거리 DIST_THRESHOLD 이하끼리 묶음, 최대 MAX_TOPICS개)
+- 그룹마다 중심 벡터의 상위 단어로 키워드/라벨, 중심에 가장 가까운 영상을 대표 영상으로 선택
+
+결과(topics.json)는 슬라이드 주제 구성과 인포그래픽 main_topics에 쓰이고, LLM 프롬프트에는 짧은 개요로 들어갑니다.
+NumPy/SciPy가 없으면 이 단계는 건너뜁니다.
+"""
+import logging
+import time
+import zlib
+from collections import Counter, defaultdict
+from itertools import chain
+
+try:
+    import numpy as np
+    from scipy import sparse
+    from scipy.cluster.hierarchy import fcluster, linkage
+    from scipy.spatial.distance import squareform
+    HAS_SCIPY = True
+except ImportError:
+    HAS_SCIPY = False
+
+from tokenizer import tokenize
+
+logger = logging.getLogger(__name__)
+
+N_FEATURES = 1 << 18
+DIST_THRESHOLD = 0.85     # 코사인 거리 (1 - 유사도) 이하면 같은 주제
+MAX_TOPICS = 6
+TITLE_WEIGHT = 3          # 제목 단어를 자막보다 강하게 반영
+TOP_KEYWORDS = 5
+
+
+# ─────────────────────────────────────────────
+# 벡터화
+# ─────────────────────────────────────────────
+def _feature(token: str) -> int:
+    return zlib.crc32(token.encode("utf-8")) & (N_FEATURES - 1)
+
+
+def video_text(video: dict) -> tuple:
+    """(제목, 본문 조각들) - 본문은 요약/핵심 사실을 앞에 두고 자막은 파일에서 조각 단위로 읽음"""
+    from transcript_files import iter_text
+
+    head = " ".join([video.get("summary", ""), " ".join(video.get("facts", []))])
+    return video.get("title", ""), chain([head], iter_text(video))
+
+
+def vectorize(docs) -> tuple:
+    """[(제목, 본문 조각들)] → (정규화된 TF-IDF CSR 행렬, 특징 번호 → 대표 단어)"""
+    rows, cols, vals = [], [], []
+    names = defaultdict(Counter)
+    n = 0
+    for i, (title, chunks) in enumerate(docs):
+        tokens = Counter(tokenize(title) * TITLE_WEIGHT)
+        for chunk in chunks:
+            tokens.update(tokenize(chunk))
+        counts = Counter()
+        for token, count in tokens.items():
+            feature = _feature(token)
+            counts[feature] += count
+            names[feature][token] += count
+        rows.extend([i] * len(counts))
+        cols.extend(counts.keys())
+        vals.extend(counts.values())
+        n = i + 1
+
+    matrix = sparse.csr_matrix(
+        (np.asarray(vals, dtype=np.float64), (np.asarray(rows, dtype=np.int32), np.asarray(cols, dtype=np.int32))),
+        shape=(n, N_FEATURES),
+    )
+    matrix.data = 1.0 + np.log(matrix.data)                       # 로그 TF
+    df = np.bincount(matrix.indices, minlength=N_FEATURES)
+    idf = np.log((1.0 + n) / (1.0 + df)) + 1.0
+    matrix = matrix.multiply(idf).tocsr()
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    norms[norms == 0] = 1.0
+    matrix = sparse.diags(1.0 / norms) @ matrix
+    return matrix.tocsr(), {feature: counter.most_common(1)[0][0] for feature, counter in names.items()}
+
+
+def _assign(matrix) -> "np.ndarray":
+    n = matrix.shape[0]
+    if n == 1:
+        return np.ones(1, dtype=int)
+    similarity = (matrix @ matrix.T).toarray()
+    distance = np.clip(1.0 - similarity, 0.0, 1.0)
+    np.fill_diagonal(distance, 0.0)
+    tree = linkage(squareform(distance, checks=False), method="average")
+    labels = fcluster(tree, t=DIST_THRESHOLD, criterion="distance")
+    if labels.max() > MAX_TOPICS:
+        labels = fcluster(tree, t=MAX_TOPICS, criterion="maxclust")
+    return labels
+
+
+# ─────────────────────────────────────────────
+# 주제 묶기
+# ─────────────────────────────────────────────
+def cluster_topics(research_results: dict) -> dict:
+    """research_results의 영상을 주제 그룹으로 묶습니다. 영상이 없거나 SciPy가 없으면 None."""
+    if not HAS_SCIPY:
+        logger.warning("⚠️ numpy/scipy가 설치되지 않아 로컬 주제 묶기를 건너뜁니다.")
+        return None
+
+    videos = [
+        {**video, "channel": channel["name"]}
+        for channel in (research_results or {}).get("channels", [])
+        for video in channel.get("videos", [])
+    ]
+    if not videos:
+        return None
+
+    started = time.perf_counter()
+    matrix, names = vectorize(video_text(v) for v in videos)
+    labels = _assign(matrix)
+
+    topics = []
+    for label in np.unique(labels):
+        members = np.flatnonzero(labels == label)
+        centroid = np.asarray(matrix[members].sum(axis=0)).ravel()
+        top = [int(f) for f in np.argsort(centroid)[::-1][: TOP_KEYWORDS * 2] if centroid[f] > 0]
+        keywords = list(dict.fromkeys(names[f] for f in top))[:TOP_KEYWORDS]
+        scores = matrix[members] @ centroid / max(float(np.linalg.norm(centroid)), 1e-12)
+        order = members[np.argsort(-scores)]
+        topics.append({
+            "label": " · ".join(keywords[:3]) or videos[order[0]]["title"][:30],
+            "keywords": keywords,
+            "size": len(members),
+            "channels": sorted({videos[i]["channel"] for i in members}),
+            "representative": videos[order[0]]["video_id"],
+            "videos": [
+                {
+                    "video_id": videos[i]["video_id"],
+                    "title": videos[i]["title"],
+                    "channel": videos[i]["channel"],
+                    "url": videos[i]["url"],
+                    "summary": videos[i].get("summary", ""),
+                }
+                for i in order
+            ],
+        })
+    topics.sort(key=lambda t: (-t["size"], -len(t["channels"])))
+    for i, topic in enumerate(topics, 1):
+        topic["id"] = i
+
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    logger.info(f"🧭 로컬 주제 묶기: 영상 {len(videos)}개 → 주제 {len(topics)}개 ({elapsed_ms:.0f}ms)")
+    return {"method": "tfidf-hash/average-linkage", "video_count": len(videos),
+            "elapsed_ms": round(elapsed_ms, 1), "topics": topics}
+
+
+def topics_outline(topics: dict, max_videos: int = 3) -> str:
+    """LLM 프롬프트에 넣을 짧은 주제 개요."""
+    lines = []
+    for topic in (topics or {}).get("topics", []):
+        lines.append(f"- 주제 {topic['id']}: {', '.join(topic['keywords'])} (영상 {topic['size']}개)")
+        for video in topic["videos"][:max_videos]:
+            lines.append(f"  - {video['title']} ({video['channel']})")
+    return "\n".join(lines)
+
+
+def topic_slides(topics: dict) -> list:
+    """주제 그룹 → 슬라이드 (LLM 없이 사용하는 폴백 슬라이드)"""
+    slides = []
+    for topic in (topics or {}).get("topics", []):
+        content = []
+        for video in topic["videos"][:4]:
+            first = video["summary"].split("\n")[0].lstrip("• ").strip() if video.get("summary") else ""
+            content.append(f"{video['title']} ({video['channel']})" + (f" - {first}" if first else ""))
+        slides.append({
+            "title": f"주제 {topic['id']}: {topic['label']}",
+            "content": content,
+            "notes": f"키워드: {', '.join(topic['keywords'])} / 영상 {topic['size']}개, 채널 {len(topic['channels'])}개",
+        })
+    return slides
+
+
+def main_topics(topics: dict) -> list:
+    """주제 그룹 → 인포그래픽 main_topics 형식"""
+    result = []
+    for topic in (topics or {}).get("topics", [])[:5]:
+        representative = topic["videos"][0]
+        result.append({
+            "title": topic["label"],
+            "description": f"영상 {topic['size']}개 · 채널 {len(topic['channels'])}개 · 대표: {representative['title']}",
+            "keywords": topic["keywords"],
+        })
+    return result
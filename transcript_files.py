@@ -0,0 +1,348 @@
+"""
+자막 파일 저장소: 자막을 메모리에 모아 두지 않고 영상별 파일로 흘려 쓰고, 필요한 곳에서 조각 단위로 읽음
+- output/YYYY-MM-DD/transcripts/<video_id>.txt : 자막 세그먼트 한 줄씩 (세그먼트 안의 줄바꿈은 공백으로)
+- output/YYYY-MM-DD/transcripts/<video_id>.seg : 세그먼트 시각 사이드카 (little-endian 바이너리)
+    b"MSG1" + uint32 개수 n + float32 시작[n] + float32 길이[n] + uint32 .txt 바이트 위치[n + 1]
+  → Segments가 array('f') / array('I')로 읽어 세그먼트 dict 목록 없이 시각 검색, 시간 구간별 읽기, &t= 링크에 사용
+- research_results의 영상에는 자막 원문 대신 "transcript_path"(OUTPUT_DIR 기준 상대 경로)만 기록
+- 읽는 쪽(요약 저장소, 주제 묶기, 집계, 색인, 채널 요약 마크다운)은 iter_text()로 CHUNK_CHARS씩 받아 처리하므로
+  영상 수나 자막 길이(3시간 라이브 등)가 늘어도 한 번에 메모리에 올라가는 자막은 조각 하나 분량
+
+예전 결과처럼 "transcript"에 원문이 들어 있는 영상도 같은 함수로 읽을 수 있습니다.
+STREAM_TRANSCRIPTS=0이면 예전처럼 research_results.json에 원문을 넣습니다.
+"""
+import bisect
+import hashlib
+import os
+import re
+import shutil
+import struct
+import sys
+from array import array
+from collections import Counter
+from pathlib import Path
+
+from config import OUTPUT_DIR
+
+TRANSCRIPTS_DIRNAME = "transcripts"
+CHUNK_CHARS = 1 << 16
+SEGMENTS_MAGIC = b"MSG1"
+LOCATE_WINDOW_SECONDS = 30  # 요약 문장 위치를 찾을 때 비교하는 자막 구간 길이
+CHUNK_WINDOW_SECONDS = 60  # 긴 자막을 나눌 때 묶는 최소 시간 단위
+
+# 문장 끝 (구두점 또는 자주 쓰는 종결 어미 뒤 공백)
+_SENTENCE_END = re.compile(r"(?:[.?!。]|니다|어요|에요|세요|죠)(?=\s)")
+
+
+def transcript_file(output_dir: Path, video_id: str) -> Path:
+    return Path(output_dir) / TRANSCRIPTS_DIRNAME / f"{video_id}.txt"
+
+
+def portable_path(path: Path) -> str:
+    """OUTPUT_DIR 아래면 상대 경로 (체크아웃 위치가 달라도 같은 결과 JSON을 읽을 수 있도록)"""
+    path = Path(path).resolve()
+    try:
+        return path.relative_to(OUTPUT_DIR.resolve()).as_posix()
+    except ValueError:
+        return str(path)
+
+
+def resolve_path(ref: str) -> Path:
+    path = Path(ref)
+    return path if path.is_absolute() else OUTPUT_DIR / path
+
+
+# ─────────────────────────────────────────────
+# 쓰기
+# ─────────────────────────────────────────────
+def _le(values: array) -> array:
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values
+
+
+def write_segments(path: Path, segments) -> dict:
+    """세그먼트({"text", "start", "duration"})를 한 줄씩 파일에 쓰고, 시각은 사이드카(.seg)에 배열로 저장합니다.
+
+    글자 수/세그먼트 수/길이(분)를 반환합니다.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    starts, durations, offsets = array("f"), array("f"), array("I")
+    chars = pos = 0
+    with open(tmp, "wb") as f:
+        for segment in segments:
+            if starts:
+                f.write(b"\n")
+                chars, pos = chars + 1, pos + 1
+            text = " ".join(segment["text"].split("\n"))
+            data = text.encode("utf-8")
+            offsets.append(pos)
+            f.write(data)
+            chars, pos = chars + len(text), pos + len(data)
+            starts.append(segment["start"])
+            durations.append(segment["duration"])
+        offsets.append(pos)
+    os.replace(tmp, path)
+    _write_sidecar(path.with_suffix(".seg"), starts, durations, offsets)
+    end = max((s + d for s, d in zip(starts, durations)), default=0.0)
+    return {"char_count": chars, "segment_count": len(starts), "duration_minutes": round(end / 60, 1)}
+
+
+def _write_sidecar(path: Path, starts: array, durations: array, offsets: array):
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "wb") as f:
+        f.write(SEGMENTS_MAGIC + struct.pack("<I", len(starts)))
+        for values in (starts, durations, offsets):
+            f.write(_le(values).tobytes())
+    os.replace(tmp, path)
+
+
+def spill(video: dict, output_dir: Path) -> dict:
+    """메모리에 있는 자막 원문을 파일로 옮기고 video에는 경로만 남깁니다 (작업 큐 결과 등)."""
+    text = video.get("transcript")
+    if text:
+        path = transcript_file(output_dir, video["video_id"])
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+        video["transcript_path"] = portable_path(path)
+        del video["transcript"]
+    return video
+
+
+def adopt(video: dict, output_dir: Path) -> dict:
+    """다른 폴더(상시 실행 모드가 쓴 날짜 등)에 있는 자막 파일을 사이드카와 함께 output_dir로 복사하고 경로를 바꿉니다."""
+    source = resolve_path(video["transcript_path"])
+    target = transcript_file(output_dir, video["video_id"])
+    if source.resolve() != target.resolve():
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(source, target)
+        if source.with_suffix(".seg").exists():
+            shutil.copyfile(source.with_suffix(".seg"), target.with_suffix(".seg"))
+        video["transcript_path"] = portable_path(target)
+    return video
+
+
+# ─────────────────────────────────────────────
+# 읽기
+# ─────────────────────────────────────────────
+def has_transcript(video: dict) -> bool:
+    return bool(video.get("transcript_path") or video.get("transcript"))
+
+
+def _blocks(video: dict, chunk_chars: int):
+    if video.get("transcript_path"):
+        path = resolve_path(video["transcript_path"])
+        if path.exists():
+            with open(path, encoding="utf-8") as f:
+                while True:
+                    block = f.read(chunk_chars)
+                    if not block:
+                        break
+                    yield block
+        return
+    text = video.get("transcript", "")
+    for start in range(0, len(text), chunk_chars):
+        yield text[start:start + chunk_chars]
+
+
+def iter_text(video: dict, chunk_chars: int = CHUNK_CHARS):
+    """자막을 약 chunk_chars 글자씩 공백 경계에서 잘라 순서대로 내보냅니다 (줄바꿈은 공백으로)."""
+    carry = ""
+    for block in _blocks(video, chunk_chars):
+        block = carry + block.replace("\n", " ")
+        cut = block.rfind(" ")
+        if cut <= 0:
+            carry = block
+            continue
+        carry = block[cut:]
+        yield block[:cut]
+    if carry:
+        yield carry
+
+
+def read_text(video: dict, limit: int = None) -> str:
+    """자막 원문 (limit이면 앞 limit 글자까지만 읽음)"""
+    parts, size = [], 0
+    for chunk in iter_text(video):
+        parts.append(chunk)
+        size += len(chunk)
+        if limit is not None and size >= limit:
+            break
+    text = "".join(parts)
+    return text[:limit] if limit is not None else text
+
+
+def text_hash(video: dict) -> str:
+    """자막 원문의 sha256 앞 16자리 (조각 단위로 계산)
+
+    메모리 원문("transcript")은 그대로 해시해 예전 요약 저장소 항목과 같은 값이 되고,
+    파일은 세그먼트를 나눈 줄바꿈을 공백으로 바꿔 예전 " ".join(세그먼트) 원문과 같은 값으로 계산합니다.
+    """
+    from_file = bool(video.get("transcript_path"))
+    digest = hashlib.sha256()
+    for block in _blocks(video, CHUNK_CHARS):
+        digest.update((block.replace("\n", " ") if from_file else block).encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+# ─────────────────────────────────────────────
+# 세그먼트 시각
+# ─────────────────────────────────────────────
+class Segments:
+    """한 영상의 세그먼트 시각 배열 (시작/길이 float32, .txt 바이트 위치 uint32)과 자막 파일"""
+
+    def __init__(self, text_path: Path, starts: array, durations: array, offsets: array):
+        self.text_path = text_path
+        self.starts = starts
+        self.durations = durations
+        self.offsets = offsets
+
+    @classmethod
+    def load(cls, text_path: Path):
+        """사이드카가 없으면(예전 결과, 메모리에서 옮긴 자막) None"""
+        sidecar = Path(text_path).with_suffix(".seg")
+        if not sidecar.exists():
+            return None
+        data = sidecar.read_bytes()
+        if data[:4] != SEGMENTS_MAGIC:
+            return None
+        (n,) = struct.unpack_from("<I", data, 4)
+        arrays, pos = [], 8
+        for typecode, count in (("f", n), ("f", n), ("I", n + 1)):
+            values = array(typecode)
+            values.frombytes(data[pos:pos + 4 * count])
+            arrays.append(_le(values))
+            pos += 4 * count
+        return cls(Path(text_path), *arrays)
+
+    def __len__(self):
+        return len(self.starts)
+
+    def index_at(self, seconds: float) -> int:
+        """seconds 시점에 해당하는 세그먼트 번호"""
+        return max(bisect.bisect_right(self.starts, seconds) - 1, 0)
+
+    def text(self, first: int, last: int) -> str:
+        """세그먼트 first..last-1의 자막 (공백으로 연결). .txt에서 해당 바이트 범위만 읽음."""
+        with open(self.text_path, "rb") as f:
+            f.seek(self.offsets[first])
+            data = f.read(self.offsets[last] - self.offsets[first])
+        return data.decode("utf-8").replace("\n", " ").strip()
+
+    def windows(self, seconds: float):
+        """약 seconds초 단위 구간으로 (시작 초, 끝 초, 자막)을 차례로 내보냅니다 (세그먼트 경계에서 나눔)."""
+        first = 0
+        while first < len(self):
+            last = bisect.bisect_left(self.starts, self.starts[first] + seconds, first + 1)
+            end = self.starts[last - 1] + self.durations[last - 1]
+            yield self.starts[first], end, self.text(first, last)
+            first = last
+
+
+def load_segments(video: dict):
+    """video의 자막 파일에 대한 Segments (파일/사이드카가 없으면 None)"""
+    if not video.get("transcript_path"):
+        return None
+    return Segments.load(resolve_path(video["transcript_path"]))
+
+
+def locate(segments: Segments, sentences: list, window: float = LOCATE_WINDOW_SECONDS) -> list:
+    """요약 문장마다 단어가 가장 많이 겹치는 자막 구간의 시작 초 (겹치는 단어가 2개 미만이면 None)
+
+    구간마다 토큰 집합만 남기고, 여러 구간에 흔한 단어는 가중치를 낮춰 비교합니다.
+    """
+    from tokenizer import tokenize
+
+    spans = [(start, set(tokenize(text))) for start, _, text in segments.windows(window)]
+    df = Counter(token for _, tokens in spans for token in tokens)
+    result = []
+    for sentence in sentences:
+        wanted = set(tokenize(sentence))
+        best, best_score, best_hits = None, 0.0, 0
+        for start, tokens in spans:
+            shared = wanted & tokens
+            score = sum(1.0 / df[token] for token in shared)
+            if score > best_score:
+                best, best_score, best_hits = start, score, len(shared)
+        result.append(int(best) if best is not None and best_hits >= 2 else None)
+    return result
+
+
+def cite(video: dict) -> bool:
+    """요약 줄/핵심 사실마다 자막 위치(초)를 찾아 video["summary_times"] / ["fact_times"]에 기록합니다.
+
+    사이드카가 있는 영상만 처리하며, 기록했으면 True.
+    """
+    segments = load_segments(video) if video.get("summary") else None
+    if not segments:
+        return False
+    lines = video["summary"].strip().split("\n")
+    facts = video.get("facts", [])
+    times = locate(segments, lines + facts)
+    video["summary_times"] = times[:len(lines)]
+    video["fact_times"] = times[len(lines):]
+    return True
+
+
+# ─────────────────────────────────────────────
+# 요약용 구간 나누기
+# ─────────────────────────────────────────────
+def split_sentences(blocks, max_chars: int):
+    """텍스트 조각들을 약 max_chars 글자 이하 구간으로 다시 나눕니다 (문장 끝 → 공백 → 글자 수 순으로 자를 위치 선택)."""
+    buffer = ""
+    for block in blocks:
+        buffer = f"{buffer} {block}" if buffer else block
+        while len(buffer) > max_chars:
+            head = buffer[:max_chars]
+            ends = [m.end() for m in _SENTENCE_END.finditer(head)]
+            cut = ends[-1] if ends and ends[-1] > max_chars // 2 else head.rfind(" ")
+            if cut <= max_chars // 2:
+                cut = max_chars
+            yield buffer[:cut].strip()
+            buffer = buffer[cut:].strip()
+    if buffer.strip():
+        yield buffer.strip()
+
+
+def iter_chunks(video: dict, max_chars: int):
+    """요약용 구간 (시작 초, 끝 초, 자막)을 차례로 내보냅니다.
+
+    사이드카가 있으면 CHUNK_WINDOW_SECONDS 단위 시간 구간을 max_chars까지 묶고,
+    없으면 문장 경계에서 나눕니다 (시작/끝 초는 None).
+    """
+    segments = load_segments(video)
+    if segments is None:
+        for text in split_sentences(iter_text(video), max_chars):
+            yield None, None, text
+        return
+    start = end = None
+    parts, size = [], 0
+    for w_start, w_end, text in segments.windows(CHUNK_WINDOW_SECONDS):
+        if parts and size + len(text) > max_chars:
+            yield start, end, " ".join(parts)
+            parts, size = [], 0
+        if not parts:
+            start = w_start
+        if len(text) > max_chars:  # 한 구간이 너무 길면(구두점 없는 자막 등) 글자 수로 나눔
+            yield from ((w_start, w_end, piece) for piece in split_sentences([text], max_chars))
+            continue
+        parts.append(text)
+        size += len(text) + 1
+        end = w_end
+    if parts:
+        yield start, end, " ".join(parts)
+
+
+def deep_link(url: str, seconds) -> str:
+    """영상 URL에 &t=초 를 붙인 링크"""
+    if seconds is None:
+        return url
+    return f"{url}{'&' if '?' in url else '?'}t={int(seconds)}s"
+
+
+def timestamp(seconds) -> str:
+    seconds = int(seconds)
+    hours, rest = divmod(seconds, 3600)
+    return f"{hours}:{rest // 60:02d}:{rest % 60:02d}" if hours else f"{rest // 60}:{rest % 60:02d}"
@@ -0,0 +1,261 @@
+"""
+자막 역색인: 날짜별로 영상 자막/제목의 토큰 → (영상, 횟수) 목록을 배열로 저장하고, 여러 날짜를 합쳐 조회
+- output/YYYY-MM-DD/transcript_index/
+    meta.json      : {"version", "terms": 정렬된 토큰 목록, "docs": [{video_id, date, channel, handle, title, url}]}
+    offsets.i64    : 토큰 i의 게시 목록 범위 = postings[offsets[i]:offsets[i+1]] (CSR 형식, little-endian)
+    postings.i32   : 영상 번호 (토큰마다 오름차순)
+    counts.i32     : 해당 영상에서 토큰이 나온 횟수
+- 토큰화는 tokenizer.py (조사/어미 제거), 정확히 없는 검색어는 문자 2-gram으로 부분 일치 토큰을 찾아 확장
+- NumPy가 있으면 배열을 memmap으로 읽고 병합/빈도 계산을 벡터 연산으로 처리, 없으면 array 모듈로 동작
+
+사용법:
+    python cli.py search "에이전트" [--days 30] [--by-day]
+"""
+import bisect
+import json
+import logging
+import os
+import sys
+import time
+from array import array
+from collections import Counter, defaultdict
+from itertools import chain
+from pathlib import Path
+
+from config import OUTPUT_DIR
+from tokenizer import char_ngrams, tokenize
+from transcript_files import iter_text
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+logger = logging.getLogger(__name__)
+
+INDEX_DIRNAME = "transcript_index"
+INDEX_VERSION = 1
+_ARRAYS = (("offsets", "q", "<i8", ".i64"), ("postings", "i", "<i4", ".i32"), ("counts", "i", "<i4", ".i32"))
+
+
+def _read_array(path: Path, typecode: str, dtype: str):
+    if HAS_NUMPY:
+        if path.stat().st_size == 0:
+            return np.zeros(0, dtype=dtype)
+        return np.memmap(path, dtype=dtype, mode="r")
+    values = array(typecode)
+    with open(path, "rb") as f:
+        values.frombytes(f.read())
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def _write_array(path: Path, values, typecode: str):
+    values = array(typecode, values)
+    if sys.byteorder == "big":
+        values.byteswap()
+    path.write_bytes(values.tobytes())
+
+
+class TranscriptIndex:
+    """정렬된 토큰 목록 + CSR 배열 (offsets/postings/counts) 역색인"""
+
+    def __init__(self, terms: list, docs: list, offsets, postings, counts):
+        self.terms = terms
+        self.docs = docs
+        self.offsets = offsets
+        self.postings = postings
+        self.counts = counts
+        self._ngrams = None
+
+    # ─────────────────────────────────────────
+    # 생성 / 저장 / 불러오기
+    # ─────────────────────────────────────────
+    @classmethod
+    def build(cls, docs: list, texts) -> "TranscriptIndex":
+        """docs(메타데이터)와 같은 순서의 texts로 색인을 만듭니다. 각 text는 문자열 또는 문자열 조각들."""
+        by_term = defaultdict(list)
+        for doc_id, text in enumerate(texts):
+            counts = Counter()
+            for chunk in ([text] if isinstance(text, str) else text):
+                counts.update(tokenize(chunk))
+            for term, count in counts.items():
+                by_term[term].append((doc_id, count))
+        terms = sorted(by_term)
+        offsets, postings, counts = [0], [], []
+        for term in terms:
+            for doc_id, count in by_term[term]:
+                postings.append(doc_id)
+                counts.append(count)
+            offsets.append(len(postings))
+        return cls(terms, docs, array("q", offsets), array("i", postings), array("i", counts))
+
+    def save(self, path: Path):
+        path.mkdir(parents=True, exist_ok=True)
+        for name, typecode, _, suffix in _ARRAYS:
+            _write_array(path / f"{name}{suffix}", getattr(self, name), typecode)
+        meta = {"version": INDEX_VERSION, "terms": self.terms, "docs": self.docs}
+        tmp = path / f"meta.json.{os.getpid()}.tmp"
+        tmp.write_text(json.dumps(meta, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp, path / "meta.json")
+
+    @classmethod
+    def load(cls, path: Path) -> "TranscriptIndex":
+        meta = json.loads((path / "meta.json").read_text(encoding="utf-8"))
+        arrays = {name: _read_array(path / f"{name}{suffix}", typecode, dtype)
+                  for name, typecode, dtype, suffix in _ARRAYS}
+        return cls(meta["terms"], meta["docs"], **arrays)
+
+    @classmethod
+    def merge(cls, indexes: list) -> "TranscriptIndex":
+        """여러 색인(날짜 순)을 하나로 합칩니다. 영상 번호는 앞 색인의 영상 수만큼 밀림."""
+        terms = sorted(set().union(*(ix.terms for ix in indexes)))
+        position = {term: i for i, term in enumerate(terms)}
+        docs = [doc for ix in indexes for doc in ix.docs]
+
+        if HAS_NUMPY:
+            term_col, doc_col, count_col = [], [], []
+            base = 0
+            for ix in indexes:
+                ids = np.fromiter((position[t] for t in ix.terms), dtype=np.int64, count=len(ix.terms))
+                term_col.append(np.repeat(ids, np.diff(np.asarray(ix.offsets))))
+                doc_col.append(np.asarray(ix.postings, dtype=np.int32) + base)
+                count_col.append(np.asarray(ix.counts, dtype=np.int32))
+                base += len(ix.docs)
+            term_ids = np.concatenate(term_col) if term_col else np.zeros(0, dtype=np.int64)
+            # 안정 정렬이라 같은 토큰 안에서는 색인 순서(= 영상 번호 오름차순)가 유지됨
+            order = np.argsort(term_ids, kind="stable")
+            offsets = np.zeros(len(terms) + 1, dtype=np.int64)
+            np.cumsum(np.bincount(term_ids, minlength=len(terms)), out=offsets[1:])
+            return cls(terms, docs, offsets,
+                       np.concatenate(doc_col)[order] if doc_col else np.zeros(0, dtype=np.int32),
+                       np.concatenate(count_col)[order] if count_col else np.zeros(0, dtype=np.int32))
+
+        by_term = defaultdict(list)
+        base = 0
+        for ix in indexes:
+            for i, term in enumerate(ix.terms):
+                start, end = ix.offsets[i], ix.offsets[i + 1]
+                by_term[term].extend(zip((d + base for d in ix.postings[start:end]), ix.counts[start:end]))
+            base += len(ix.docs)
+        offsets, postings, counts = [0], [], []
+        for term in terms:
+            for doc_id, count in by_term[term]:
+                postings.append(doc_id)
+                counts.append(count)
+            offsets.append(len(postings))
+        return cls(terms, docs, array("q", offsets), array("i", postings), array("i", counts))
+
+    # ─────────────────────────────────────────
+    # 조회
+    # ─────────────────────────────────────────
+    def term_id(self, term: str):
+        i = bisect.bisect_left(self.terms, term)
+        return i if i < len(self.terms) and self.terms[i] == term else None
+
+    def postings_for(self, term_id: int) -> list:
+        """[(영상 번호, 횟수)]"""
+        start, end = int(self.offsets[term_id]), int(self.offsets[term_id + 1])
+        return list(zip((int(d) for d in self.postings[start:end]), (int(c) for c in self.counts[start:end])))
+
+    def expand(self, token: str) -> list:
+        """검색 토큰 → 색인 토큰 번호들. 정확히 있으면 그것만, 없으면 2-gram이 모두 겹치고 부분 문자열로 포함된 토큰들."""
+        exact = self.term_id(token)
+        if exact is not None:
+            return [exact]
+        if len(token) < 2:
+            return []
+        if self._ngrams is None:
+            self._ngrams = defaultdict(set)
+            for i, term in enumerate(self.terms):
+                for gram in char_ngrams(term):
+                    self._ngrams[gram].add(i)
+        candidates = set.intersection(*(self._ngrams.get(g, set()) for g in char_ngrams(token)))
+        return sorted(i for i in candidates if token in self.terms[i])
+
+    def frequency(self, query: str) -> dict:
+        """{"count": 전체 횟수, "videos": 영상 수} - 검색어의 토큰들(확장 포함) 기준"""
+        per_doc = self._match(query)
+        return {"count": sum(per_doc.values()), "videos": len(per_doc)}
+
+    def search(self, query: str, limit: int = 20) -> list:
+        """검색어의 모든 토큰이 나온 영상을 횟수 순으로 [(doc, 횟수)] 반환"""
+        per_doc = self._match(query)
+        ranked = sorted(per_doc.items(), key=lambda item: (-item[1], -item[0]))[:limit]
+        return [(self.docs[doc_id], count) for doc_id, count in ranked]
+
+    def _match(self, query: str) -> dict:
+        result = None
+        for token in tokenize(query) or [query.strip().lower()]:
+            counts = Counter()
+            for term_id in self.expand(token):
+                for doc_id, count in self.postings_for(term_id):
+                    counts[doc_id] += count
+            result = counts if result is None else Counter({d: result[d] + c for d, c in counts.items() if d in result})
+        return dict(result or {})
+
+    def top_terms(self, limit: int = 20) -> list:
+        """전체 횟수 상위 토큰 [(토큰, 횟수, 영상 수)]"""
+        if not self.terms:
+            return []
+        if HAS_NUMPY:
+            offsets = np.asarray(self.offsets)
+            counts = np.asarray(self.counts, dtype=np.int64)
+            totals = np.add.reduceat(counts, offsets[:-1]) if len(counts) else np.zeros(len(self.terms), dtype=np.int64)
+            totals[offsets[:-1] == offsets[1:]] = 0
+            doc_counts = np.diff(offsets)
+            top = np.argsort(-totals, kind="stable")[:limit]
+            return [(self.terms[i], int(totals[i]), int(doc_counts[i])) for i in top]
+        totals = [
+            (sum(self.counts[self.offsets[i]:self.offsets[i + 1]]), self.offsets[i + 1] - self.offsets[i], i)
+            for i in range(len(self.terms))
+        ]
+        totals.sort(key=lambda t: (-t[0], t[2]))
+        return [(self.terms[i], total, docs) for total, docs, i in totals[:limit]]
+
+
+# ─────────────────────────────────────────────
+# 날짜별 색인
+# ─────────────────────────────────────────────
+def build_day_index(research_results: dict, output_dir: Path) -> TranscriptIndex:
+    """research_results의 영상(제목 + 자막)으로 그날의 색인을 만들고 output_dir/transcript_index/에 저장합니다."""
+    started = time.perf_counter()
+    date = research_results.get("date") or output_dir.name
+    docs = []
+    videos = []
+    for channel in research_results.get("channels", []):
+        for video in channel.get("videos", []):
+            docs.append({
+                "video_id": video.get("video_id", ""),
+                "date": date,
+                "channel": channel["name"],
+                "handle": channel.get("handle", ""),
+                "title": video.get("title", ""),
+                "url": video.get("url", ""),
+            })
+            videos.append(video)
+    # 자막은 영상마다 파일에서 조각 단위로 읽어 토큰 수만 남김
+    index = TranscriptIndex.build(docs, (chain([video.get("title", "")], iter_text(video)) for video in videos))
+    index.save(output_dir / INDEX_DIRNAME)
+    logger.info(f"🗂️ 자막 색인: 영상 {len(docs)}개, 토큰 {len(index.terms)}종, "
+                f"게시 {len(index.postings)}건 ({(time.perf_counter() - started) * 1000:.0f}ms)")
+    return index
+
+
+def index_days(output_root: Path = OUTPUT_DIR) -> list:
+    """색인이 있는 날짜 디렉토리 이름 (오름차순)"""
+    return sorted(p.parent.parent.name for p in output_root.glob(f"*/{INDEX_DIRNAME}/meta.json"))
+
+
+def load_range(days: list = None, last: int = None, output_root: Path = OUTPUT_DIR) -> TranscriptIndex:
+    """지정한 날짜들(기본: 색인이 있는 모든 날짜, last면 최근 N개)의 색인을 합쳐 반환합니다."""
+    days = days or index_days(output_root)
+    if last:
+        days = days[-last:]
+    indexes = [TranscriptIndex.load(output_root / day / INDEX_DIRNAME)
+               for day in days if (output_root / day / INDEX_DIRNAME / "meta.json").exists()]
+    if len(indexes) == 1:
+        return indexes[0]
+    return TranscriptIndex.merge(indexes)
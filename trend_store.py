@@ -0,0 +1,247 @@
+"""
+키워드 추세 저장소: 날짜별·채널별 토큰 언급 횟수를 열(column) 배열로 누적해 날짜 간 비교 (LLM 호출 없음)
+- output/trends/
+    vocab.json   : {"terms": [...], "channels": [...]} (열 배열의 번호 → 토큰/채널 핸들)
+    day.npy      : uint16, TREND_EPOCH 기준 날짜 번호
+    channel.npy  : uint16, 채널 번호
+    term.npy     : uint32, 토큰 번호
+    count.npy    : uint32, 그날 그 채널 영상들에서 토큰이 나온 횟수
+    videos.npy   : uint16, 토큰이 나온 영상 수
+- 하루치는 그날의 자막 색인(transcript_index)에서 채널별로 합산해 추가 (지난 자막을 다시 읽지 않음)
+  채널·날짜마다 MIN_DAY_COUNT회 이상 나온 상위 MAX_TERMS_PER_CHANNEL개 토큰만 저장해 크기를 작게 유지
+- 같은 날짜를 다시 기록하면 그날 행을 교체 (재종합 시 중복 없음)
+- 조회: 기간 합계, 이동 합계, 지난주 대비(week-over-week), 최근 기준 구간 대비 급증(z-score)
+
+"이번 주 떠오르는 주제"(rising_topics)는 인포그래픽과 텔레그램 리포트에 선택적으로 표시됩니다 (RISING_TOPICS).
+"""
+import json
+import logging
+import os
+from datetime import date, timedelta
+from pathlib import Path
+
+from cassette import is_replaying
+from config import TREND_STORE_DIR
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+logger = logging.getLogger(__name__)
+
+TREND_EPOCH = date(2020, 1, 1)
+MIN_DAY_COUNT = 2             # 채널·날짜별로 이 횟수 미만인 토큰은 저장하지 않음
+MAX_TERMS_PER_CHANNEL = 400
+WEEK = 7
+SPIKE_BASELINE_DAYS = 28
+SPIKE_Z = 3.0
+SPIKE_MIN_COUNT = 5           # 급증: 그날 이 횟수 이상 언급된 토큰만 검사
+MIN_WEEK_VIDEOS = 3           # 떠오르는 주제: 이번 주 이 수 이상의 영상에서 언급
+MIN_WEEK_CHANNELS = 2         # 떠오르는 주제: 이번 주 이 수 이상의 채널에서 언급
+MIN_GROWTH = 2.0              # 떠오르는 주제: 지난주 대비 (이번 주 + 1) / (지난주 + 1) 배율
+_COLUMNS = (("day", "uint16"), ("channel", "uint16"), ("term", "uint32"), ("count", "uint32"), ("videos", "uint16"))
+
+
+def day_number(day) -> int:
+    if isinstance(day, str):
+        day = date.fromisoformat(day)
+    return (day - TREND_EPOCH).days
+
+
+def day_from_number(number: int) -> str:
+    return (TREND_EPOCH + timedelta(days=int(number))).isoformat()
+
+
+class TrendStore:
+    def __init__(self, path: Path = TREND_STORE_DIR):
+        self.path = Path(path)
+        self.terms, self.channels = [], []
+        self.columns = {name: np.zeros(0, dtype=dtype) for name, dtype in _COLUMNS}
+        if (self.path / "vocab.json").exists():
+            vocab = json.loads((self.path / "vocab.json").read_text(encoding="utf-8"))
+            self.terms, self.channels = vocab["terms"], vocab["channels"]
+            for name, _ in _COLUMNS:
+                if (self.path / f"{name}.npy").exists():
+                    self.columns[name] = np.load(self.path / f"{name}.npy", mmap_mode="r")
+        self._term_ids = {term: i for i, term in enumerate(self.terms)}
+        self._channel_ids = {handle: i for i, handle in enumerate(self.channels)}
+
+    def __len__(self):
+        return len(self.columns["day"])
+
+    def _id(self, ids: dict, names: list, name: str) -> int:
+        if name not in ids:
+            ids[name] = len(names)
+            names.append(name)
+        return ids[name]
+
+    # ─────────────────────────────────────────
+    # 기록
+    # ─────────────────────────────────────────
+    def record_day(self, index, day: str):
+        """그날의 TranscriptIndex를 채널별 토큰 횟수로 합산해 추가합니다 (같은 날짜 행은 교체, 빈 색인이면 그날 행 삭제)."""
+        number = day_number(day)
+        new = self._day_rows(index)
+        new["day"] = np.full(len(new["term"]), number)
+        old = np.asarray(self.columns["day"]) != number
+        self.columns = {
+            name: np.concatenate([np.asarray(self.columns[name])[old], new[name].astype(dtype)])
+            for name, dtype in _COLUMNS
+        }
+        logger.info(f"📈 추세 기록: {day} 토큰 {len(new['term'])}개 행 (누적 {len(self)}행, 토큰 {len(self.terms)}종)")
+
+    def _day_rows(self, index) -> dict:
+        """색인 → {"channel", "term", "count", "videos"} 열 (영상이 없으면 빈 배열)"""
+        offsets = np.asarray(index.offsets, dtype=np.int64)
+        postings = np.asarray(index.postings, dtype=np.int64)
+        if not len(postings):
+            return {name: np.zeros(0, dtype=np.int64) for name in ("channel", "term", "count", "videos")}
+        term_local = np.repeat(np.arange(len(index.terms)), np.diff(offsets))
+        doc_channel = np.array([self._id(self._channel_ids, self.channels, doc.get("handle") or doc["channel"])
+                                for doc in index.docs], dtype=np.int64)
+        channel = doc_channel[postings]
+
+        # (채널, 토큰) 쌍별 합계
+        keys, inverse = np.unique(channel * len(index.terms) + term_local, return_inverse=True)
+        counts = np.bincount(inverse, weights=np.asarray(index.counts, dtype=np.float64)).astype(np.int64)
+        videos = np.bincount(inverse)
+        channel, term_local = keys // len(index.terms), keys % len(index.terms)
+
+        # 채널별 상위 토큰만 유지
+        keep = counts >= MIN_DAY_COUNT
+        order = np.lexsort((-counts, channel))
+        rank = np.empty(len(order), dtype=np.int64)
+        starts = np.r_[0, np.flatnonzero(np.diff(channel[order])) + 1]
+        rank[order] = np.arange(len(order)) - np.repeat(starts, np.diff(np.r_[starts, len(order)]))
+        keep &= rank < MAX_TERMS_PER_CHANNEL
+
+        terms = np.array([self._id(self._term_ids, self.terms, index.terms[t]) for t in term_local[keep]], dtype=np.int64)
+        return {"channel": channel[keep], "term": terms, "count": counts[keep], "videos": videos[keep]}
+
+    def save(self):
+        """카세트 재생 중에는 저장하지 않습니다. 어휘를 먼저 쓰므로 열 배열이 모르는 번호를 가리키지 않음."""
+        if is_replaying():
+            return
+        self.path.mkdir(parents=True, exist_ok=True)
+        tmp = self.path / f"vocab.json.{os.getpid()}.tmp"
+        tmp.write_text(json.dumps({"terms": self.terms, "channels": self.channels}, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, self.path / "vocab.json")
+        for name, dtype in _COLUMNS:
+            tmp = self.path / f"{name}.{os.getpid()}.tmp.npy"
+            np.save(tmp, np.asarray(self.columns[name], dtype=dtype))
+            os.replace(tmp, self.path / f"{name}.npy")
+
+    # ─────────────────────────────────────────
+    # 조회
+    # ─────────────────────────────────────────
+    def _window(self, start: int, end: int):
+        day = np.asarray(self.columns["day"])
+        return (day >= start) & (day <= end)
+
+    def totals(self, start: int, end: int, column: str = "count"):
+        """기간(날짜 번호, 양 끝 포함)의 토큰별 합계 배열"""
+        mask = self._window(start, end)
+        return np.bincount(np.asarray(self.columns["term"])[mask],
+                           weights=np.asarray(self.columns[column])[mask].astype(np.float64),
+                           minlength=len(self.terms))
+
+    def channel_spread(self, start: int, end: int):
+        """기간 중 토큰을 언급한 채널 수 배열"""
+        mask = self._window(start, end)
+        pairs = np.unique(np.asarray(self.columns["term"])[mask].astype(np.int64) * max(len(self.channels), 1)
+                          + np.asarray(self.columns["channel"])[mask])
+        return np.bincount(pairs // max(len(self.channels), 1), minlength=len(self.terms))
+
+    def has_data(self, start: int, end: int) -> bool:
+        return bool(self._window(start, end).any())
+
+    def daily_matrix(self, term_ids, start: int, end: int):
+        """(날짜 수, 토큰 수) 일별 언급 횟수 행렬"""
+        term_ids = np.asarray(term_ids, dtype=np.int64)
+        position = np.full(len(self.terms), -1, dtype=np.int64)
+        position[term_ids] = np.arange(len(term_ids))
+        mask = self._window(start, end)
+        pos = position[np.asarray(self.columns["term"])[mask]]
+        hit = pos >= 0
+        days = np.asarray(self.columns["day"])[mask][hit].astype(np.int64) - start
+        matrix = np.zeros((end - start + 1) * len(term_ids))
+        np.add.at(matrix, days * len(term_ids) + pos[hit], np.asarray(self.columns["count"])[mask][hit])
+        return matrix.reshape(end - start + 1, len(term_ids))
+
+    def series(self, term: str, end: str, days: int = SPIKE_BASELINE_DAYS, window: int = 1) -> list:
+        """토큰의 일별 언급 횟수 (window > 1이면 이동 합계) [(날짜, 값)]"""
+        end_n = day_number(end)
+        start_n = end_n - days + 1
+        if term not in self._term_ids:
+            return [(day_from_number(n), 0) for n in range(start_n, end_n + 1)]
+        values = self.daily_matrix([self._term_ids[term]], start_n - window + 1, end_n)[:, 0]
+        rolling = np.convolve(values, np.ones(window), mode="valid")
+        return [(day_from_number(start_n + i), int(v)) for i, v in enumerate(rolling)]
+
+    def week_over_week(self, end: str) -> dict:
+        """{"this", "last", "channels", "videos"} 토큰별 배열 (이번 주 = end 포함 최근 7일)"""
+        end_n = day_number(end)
+        return {
+            "this": self.totals(end_n - WEEK + 1, end_n),
+            "last": self.totals(end_n - 2 * WEEK + 1, end_n - WEEK),
+            "videos": self.totals(end_n - WEEK + 1, end_n, column="videos"),
+            "channels": self.channel_spread(end_n - WEEK + 1, end_n),
+        }
+
+    def spikes(self, end: str, baseline_days: int = SPIKE_BASELINE_DAYS, z: float = SPIKE_Z) -> list:
+        """end 날짜 언급 횟수가 직전 baseline_days일 평균보다 z 표준편차 이상 높은 토큰 [(토큰, 횟수, z)]"""
+        end_n = day_number(end)
+        today = self.totals(end_n, end_n)
+        candidates = np.flatnonzero(today >= SPIKE_MIN_COUNT)
+        if not len(candidates) or not self.has_data(end_n - baseline_days, end_n - 1):
+            return []
+        baseline = self.daily_matrix(candidates, end_n - baseline_days, end_n - 1)
+        scores = (today[candidates] - baseline.mean(axis=0)) / np.maximum(baseline.std(axis=0), 1.0)
+        hits = np.flatnonzero(scores >= z)
+        hits = hits[np.argsort(-scores[hits])]
+        return [(self.terms[candidates[i]], int(today[candidates[i]]), round(float(scores[i]), 1)) for i in hits]
+
+    def rising_topics(self, end: str, limit: int = 5) -> list:
+        """이번 주에 여러 채널/영상에서 지난주보다 크게 늘어난 토큰. 지난주 기록이 없으면 빈 목록."""
+        end_n = day_number(end)
+        if not self.terms or not self.has_data(end_n - 2 * WEEK + 1, end_n - WEEK):
+            return []
+        wow = self.week_over_week(end)
+        growth = (wow["this"] + 1) / (wow["last"] + 1)
+        eligible = np.flatnonzero((wow["videos"] >= MIN_WEEK_VIDEOS) & (wow["channels"] >= MIN_WEEK_CHANNELS)
+                                  & (growth >= MIN_GROWTH))
+        eligible = eligible[np.argsort(-(growth[eligible] * np.log1p(wow["this"][eligible])), kind="stable")][:limit]
+        spiking = {term for term, _, _ in self.spikes(end)}
+        return [
+            {
+                "term": self.terms[i],
+                "this_week": int(wow["this"][i]),
+                "last_week": int(wow["last"][i]),
+                "change": "신규" if not wow["last"][i] else f"+{(wow['this'][i] / wow['last'][i] - 1) * 100:.0f}%",
+                "channels": int(wow["channels"][i]),
+                "videos": int(wow["videos"][i]),
+                "spike": self.terms[i] in spiking,
+            }
+            for i in eligible
+        ]
+
+
+def update_trends(index, day: str, path: Path = TREND_STORE_DIR) -> dict:
+    """그날의 색인을 추세 저장소에 기록하고 떠오르는 주제/급증 토큰을 반환합니다. NumPy가 없으면 None."""
+    if not HAS_NUMPY:
+        logger.warning("⚠️ numpy가 설치되지 않아 키워드 추세 기록을 건너뜁니다.")
+        return None
+    store = TrendStore(path)
+    store.record_day(index, day)
+    store.save()
+    trends = {
+        "date": day,
+        "window_days": WEEK,
+        "rising": store.rising_topics(day),
+        "spikes": [{"term": t, "count": c, "z": z} for t, c, z in store.spikes(day)[:10]],
+    }
+    if trends["rising"]:
+        logger.info("📈 이번 주 떠오르는 주제: " + ", ".join(f"{r['term']}({r['change']})" for r in trends["rising"]))
+    return trends
@@ -0,0 +1,261 @@
+"""
+영상 탐색 백엔드: 채널의 최근 영상 목록을 가져오는 방법을 교체 가능하게 분리
+- feed: 채널별 Atom 피드 (정확한 게시 시각, 요청 1회). ETag/Last-Modified 조건부 GET으로
+        변경 없는 채널은 304 응답만 받음. 채널 ID(channel_resolver)가 필요하고 최근 15개까지만 제공
+- scrapetube: 채널 탐색 페이지 JSON (상대 시간 텍스트로 최근 여부 판단)
+
+DISCOVERY_BACKENDS 순서대로 시도하며, 앞 백엔드가 답할 수 없으면(None) 다음 백엔드로 넘어갑니다.
+피드에 없는 영상 길이는 새 영상이 있는 채널만 scrapetube로 얕게 조회해 채웁니다.
+
+로컬 스텁 테스트: YOUTUBE_FEED_BASE=http://127.0.0.1:PORT
+"""
+import json
+import logging
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+
+from cassette import record_call
+from config import CACHE_DIR, DISCOVERY_BACKENDS
+
+logger = logging.getLogger(__name__)
+
+FEED_BASE = os.environ.get("YOUTUBE_FEED_BASE", "https://www.youtube.com")
+FEED_CACHE_DIR = CACHE_DIR / "feeds"
+FEED_LIMIT = 15  # YouTube 채널 피드가 제공하는 최대 항목 수
+
+_ATOM = "{http://www.w3.org/2005/Atom}"
+_YT = "{http://www.youtube.com/xml/schemas/2015}"
+_MEDIA = "{http://search.yahoo.com/mrss/}"
+
+
+def _relative_text(age_hours: float) -> str:
+    """scrapetube와 같은 형식의 상대 시간 텍스트 (채널 요약 표시용)"""
+    if age_hours < 1:
+        return f"{max(1, int(age_hours * 60))} minutes ago"
+    if age_hours < 24:
+        return f"{int(age_hours)} hours ago"
+    return f"{int(age_hours // 24)} days ago"
+
+
+def video_from_entry(entry: dict, now: datetime = None) -> tuple:
+    """피드/푸시 알림 항목({video_id, title, published[, views]}) → (영상 dict, 경과 시간)"""
+    now = now or datetime.now(timezone.utc)
+    published = datetime.fromisoformat(entry["published"])
+    age_hours = (now - published).total_seconds() / 3600
+    return {
+        "video_id": entry["video_id"],
+        "title": entry["title"],
+        "published_text": _relative_text(age_hours),
+        "published_at": published.astimezone().replace(tzinfo=None).isoformat(timespec="minutes"),
+        "view_count": f"{entry['views']:,} views" if entry.get("views") is not None else "",
+        "duration": "",
+        "url": f"https://www.youtube.com/watch?v={entry['video_id']}",
+    }, age_hours
+
+
+# ─────────────────────────────────────────────
+# Atom 피드 백엔드
+# ─────────────────────────────────────────────
+class FeedBackend:
+    name = "feed"
+
+    def __init__(self, base: str = None, cache_dir: Path = None):
+        self.base = (base or FEED_BASE).rstrip("/")
+        self.cache_dir = Path(cache_dir or FEED_CACHE_DIR)
+
+    def _cache_path(self, channel_id: str) -> Path:
+        return self.cache_dir / f"{channel_id}.json"
+
+    def _load_cache(self, channel_id: str) -> dict:
+        path = self._cache_path(channel_id)
+        try:
+            return json.loads(path.read_text(encoding="utf-8")) if path.exists() else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _get(self, channel_id: str, cached: dict) -> dict:
+        """조건부 GET. {"status", "body", "etag", "last_modified"} 반환 (304면 body 없음)."""
+        import urllib.error
+        import urllib.request
+
+        request = urllib.request.Request(f"{self.base}/feeds/videos.xml?channel_id={channel_id}")
+        if cached.get("etag"):
+            request.add_header("If-None-Match", cached["etag"])
+        if cached.get("last_modified"):
+            request.add_header("If-Modified-Since", cached["last_modified"])
+        try:
+            with urllib.request.urlopen(request, timeout=15) as resp:
+                return {
+                    "status": resp.status,
+                    "body": resp.read().decode("utf-8"),
+                    "etag": resp.headers.get("ETag"),
+                    "last_modified": resp.headers.get("Last-Modified"),
+                }
+        except urllib.error.HTTPError as e:
+            if e.code == 304:
+                return {"status": 304}
+            raise
+
+    @staticmethod
+    def parse(body: str) -> list:
+        """Atom 피드 → [{video_id, title, published, views}] (최신순)"""
+        import xml.etree.ElementTree as ET
+
+        root = ET.fromstring(body)
+        entries = []
+        for entry in root.iter(f"{_ATOM}entry"):
+            stats = entry.find(f"{_MEDIA}group/{_MEDIA}community/{_MEDIA}statistics")
+            entries.append({
+                "video_id": entry.findtext(f"{_YT}videoId", ""),
+                "title": entry.findtext(f"{_ATOM}title", "제목 없음"),
+                "published": entry.findtext(f"{_ATOM}published", ""),
+                "views": int(stats.get("views", 0)) if stats is not None else None,
+            })
+        entries.sort(key=lambda e: e["published"], reverse=True)
+        return entries
+
+    def entries(self, channel_id: str) -> list:
+        """피드 항목 (변경 없으면 캐시된 항목)."""
+        cached = self._load_cache(channel_id)
+        response = record_call("feed.get", channel_id, lambda: self._get(channel_id, cached))
+        if response["status"] == 304:
+            if "entries" in cached:
+                logger.info("  📭 피드 변경 없음 (304)")
+                return cached["entries"]
+            # 캐시 파일이 사라진 경우(카세트 재생 환경 등) 조건 없이 다시 요청
+            response = record_call("feed.get", f"{channel_id}:full", lambda: self._get(channel_id, {}))
+
+        entries = self.parse(response["body"])
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._cache_path(channel_id).write_text(json.dumps({
+            "etag": response.get("etag"),
+            "last_modified": response.get("last_modified"),
+            "entries": entries,
+        }, ensure_ascii=False), encoding="utf-8")
+        return entries
+
+    def discover(self, channel: dict, max_results: int, hours: int):
+        channel_id = channel.get("channel_id")
+        if not channel_id:
+            return None
+
+        entries = self.entries(channel_id)
+        now = datetime.now(timezone.utc)
+        recent = [video for video, age_hours in (video_from_entry(e, now) for e in entries) if age_hours <= hours]
+
+        if len(entries) >= FEED_LIMIT and len(recent) == len(entries) and max_results > len(recent):
+            # 피드 15개가 모두 기간 안이면 더 오래된 최근 영상이 잘렸을 수 있음
+            logger.info("  ↪️ 피드 항목이 모두 기간 내라 scrapetube로 전체 조회")
+            return None
+        return recent[:max_results]
+
+
+# ─────────────────────────────────────────────
+# scrapetube 백엔드
+# ─────────────────────────────────────────────
+class ScrapetubeBackend:
+    name = "scrapetube"
+
+    @staticmethod
+    def raw_videos(channel: dict, limit: int) -> list:
+        import scrapetube  # 무거운 의존성은 실제 스캔 시점에 로드
+
+        # 채널 ID를 알면 정식 URL(/channel/UC...)로, 모르면 핸들 URL로 조회
+        # (카세트 기록/재생을 위해 원본 페이지 항목을 리스트로 확정)
+        handle = channel["handle"]
+        url = f"https://www.youtube.com/channel/{channel['channel_id']}" if channel.get("channel_id") \
+            else f"https://www.youtube.com/{handle}"
+        return record_call(
+            "scrapetube.get_channel",
+            f"{handle}:{limit}",
+            lambda: list(scrapetube.get_channel(channel_url=url, limit=limit, sort_by="newest")),
+        )
+
+    @staticmethod
+    def _text(value, default: str = "") -> str:
+        if isinstance(value, dict):
+            if "simpleText" in value:
+                return value["simpleText"]
+            return value.get("runs", [{}])[0].get("text", default)
+        return value if isinstance(value, str) else default
+
+    def discover(self, channel: dict, max_results: int, hours: int):
+        from datetime import timedelta
+        from research_agent import parse_age_hours
+
+        results = []
+        for video in self.raw_videos(channel, max_results):
+            video_id = video.get("videoId", "")
+            # 게시 시간 텍스트 파싱 (예: "1 hour ago", "3 hours ago", "1 day ago")
+            published_text = self._text(video.get("publishedTimeText", {}))
+
+            # N시간 이내 판단
+            age_hours = parse_age_hours(published_text)
+            if age_hours is None or age_hours > hours:
+                continue
+
+            results.append({
+                "video_id": video_id,
+                "title": self._text(video.get("title", {}), "제목 없음"),
+                "published_text": published_text,
+                # 상대 시간 텍스트로 추정한 게시 시각 (채널 게시 주기 통계용)
+                "published_at": (datetime.now() - timedelta(hours=age_hours)).isoformat(timespec="minutes"),
+                "view_count": self._text(video.get("viewCountText", {})),
+                "duration": self._text(video.get("lengthText", {})),
+                "url": f"https://www.youtube.com/watch?v={video_id}",
+            })
+        return results
+
+    def enrich(self, channel: dict, videos: list):
+        """피드에 없는 영상 길이를 채웁니다 (새 영상 수만큼만 얕게 조회)."""
+        raw = {v.get("videoId"): v for v in self.raw_videos(channel, len(videos))}
+        for video in videos:
+            if video["video_id"] in raw:
+                video["duration"] = self._text(raw[video["video_id"]].get("lengthText", {}))
+
+
+BACKENDS = {
+    FeedBackend.name: FeedBackend,
+    ScrapetubeBackend.name: ScrapetubeBackend,
+}
+
+
+def discover_videos(channel: dict, max_results: int, hours: int, backends: list = None) -> list:
+    """설정된 백엔드를 순서대로 시도하여 채널의 최근 영상 목록을 반환합니다.
+
+    채널 ID가 없으면 먼저 channel_resolver 캐시로 해석합니다 (실패하면 핸들로 계속 진행).
+    """
+    from channel_resolver import invalidate, resolve_channel
+
+    names = backends or DISCOVERY_BACKENDS
+    try:
+        channel = resolve_channel(channel)
+    except Exception as e:
+        logger.warning(f"  ⚠️ 채널 ID 해석 실패 ({channel['handle']}): {e}")
+
+    last_error = None
+    for name in names:
+        backend = BACKENDS[name]()
+        try:
+            videos = backend.discover(channel, max_results, hours)
+        except Exception as e:
+            last_error = e
+            logger.warning(f"  ⚠️ {name} 탐색 실패 ({channel['handle']}): {e}")
+            if name == FeedBackend.name and getattr(e, "code", None) == 404 and channel.get("id_source") == "cache":
+                invalidate(channel["handle"])
+            continue
+        if videos is None:
+            continue
+
+        if videos and name == FeedBackend.name and ScrapetubeBackend.name in names:
+            try:
+                ScrapetubeBackend().enrich(channel, videos)
+            except Exception as e:
+                logger.warning(f"  ⚠️ 영상 길이 조회 실패 ({channel['handle']}): {e}")
+        logger.info(f"  🔎 {name}: {len(videos)}개 최근 영상")
+        return videos
+
+    if last_error is not None:
+        raise last_error
+    return []
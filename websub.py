@@ -0,0 +1,385 @@
+"""
+WebSub(PubSubHubbub) 푸시 수신: YouTube 허브가 새 업로드를 알려주면 폴링 없이 바로 처리
+- GET  {WEBSUB_PATH}: 구독/해지 확인 (hub.challenge를 그대로 응답, 우리가 요청한 topic만 허용)
+- POST {WEBSUB_PATH}: Atom 알림. WEBSUB_SECRET이 있으면 X-Hub-Signature(HMAC) 검증 후,
+  video_id 기준으로 중복 없이 notifications 테이블에 저장 (제목 수정 등 같은 영상의 재알림은 무시)
+- 구독 갱신 작업: 구독이 없거나 만료가 RENEW_BEFORE_SECONDS 이내인 채널을 허브에 다시 구독 요청
+- 상태(구독/알림)는 .cache/websub.sqlite에 저장되어 재시작해도 받은 알림을 잃지 않음
+
+상시 실행 모드(`cli.py daemon --websub`)가 서버를 백그라운드 스레드로 띄우고, 저장된 알림을 꺼내
+영상 단위 처리(daemon.process_video)로 넘깁니다. 구독이 살아 있는 채널은 폴링 주기에서 빠집니다.
+
+외부에서 접근 가능한 콜백 주소(WEBSUB_CALLBACK_URL)가 필요합니다.
+로컬 테스트: WEBSUB_HUB를 허브 흉내 서버 주소로 지정
+"""
+import asyncio
+import hashlib
+import hmac
+import logging
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+from config import (
+    WEBSUB_CALLBACK_URL,
+    WEBSUB_HUB,
+    WEBSUB_PATH,
+    WEBSUB_PORT,
+    WEBSUB_SECRET,
+    WEBSUB_STATE_PATH,
+)
+
+logger = logging.getLogger(__name__)
+
+LEASE_SECONDS = 432000            # 요청하는 구독 기간 (YouTube 허브 최대 약 5일)
+RENEW_BEFORE_SECONDS = 86400      # 만료 하루 전부터 갱신
+RENEW_CHECK_SECONDS = 3600        # 갱신 작업 주기
+PENDING_RETRY_SECONDS = 900       # 확인 요청이 오지 않은 구독 요청을 다시 보내기까지 대기
+MAX_BODY_BYTES = 1 << 20
+
+TOPIC_URL = "https://www.youtube.com/xml/feeds/videos.xml?channel_id={channel_id}"
+
+_ATOM = "{http://www.w3.org/2005/Atom}"
+_YT = "{http://www.youtube.com/xml/schemas/2015}"
+_DELETED = "{http://purl.org/atompub/tombstones/1.0}deleted-entry"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS subscriptions (
+    topic TEXT PRIMARY KEY,
+    channel_id TEXT NOT NULL,
+    handle TEXT NOT NULL,
+    status TEXT NOT NULL,          -- pending / active / unsubscribed / denied
+    requested_at REAL,
+    expires_at REAL,
+    updated_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS notifications (
+    video_id TEXT PRIMARY KEY,
+    channel_id TEXT NOT NULL,
+    title TEXT NOT NULL,
+    published TEXT,
+    received_at TEXT NOT NULL,
+    processed_at TEXT
+);
+"""
+
+
+def topic_for(channel_id: str) -> str:
+    return TOPIC_URL.format(channel_id=channel_id)
+
+
+def _now_iso() -> str:
+    return datetime.now().isoformat(timespec="seconds")
+
+
+# ─────────────────────────────────────────────
+# 상태 저장소
+# ─────────────────────────────────────────────
+class WebSubState:
+    """구독/알림 상태. 서버 스레드와 데몬 스레드가 함께 쓰므로 연결 하나를 잠금으로 보호합니다."""
+
+    def __init__(self, path=WEBSUB_STATE_PATH):
+        if str(path) != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self.db.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        self.db.executescript(_SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    def _execute(self, sql: str, params=()):
+        with self._lock:
+            return self.db.execute(sql, params)
+
+    def _query(self, sql: str, params=()) -> list:
+        with self._lock:
+            return self.db.execute(sql, params).fetchall()
+
+    # ── 구독 ──
+    def mark_requested(self, channel: dict):
+        self._execute(
+            "INSERT INTO subscriptions (topic, channel_id, handle, status, requested_at, updated_at)"
+            " VALUES (?, ?, ?, 'pending', ?, ?) ON CONFLICT(topic) DO UPDATE SET"
+            " status = CASE WHEN status = 'active' THEN 'active' ELSE 'pending' END,"
+            " requested_at = excluded.requested_at, updated_at = excluded.updated_at",
+            (topic_for(channel["channel_id"]), channel["channel_id"], channel["handle"], time.time(), _now_iso()),
+        )
+
+    def get_subscription(self, topic: str):
+        rows = self._query("SELECT * FROM subscriptions WHERE topic = ?", (topic,))
+        return rows[0] if rows else None
+
+    def set_status(self, topic: str, status: str, lease_seconds: int = None):
+        expires = time.time() + lease_seconds if lease_seconds else None
+        self._execute(
+            "UPDATE subscriptions SET status = ?, expires_at = COALESCE(?, expires_at), updated_at = ? WHERE topic = ?",
+            (status, expires, _now_iso(), topic),
+        )
+
+    def needs_subscribe(self, channel_id: str, now: float = None) -> bool:
+        now = now or time.time()
+        row = self.get_subscription(topic_for(channel_id))
+        if row is None or row["status"] in ("unsubscribed", "denied"):
+            return True
+        if row["status"] == "pending":
+            return now - (row["requested_at"] or 0) > PENDING_RETRY_SECONDS
+        return (row["expires_at"] or 0) - now < RENEW_BEFORE_SECONDS
+
+    def active_handles(self, now: float = None) -> set:
+        """구독이 살아 있는 채널 핸들 (소문자). 이 채널들은 폴링 대신 푸시로 받음."""
+        now = now or time.time()
+        rows = self._query("SELECT handle FROM subscriptions WHERE status = 'active' AND expires_at > ?", (now,))
+        return {row["handle"].lower() for row in rows}
+
+    def handle_for(self, channel_id: str):
+        rows = self._query("SELECT handle FROM subscriptions WHERE channel_id = ?", (channel_id,))
+        return rows[0]["handle"] if rows else None
+
+    # ── 알림 ──
+    def add_notification(self, entry: dict) -> bool:
+        """새 영상이면 True. 이미 받은 video_id(제목 수정 등 재알림)는 무시."""
+        cursor = self._execute(
+            "INSERT OR IGNORE INTO notifications (video_id, channel_id, title, published, received_at)"
+            " VALUES (?, ?, ?, ?, ?)",
+            (entry["video_id"], entry["channel_id"], entry["title"], entry["published"], _now_iso()),
+        )
+        return cursor.rowcount > 0
+
+    def pending_notifications(self) -> list:
+        return [dict(row) for row in self._query(
+            "SELECT * FROM notifications WHERE processed_at IS NULL ORDER BY received_at"
+        )]
+
+    def mark_processed(self, video_id: str):
+        self._execute("UPDATE notifications SET processed_at = ? WHERE video_id = ?", (_now_iso(), video_id))
+
+
+# ─────────────────────────────────────────────
+# 알림 파싱 / 서명 검증
+# ─────────────────────────────────────────────
+def parse_notification(body: bytes) -> list:
+    """허브가 보낸 Atom 문서 → [{video_id, channel_id, title, published}]. 삭제 알림은 제외."""
+    import xml.etree.ElementTree as ET
+
+    root = ET.fromstring(body)
+    if root.find(_DELETED) is not None:
+        return []
+    entries = []
+    for entry in root.iter(f"{_ATOM}entry"):
+        video_id = entry.findtext(f"{_YT}videoId")
+        if not video_id:
+            continue
+        entries.append({
+            "video_id": video_id,
+            "channel_id": entry.findtext(f"{_YT}channelId", ""),
+            "title": entry.findtext(f"{_ATOM}title", "제목 없음"),
+            "published": entry.findtext(f"{_ATOM}published", ""),
+        })
+    return entries
+
+
+def verify_signature(body: bytes, header: str, secret: str) -> bool:
+    """X-Hub-Signature: sha1=<hex> (허브에 따라 sha256 등)"""
+    if not header or "=" not in header:
+        return False
+    method, signature = header.split("=", 1)
+    if method not in ("sha1", "sha256", "sha384", "sha512"):
+        return False
+    expected = hmac.new(secret.encode("utf-8"), body, getattr(hashlib, method)).hexdigest()
+    return hmac.compare_digest(expected, signature.strip())
+
+
+# ─────────────────────────────────────────────
+# HTTP 서버 (asyncio 스트림, 표준 라이브러리만 사용)
+# ─────────────────────────────────────────────
+class WebSubServer:
+    def __init__(self, state: WebSubState, channels: list, host: str = "0.0.0.0", port: int = WEBSUB_PORT,
+                 path: str = WEBSUB_PATH, callback_url: str = WEBSUB_CALLBACK_URL, hub: str = WEBSUB_HUB,
+                 secret: str = WEBSUB_SECRET, on_notification=None):
+        self.state = state
+        self.channels = channels
+        self.host = host
+        self.port = port
+        self.path = path
+        self.callback_url = callback_url
+        self.hub = hub
+        self.secret = secret
+        self.on_notification = on_notification
+        self._loop = None
+        self._server = None
+        self._thread = None
+        self._ready = threading.Event()
+
+    # ── 요청 처리 ──
+    def handle_verification(self, query: dict):
+        mode = query.get("hub.mode", [""])[0]
+        topic = query.get("hub.topic", [""])[0]
+        challenge = query.get("hub.challenge", [""])[0]
+        subscription = self.state.get_subscription(topic)
+
+        if mode == "denied":
+            if subscription is not None:
+                self.state.set_status(topic, "denied")
+            logger.warning(f"⚠️ WebSub 구독 거부: {topic} ({query.get('hub.reason', [''])[0]})")
+            return 200, ""
+        if subscription is None or mode not in ("subscribe", "unsubscribe") or not challenge:
+            return 404, ""
+
+        if mode == "subscribe":
+            lease = int(query.get("hub.lease_seconds", [LEASE_SECONDS])[0])
+            self.state.set_status(topic, "active", lease)
+            logger.info(f"📬 WebSub 구독 확인: {subscription['handle']} ({lease // 3600}시간)")
+        else:
+            self.state.set_status(topic, "unsubscribed")
+            logger.info(f"📭 WebSub 구독 해지 확인: {subscription['handle']}")
+        return 200, challenge
+
+    def handle_notification(self, body: bytes, signature: str):
+        # 서명이 맞지 않아도 2xx로 응답해야 허브가 재전송하지 않음 (내용은 무시)
+        if self.secret and not verify_signature(body, signature, self.secret):
+            logger.warning("⚠️ WebSub 서명 불일치 - 알림 무시")
+            return 202, ""
+        try:
+            entries = parse_notification(body)
+        except Exception as e:
+            logger.warning(f"⚠️ WebSub 알림 파싱 실패: {e}")
+            return 202, ""
+
+        added = [entry for entry in entries if self.state.add_notification(entry)]
+        for entry in added:
+            logger.info(f"📨 WebSub 새 영상: {entry['title'][:40]} ({entry['video_id']})")
+        if added and self.on_notification is not None:
+            self.on_notification()
+        return 202, ""
+
+    async def _handle(self, reader, writer):
+        status, payload = 400, ""
+        try:
+            request_line = (await asyncio.wait_for(reader.readline(), 10)).decode("latin-1").split()
+            headers = {}
+            while True:
+                line = (await asyncio.wait_for(reader.readline(), 10)).decode("latin-1")
+                if line in ("\r\n", "\n", ""):
+                    break
+                name, _, value = line.partition(":")
+                headers[name.strip().lower()] = value.strip()
+
+            if len(request_line) >= 2:
+                method, target = request_line[0], urlsplit(request_line[1])
+                length = int(headers.get("content-length", 0) or 0)
+                if target.path != self.path:
+                    status = 404
+                elif length > MAX_BODY_BYTES:
+                    status = 413
+                elif method == "GET":
+                    status, payload = self.handle_verification(parse_qs(target.query))
+                elif method == "POST":
+                    body = await asyncio.wait_for(reader.readexactly(length), 10) if length else b""
+                    status, payload = self.handle_notification(body, headers.get("x-hub-signature", ""))
+                else:
+                    status = 405
+        except Exception as e:
+            logger.warning(f"⚠️ WebSub 요청 처리 실패: {e}")
+            status = 400
+
+        data = payload.encode("utf-8")
+        reason = {200: "OK", 202: "Accepted", 400: "Bad Request", 404: "Not Found",
+                  405: "Method Not Allowed", 413: "Payload Too Large"}.get(status, "")
+        writer.write(
+            f"HTTP/1.1 {status} {reason}\r\nContent-Type: text/plain\r\nContent-Length: {len(data)}\r\n"
+            f"Connection: close\r\n\r\n".encode("latin-1") + data
+        )
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
+
+    # ── 구독 요청 / 갱신 ──
+    def _post_subscribe(self, channel: dict, mode: str = "subscribe"):
+        import urllib.request
+
+        form = {
+            "hub.callback": self.callback_url,
+            "hub.topic": topic_for(channel["channel_id"]),
+            "hub.mode": mode,
+            "hub.verify": "async",
+            "hub.lease_seconds": str(LEASE_SECONDS),
+        }
+        if self.secret:
+            form["hub.secret"] = self.secret
+        request = urllib.request.Request(self.hub, data=urlencode(form).encode("utf-8"), method="POST")
+        with urllib.request.urlopen(request, timeout=15) as resp:
+            return resp.status
+
+    def renew_subscriptions(self) -> int:
+        """구독이 필요한 채널에 구독 요청을 보냅니다 (확인은 허브가 콜백으로 비동기 전송)."""
+        from channel_resolver import resolve_channel
+
+        requested = 0
+        for channel in self.channels:
+            try:
+                channel = resolve_channel(channel)
+            except Exception as e:
+                logger.warning(f"  ⚠️ 채널 ID 해석 실패, 구독 생략 ({channel['handle']}): {e}")
+                continue
+            if not self.state.needs_subscribe(channel["channel_id"]):
+                continue
+            self.state.mark_requested(channel)
+            try:
+                self._post_subscribe(channel)
+                requested += 1
+            except Exception as e:
+                logger.warning(f"  ⚠️ WebSub 구독 요청 실패 ({channel['handle']}): {e}")
+        if requested:
+            logger.info(f"📮 WebSub 구독 요청 {requested}개 채널")
+        return requested
+
+    async def _renew_loop(self):
+        while True:
+            if self.callback_url:
+                await self._loop.run_in_executor(None, self.renew_subscriptions)
+            await asyncio.sleep(RENEW_CHECK_SECONDS)
+
+    # ── 실행 ──
+    async def _serve(self):
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.info(f"🛰️ WebSub 수신 대기: {self.host}:{self.port}{self.path}")
+        if not self.callback_url:
+            logger.warning("⚠️ WEBSUB_CALLBACK_URL이 없어 구독 요청은 보내지 않습니다 (수신만).")
+        self._ready.set()
+        renew = asyncio.ensure_future(self._renew_loop())
+        try:
+            async with self._server:
+                await self._server.serve_forever()
+        finally:
+            renew.cancel()
+
+    def start(self):
+        """백그라운드 스레드에서 서버와 구독 갱신 작업을 시작합니다."""
+        def _run():
+            self._loop = asyncio.new_event_loop()
+            try:
+                self._loop.run_until_complete(self._serve())
+            except asyncio.CancelledError:
+                pass
+            finally:
+                self._loop.close()
+
+        self._thread = threading.Thread(target=_run, name="websub", daemon=True)
+        self._thread.start()
+        if not self._ready.wait(10):
+            raise RuntimeError("WebSub 서버를 시작하지 못했습니다")
+        return self
+
+    def stop(self):
+        if self._loop is not None and self._server is not None:
+            self._loop.call_soon_threadsafe(self._server.close)
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
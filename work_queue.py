@@ -0,0 +1,293 @@
+"""
+작업 큐: 한 호스트의 여러 프로세스가 나눠 처리하는 SQLite 기반 작업 큐
+- 작업은 (run, key)로 중복 없이 저장 (같은 날짜에 다시 넣어도 한 번만 실행)
+- 워커는 작업을 lease_seconds 동안 임대(lease)하고 처리 중 heartbeat로 임대를 연장
+- 임대가 만료된 작업(워커 종료/멈춤)은 다른 워커가 다시 가져감
+- 실패한 작업은 지수 백오프 후 재시도, max_attempts를 넘으면 failed
+- 한 호스트의 프로세스 사이에서만 공유 (README "작업 큐" 참고)
+"""
+import json
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+from config import WORK_QUEUE_PATH
+
+logger = logging.getLogger(__name__)
+
+LEASE_SECONDS = 120.0
+MAX_ATTEMPTS = 3
+RETRY_BASE = 5.0      # 실패 후 첫 재시도 대기 (초)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run TEXT NOT NULL,
+    key TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'queued',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    available_at REAL NOT NULL,
+    lease_owner TEXT,
+    lease_expires REAL,
+    result TEXT,
+    error TEXT,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    UNIQUE (run, key)
+);
+CREATE INDEX IF NOT EXISTS jobs_lease ON jobs (run, status, available_at);
+"""
+
+
+def default_owner() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{threading.get_ident()}"
+
+
+def _now_iso() -> str:
+    return datetime.now().isoformat(timespec="seconds")
+
+
+class Job:
+    """임대한 작업 (payload는 dict)"""
+
+    def __init__(self, row):
+        self.id = row["id"]
+        self.run = row["run"]
+        self.key = row["key"]
+        self.kind = row["kind"]
+        self.payload = json.loads(row["payload"])
+        self.attempts = row["attempts"]
+
+    def __repr__(self):
+        return f"Job({self.kind}:{self.key}, attempt {self.attempts})"
+
+
+class WorkQueue:
+    """SQLite 작업 큐. 호출마다 짧은 트랜잭션을 사용하므로 같은 호스트의 여러 프로세스가 같은 파일을 공유할 수 있습니다."""
+
+    def __init__(self, path=WORK_QUEUE_PATH, lease_seconds: float = LEASE_SECONDS):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.lease_seconds = lease_seconds
+        self.db = sqlite3.connect(str(self.path), timeout=30, isolation_level=None, check_same_thread=False)
+        self.db.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        # WAL은 같은 호스트의 공유 메모리(-shm)를 쓰므로 네트워크 파일시스템에 두면 안 됨
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.executescript(_SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _transaction(self, fn):
+        """BEGIN IMMEDIATE로 쓰기 잠금을 먼저 잡아 여러 워커가 같은 작업을 임대하지 않도록 합니다."""
+        with self._lock:
+            self.db.execute("BEGIN IMMEDIATE")
+            try:
+                result = fn()
+            except BaseException:
+                self.db.execute("ROLLBACK")
+                raise
+            self.db.execute("COMMIT")
+            return result
+
+    def _query(self, sql: str, params=()) -> list:
+        with self._lock:
+            return self.db.execute(sql, params).fetchall()
+
+    # ── 작업 추가 ──
+    def enqueue(self, run: str, kind: str, key: str, payload: dict, max_attempts: int = MAX_ATTEMPTS) -> bool:
+        """작업을 추가합니다. 같은 (run, key)가 이미 있으면 무시하고 False."""
+        now = _now_iso()
+        cursor = self._transaction(lambda: self.db.execute(
+            "INSERT OR IGNORE INTO jobs (run, key, kind, payload, max_attempts, available_at, created_at, updated_at)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (run, key, kind, json.dumps(payload, ensure_ascii=False), max_attempts, time.time(), now, now),
+        ))
+        return cursor.rowcount > 0
+
+    def clear(self, run: str) -> int:
+        """run의 작업을 모두 지웁니다 (같은 날짜를 처음부터 다시 처리할 때). 지운 작업 수를 반환."""
+        cursor = self._transaction(lambda: self.db.execute("DELETE FROM jobs WHERE run = ?", (run,)))
+        return cursor.rowcount
+
+    # ── 임대 ──
+    def lease(self, run: str = None, owner: str = None, kinds: tuple = None):
+        """처리 가능한 작업 하나를 임대합니다. 없으면 None. run=None이면 모든 run 대상.
+
+        queued 작업과 임대가 만료된 leased 작업이 대상이며, 시도 횟수를 다 쓴 만료 작업은 failed로 바꿉니다.
+        """
+        owner = owner or default_owner()
+
+        def _lease():
+            now = time.time()
+            self.db.execute(
+                "UPDATE jobs SET status = 'failed', error = COALESCE(error, '임대 만료'), lease_owner = NULL, updated_at = ?"
+                " WHERE (? IS NULL OR run = ?) AND status = 'leased' AND lease_expires < ? AND attempts >= max_attempts",
+                (_now_iso(), run, run, now),
+            )
+            kind_filter = ""
+            params = [run, run, now, now]
+            if kinds:
+                kind_filter = f" AND kind IN ({','.join('?' * len(kinds))})"
+                params += list(kinds)
+            row = self.db.execute(
+                "SELECT * FROM jobs WHERE (? IS NULL OR run = ?)"
+                " AND ((status = 'queued' AND available_at <= ?) OR (status = 'leased' AND lease_expires < ?))"
+                f"{kind_filter} ORDER BY available_at, id LIMIT 1",
+                params,
+            ).fetchone()
+            if row is None:
+                return None
+            self.db.execute(
+                "UPDATE jobs SET status = 'leased', lease_owner = ?, lease_expires = ?, attempts = attempts + 1,"
+                " updated_at = ? WHERE id = ?",
+                (owner, now + self.lease_seconds, _now_iso(), row["id"]),
+            )
+            return self.db.execute("SELECT * FROM jobs WHERE id = ?", (row["id"],)).fetchone()
+
+        row = self._transaction(_lease)
+        return Job(row) if row else None
+
+    def heartbeat(self, job: Job, owner: str) -> bool:
+        """임대를 연장합니다. 이미 다른 워커에게 넘어갔으면 False."""
+        cursor = self._transaction(lambda: self.db.execute(
+            "UPDATE jobs SET lease_expires = ?, updated_at = ? WHERE id = ? AND status = 'leased' AND lease_owner = ?",
+            (time.time() + self.lease_seconds, _now_iso(), job.id, owner),
+        ))
+        return cursor.rowcount > 0
+
+    # ── 완료/실패 ──
+    def complete(self, job: Job, owner: str, result=None) -> bool:
+        """작업 완료. 임대가 만료되어 다른 워커가 가져간 경우에도 먼저 끝낸 결과를 저장합니다."""
+        cursor = self._transaction(lambda: self.db.execute(
+            "UPDATE jobs SET status = 'done', result = ?, error = NULL, lease_owner = NULL, updated_at = ?"
+            " WHERE id = ? AND status != 'done'",
+            (json.dumps(result, ensure_ascii=False), _now_iso(), job.id),
+        ))
+        return cursor.rowcount > 0
+
+    def fail(self, job: Job, owner: str, error: str):
+        """작업 실패. 시도 횟수가 남았으면 백오프 후 다시 queued.
+
+        임대가 이미 다른 워커에게 넘어갔으면 그 워커의 처리를 방해하지 않도록 무시합니다.
+        """
+        def _fail():
+            row = self.db.execute(
+                "SELECT attempts, max_attempts, status, lease_owner FROM jobs WHERE id = ?", (job.id,)
+            ).fetchone()
+            if row is None or row["status"] != "leased" or row["lease_owner"] != owner:
+                return
+            final = row["attempts"] >= row["max_attempts"]
+            self.db.execute(
+                "UPDATE jobs SET status = ?, error = ?, lease_owner = NULL, available_at = ?, updated_at = ? WHERE id = ?",
+                ("failed" if final else "queued", error, time.time() + RETRY_BASE * 2 ** (row["attempts"] - 1),
+                 _now_iso(), job.id),
+            )
+        self._transaction(_fail)
+
+    # ── 조회 ──
+    def counts(self, run: str = None) -> dict:
+        counts = {"queued": 0, "leased": 0, "done": 0, "failed": 0}
+        for status, count in self._query(
+            "SELECT status, COUNT(*) FROM jobs WHERE (? IS NULL OR run = ?) GROUP BY status", (run, run)
+        ):
+            counts[status] = count
+        return counts
+
+    def is_drained(self, run: str = None) -> bool:
+        counts = self.counts(run)
+        return counts["queued"] == 0 and counts["leased"] == 0
+
+    def results(self, run: str, kind: str) -> list:
+        """(key, payload, status, result, error) 목록 (추가된 순서)."""
+        rows = self._query(
+            "SELECT key, payload, status, result, error FROM jobs WHERE run = ? AND kind = ? ORDER BY id", (run, kind)
+        )
+        return [
+            {
+                "key": row["key"],
+                "payload": json.loads(row["payload"]),
+                "status": row["status"],
+                "result": json.loads(row["result"]) if row["result"] else None,
+                "error": row["error"],
+            }
+            for row in rows
+        ]
+
+
+class Heartbeat:
+    """with 블록 동안 백그라운드 스레드에서 임대를 주기적으로 연장합니다."""
+
+    def __init__(self, queue: WorkQueue, job: Job, owner: str):
+        self.queue = queue
+        self.job = job
+        self.owner = owner
+        self.lost = False
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._beat, daemon=True)
+
+    def _beat(self):
+        interval = self.queue.lease_seconds / 3
+        while not self._stop.wait(interval):
+            try:
+                if not self.queue.heartbeat(self.job, self.owner):
+                    self.lost = True
+                    logger.warning(f"⚠️ 임대를 잃었습니다: {self.job}")
+                    return
+            except sqlite3.Error as e:
+                logger.warning(f"⚠️ heartbeat 실패 ({self.job}): {e}")
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+
+def run_worker(queue: WorkQueue, run: str, handlers: dict, owner: str = None,
+               poll_interval: float = 1.0, stop_when_drained: bool = True) -> dict:
+    """큐에서 작업을 임대해 handlers[kind](job, queue)로 처리합니다.
+
+    stop_when_drained=True면 해당 run에 대기/임대 중인 작업이 없을 때 종료합니다.
+    다른 워커가 임대 중인 작업이 남아 있으면 만료 시 넘겨받을 수 있도록 계속 대기합니다.
+    """
+    owner = owner or default_owner()
+    stats = {"done": 0, "failed": 0}
+    while True:
+        job = queue.lease(run, owner, kinds=tuple(handlers))
+        if job is None:
+            if stop_when_drained and queue.is_drained(run):
+                break
+            time.sleep(poll_interval)
+            continue
+
+        try:
+            with Heartbeat(queue, job, owner):
+                result = handlers[job.kind](job, queue)
+        except Exception as e:
+            logger.error(f"❌ 작업 실패 {job}: {e}")
+            queue.fail(job, owner, f"{type(e).__name__}: {e}")
+            stats["failed"] += 1
+            continue
+        queue.complete(job, owner, result)
+        stats["done"] += 1
+
+    logger.info(f"🏁 워커 종료 ({owner}): 완료 {stats['done']}건, 실패 {stats['failed']}건")
+    return stats